@@ -0,0 +1,70 @@
+from project import app
+from project.db import get_mongo_db, ensure_mongo_indexes
+from project.services.categorize import category_fields
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
+from project.services.read_model import sync_official_events
+
+# Documents re-read per read-model sync batch
+SYNC_BATCH_SIZE = 500
+
+def backfill_events(recategorize=False):
+    """
+    Adds the derived feed fields to official events loaded before they existed.
+    With recategorize=True every document's category is recomputed (e.g. after
+    the keyword list changes). Updated documents are re-synced into the feed
+    read model and dropped from every process's caches.
+    """
+    print("--- Starting Event Backfill ---")
+
+    with app.app_context():
+        db_mongo = get_mongo_db()
+        if db_mongo is None:
+            print("Could not connect to MongoDB. Aborting.")
+            return
+
+        # 1. Make sure the feed indexes exist
+        print("1. Ensuring indexes...")
+        ensure_mongo_indexes(db_mongo)
+
+        # 2. Fill in missing sort keys
+        print("2. Backfilling title_sort...")
+        updated_count = 0
+        updated_ids = set()
+        for doc in db_mongo.events.find({"title_sort": {"$exists": False}}, {"title": 1}):
+            db_mongo.events.update_one(
+                {"_id": doc["_id"]},
+                {"$set": {"title_sort": (doc.get("title") or "").lower()}}
+            )
+            updated_ids.add(doc["_id"])
+            updated_count += 1
+
+        # 3. Store category + tags computed from the event text
+        print("3. Backfilling category/tags...")
+        query = {} if recategorize else {"category": {"$exists": False}}
+        categorized_count = 0
+        for doc in db_mongo.events.find(query, {"title": 1, "description": 1}):
+            db_mongo.events.update_one(
+                {"_id": doc["_id"]},
+                {"$set": category_fields(doc.get("title"), doc.get("description"))}
+            )
+            updated_ids.add(doc["_id"])
+            categorized_count += 1
+
+        # 4. Push the new values to the feed read model and the caches
+        if updated_ids:
+            print("4. Syncing the feed read model...")
+            updated_ids = list(updated_ids)
+            for start in range(0, len(updated_ids), SYNC_BATCH_SIZE):
+                batch = updated_ids[start:start + SYNC_BATCH_SIZE]
+                sync_official_events(list(db_mongo.events.find({"_id": {"$in": batch}})), db_mongo)
+            invalidate_feed_cache(db_mongo)
+            invalidate_event_details([f"official_{i}" for i in updated_ids], db_mongo)
+
+        print(f"--- Backfill Complete ---")
+        print(f"   > Sort keys added: {updated_count}")
+        print(f"   > Categorized:     {categorized_count}")
+
+if __name__ == "__main__":
+    import sys
+    backfill_events(recategorize="--recategorize" in sys.argv)
@@ -0,0 +1,81 @@
+# benchmarks/categorize.py
+"""
+Micro-benchmark for the official-event classifier.
+
+Compares project.services.categorize.categorize_event against the original
+nested any() implementation on real scraped descriptions, and checks both give
+the same category for every document.
+
+Usage (from the project root):
+    python -m benchmarks.categorize                    # corpus = Mongo 'events' collection
+    python -m benchmarks.categorize --corpus events.json  # JSON list of {title, description}
+"""
+import argparse
+import json
+import time
+
+from project import app
+from project.db import get_mongo_db
+from project.services.categorize import CATEGORY_KEYWORDS, categorize_event
+
+
+def legacy_categorize(text):
+    """The classifier as it was before the keyword table was precompiled."""
+    text_lower = text.lower()
+    categories = {category: list(keywords) for category, keywords in CATEGORY_KEYWORDS.items()}
+    for category, keywords in categories.items():
+        if any(keyword in text_lower for keyword in keywords):
+            return category
+    return "other"
+
+
+def load_corpus(path):
+    if path:
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                events = [json.loads(line) for line in f if line.strip()]
+            else:
+                events = json.load(f)
+    else:
+        with app.app_context():
+            db_mongo = get_mongo_db()
+            if db_mongo is None:
+                raise SystemExit("Could not connect to MongoDB; pass --corpus instead.")
+            events = list(db_mongo.events.find({}, {"_id": 0, "title": 1, "description": 1}))
+    return [(e.get("title") or "") + " " + (e.get("description") or "") for e in events]
+
+
+def time_per_doc(fn, texts, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", help="JSON/JSONL file of events (default: read from MongoDB)")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = load_corpus(args.corpus)
+    if not texts:
+        raise SystemExit("Corpus is empty.")
+
+    mismatches = sum(1 for t in texts if categorize_event(t) != legacy_categorize(t))
+    legacy = time_per_doc(legacy_categorize, texts, args.rounds)
+    current = time_per_doc(categorize_event, texts, args.rounds)
+
+    print(f"Documents:  {len(texts)} (avg {sum(map(len, texts)) // len(texts)} chars)")
+    print(f"Mismatches: {mismatches}")
+    print(f"Legacy:     {legacy * 1e6:8.2f} us/doc  ({1 / legacy:,.0f} docs/s)")
+    print(f"Compiled:   {current * 1e6:8.2f} us/doc  ({1 / current:,.0f} docs/s)")
+    print(f"Speedup:    {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# benchmarks/fixtures.py
+"""
+Fixture pages for the scraper benchmarks, and a local HTTP server to serve them.
+
+The generated pages carry the same markup fetch_data.py selects on (ArtsRepublic
+microdata, Eventfinda h-event cards) padded out with filler so parsing costs are
+realistic. Saved real pages can be served instead with --pages DIR, laid out as
+<DIR>/<url path>.html (e.g. DIR/events.html, DIR/whatson/events/singapore.html).
+"""
+import hashlib
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ARTSREPUBLIC_LIST = "/events"
+EVENTFINDA_LIST = "/whatson/events/singapore"
+LIST_PAGE_SIZE = 50  # events per listing page; later pages are /events?page=N, .../singapore/page/N
+
+WORDS = (
+    "music theatre dance festival exhibition gallery workshop family jazz "
+    "comedy film talk heritage museum concert orchestra community"
+).split()
+
+
+def _filler(rng, paragraphs):
+    """Navigation/footer noise of the kind real pages are mostly made of."""
+    blocks = []
+    for i in range(paragraphs):
+        words = " ".join(rng.choice(WORDS) for _ in range(40))
+        blocks.append(f'<div class="nav-item-{i}"><ul><li><a href="/x/{i}">{words}</a></li></ul></div>')
+    return "\n".join(blocks)
+
+
+def _synopsis(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _page_range(count, page):
+    return range((page - 1) * LIST_PAGE_SIZE, min(page * LIST_PAGE_SIZE, count))
+
+
+def artsrepublic_list(count, page=1):
+    links = "\n".join(
+        f'<li><a class="event_thumbnail" href="/events/ar-{i}">Event {i}</a></li>'
+        for i in _page_range(count, page)
+    )
+    return f"<html><body><ul>{links}</ul></body></html>"
+
+
+def artsrepublic_detail(i, filler=60):
+    rng = random.Random(i)
+    return f"""<html><head>
+<meta itemprop="startDate" content="2026-{1 + i % 12:02d}-{1 + i % 28:02d}T19:30:00+08:00">
+<meta itemprop="endDate" content="2026-{1 + i % 12:02d}-{1 + i % 28:02d}T22:00:00+08:00">
+<meta itemprop="image" content="https://img.example/ar-{i}.jpg">
+</head><body>
+{_filler(rng, filler)}
+<h1 itemprop="name">  ArtsRepublic {rng.choice(WORDS).title()} Night {i}  </h1>
+<div itemprop="location"><span itemprop="name">Venue {i % 17}, {i} Example Road, Singapore</span></div>
+<div class="synopsis"><p>Synopsis: {_synopsis(rng, 80)}</p><p>{_synopsis(rng, 30)}</p></div>
+<div class="data"><a target="_blank" href="https://tickets.example/ar-{i}">Website</a></div>
+{_filler(rng, filler)}
+</body></html>"""
+
+
+def eventfinda_list(count, page=1):
+    cards = "\n".join(
+        f'<div class="card h-event"><h2 class="card-title"><a href="/2026/event-{i}/singapore">E{i}</a></h2></div>'
+        for i in _page_range(count, page)
+    )
+    return f"<html><body>{cards}</body></html>"
+
+
+def eventfinda_detail(i, filler=60):
+    rng = random.Random(10_000 + i)
+    return f"""<html><body>
+{_filler(rng, filler)}
+<h1 class="p-name">Eventfinda {rng.choice(WORDS).title()} {i}</h1>
+<img class="photo" src="https://img.example/ef-{i}.jpg">
+<p class="venue"><a class="venue-name">Hall {i % 11}</a></p>
+<span class="adr">{i} Sample Street, Singapore</span>
+<span class="dtstart"><span class="value-title" title="2026-{1 + i % 12:02d}-{1 + i % 28:02d}T10:00:00"></span></span>
+<span class="dtend"><span class="value-title" title="2026-{1 + i % 12:02d}-{1 + i % 28:02d}T18:00:00"></span></span>
+<div class="module description"><p>{_synopsis(rng, 90)}</p></div>
+<ul><li class="list-item-icon"><a class="external-link" href="https://tickets.example/ef-{i}">Tickets</a></li></ul>
+{_filler(rng, filler)}
+</body></html>"""
+
+
+def fixture_page(path, count):
+    """Body for a request path, or None for a 404 (including listing pages past the last one)."""
+    list_page, page = path, 1
+    if path.startswith(ARTSREPUBLIC_LIST + "?page="):
+        list_page, page = ARTSREPUBLIC_LIST, int(path.split("=", 1)[1])
+    elif path.startswith(EVENTFINDA_LIST + "/page/"):
+        list_page, page = EVENTFINDA_LIST, int(path.rsplit("/", 1)[1])
+    if list_page in (ARTSREPUBLIC_LIST, EVENTFINDA_LIST):
+        if page > 1 and (page - 1) * LIST_PAGE_SIZE >= count:
+            return None
+        build = artsrepublic_list if list_page == ARTSREPUBLIC_LIST else eventfinda_list
+        return build(count, page)
+    if path.startswith("/events/ar-"):
+        return artsrepublic_detail(int(path.rsplit("-", 1)[1]))
+    if path.startswith("/2026/event-"):
+        return eventfinda_detail(int(path.split("/")[2].split("-")[1]))
+    return None
+
+
+def detail_pages(count):
+    """[(url path, html)] for every generated detail page of both sites."""
+    pages = [(f"/events/ar-{i}", artsrepublic_detail(i)) for i in range(count)]
+    pages += [(f"/2026/event-{i}/singapore", eventfinda_detail(i)) for i in range(count)]
+    return pages
+
+
+class FixtureServer:
+    """
+    Serves fixture pages on 127.0.0.1 with a fixed per-response latency (to stand
+    in for a remote site) and ETags (If-None-Match gets a 304). Every
+    fail_every-th request answers 503 once.
+    """
+
+    def __init__(self, count=100, latency_ms=50, pages_dir=None, fail_every=0):
+        server = self
+        self.count = count
+        self.latency_s = latency_ms / 1000
+        self.pages_dir = pages_dir
+        self.fail_every = fail_every
+        self.requests = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._failed = set()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def _body(self, path):
+        if self.pages_dir:
+            file_path = os.path.join(self.pages_dir, path.strip("/") + ".html")
+            if os.path.isfile(file_path):
+                with open(file_path, encoding="utf-8") as f:
+                    return f.read()
+            return None
+        return fixture_page(path, self.count)
+
+    def _handle(self, handler):
+        with self._lock:
+            self.requests += 1
+            fail = (
+                self.fail_every and self.requests % self.fail_every == 0
+                and handler.path not in self._failed
+            )
+            if fail:
+                self._failed.add(handler.path)
+        time.sleep(self.latency_s)
+        body = None if fail else self._body(handler.path)
+        status = 503 if fail else (200 if body is not None else 404)
+        payload = (body or "").encode("utf-8")
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        if status == 200 and handler.headers.get("If-None-Match") == etag:
+            status, payload = 304, b""
+            with self._lock:
+                self.not_modified += 1
+        handler.send_response(status)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        if status in (200, 304):
+            handler.send_header("ETag", etag)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
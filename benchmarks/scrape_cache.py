@@ -0,0 +1,68 @@
+# benchmarks/scrape_cache.py
+"""
+Benchmark for the scrapers' on-disk HTTP cache.
+
+Runs the scrapers from fetch_data.py against the local fixture server
+(benchmarks/fixtures.py) four times with one scrape cache directory:
+
+  cold        empty cache: every page downloaded and parsed
+  revalidate  conditional requests answered 304; pages parsed again from disk
+  skip        after mark_loaded(): unchanged detail pages are not parsed at all
+  replay      fixture server stopped; every page served from the cache
+
+and checks cold, revalidate and replay return the same events.
+
+Usage (from the project root):
+    python -m benchmarks.scrape_cache
+    python -m benchmarks.scrape_cache --events 300 --latency-ms 80
+"""
+import argparse
+import tempfile
+import time
+
+import fetch_data
+from project.services.http_fetch import PageFetcher
+from benchmarks.fixtures import FixtureServer
+
+
+def run(url, cache_dir, **options):
+    fetch_data.ARTSREPUBLIC_BASE_URL = url
+    fetch_data.EVENTFINDA_BASE_URL = url
+    fetcher = PageFetcher(cache_dir=cache_dir, backoff_s=0.05, **options)
+    start = time.perf_counter()
+    events = fetch_data.scrape_artsrepublic_sg(fetcher) + fetch_data.scrape_eventfinda_sg(fetcher)
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+    return events, elapsed, fetcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100, help="detail pages per site")
+    parser.add_argument("--latency-ms", type=int, default=50)
+    parser.add_argument("--pages", help="directory of saved pages to serve instead of generated ones")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with FixtureServer(args.events, args.latency_ms, args.pages) as server:
+            url = server.url
+            cold, cold_s, fetcher = run(url, cache_dir)
+            rows.append(("cold", cold, cold_s, fetcher))
+            revalidated, revalidate_s, fetcher = run(url, cache_dir)
+            rows.append(("revalidate", revalidated, revalidate_s, fetcher))
+            fetcher.mark_loaded([e["source"] for e in revalidated])
+            skipped, skip_s, fetcher = run(url, cache_dir)
+            rows.append(("skip", skipped, skip_s, fetcher))
+        replayed, replay_s, fetcher = run(url, cache_dir, replay=True)
+        rows.append(("replay", replayed, replay_s, fetcher))
+
+    print(f"Identical events (cold / revalidate / replay): {cold == revalidated == replayed}")
+    for name, events, elapsed, fetcher in rows:
+        c = fetcher.counters
+        print(f"{name:<11} {elapsed:7.2f} s  events={len(events):<4} requests={c['requests']:<4} "
+              f"304={c['not_modified']:<4} unchanged={c['unchanged']:<4} replayed={c['replayed']}")
+
+
+if __name__ == "__main__":
+    main()
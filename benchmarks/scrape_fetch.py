@@ -0,0 +1,63 @@
+# benchmarks/scrape_fetch.py
+"""
+Benchmark for the scrapers' detail-page fetch stage.
+
+Runs scrape_artsrepublic_sg / scrape_eventfinda_sg from fetch_data.py against a
+local fixture server (see benchmarks/fixtures.py) that adds a fixed latency to
+every response, once with a single worker and once with the configured
+concurrency, and checks both runs return the same event dicts.
+
+Usage (from the project root):
+    python -m benchmarks.scrape_fetch                        # 100 events per site, 50 ms latency
+    python -m benchmarks.scrape_fetch --events 300 --latency-ms 120 --fail-every 25
+    python -m benchmarks.scrape_fetch --pages saved_pages/   # serve saved pages instead
+"""
+import argparse
+import time
+
+import fetch_data
+from project.services.http_fetch import PageFetcher
+from benchmarks.fixtures import FixtureServer
+
+
+def run_scrapers(server, fetcher):
+    fetch_data.ARTSREPUBLIC_BASE_URL = server.url
+    fetch_data.EVENTFINDA_BASE_URL = server.url
+    start = time.perf_counter()
+    events = fetch_data.scrape_artsrepublic_sg(fetcher) + fetch_data.scrape_eventfinda_sg(fetcher)
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+    return events, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100, help="detail pages per site")
+    parser.add_argument("--latency-ms", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--per-host", type=int, default=8)
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth request with a 503 once")
+    parser.add_argument("--pages", help="directory of saved pages to serve instead of generated ones")
+    args = parser.parse_args()
+
+    with FixtureServer(args.events, args.latency_ms, args.pages, args.fail_every) as server:
+        serial, serial_s = run_scrapers(
+            server, PageFetcher(workers=1, per_host=1, backoff_s=0.05, cache_dir="")
+        )
+        requests_serial = server.requests
+        concurrent_fetcher = PageFetcher(
+            workers=args.workers, per_host=args.per_host, backoff_s=0.05, cache_dir=""
+        )
+        concurrent, concurrent_s = run_scrapers(server, concurrent_fetcher)
+
+    strip = lambda events: [{k: v for k, v in e.items() if k != "source"} for e in events]
+    print(f"Events:     {len(concurrent)} ({len(serial)} serial), identical: {strip(serial) == strip(concurrent)}")
+    print(f"Requests:   {requests_serial} serial, {server.requests - requests_serial} concurrent "
+          f"(retries: {concurrent_fetcher.counters['retries']})")
+    print(f"Serial:     {serial_s:8.2f} s")
+    print(f"Concurrent: {concurrent_s:8.2f} s  (workers={args.workers}, per_host={args.per_host})")
+    print(f"Speedup:    {serial_s / concurrent_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# benchmarks/scrape_parse.py
+"""
+Benchmark for the scrapers' detail-page parsers.
+
+Times project.services.scrape_parse (lxml when installed, SoupStrainer over
+the selected regions, one select per field) against the parsers fetch_data.py
+used before (html.parser on the full page, each selector run twice). The
+legacy parsers below are also what tests/test_scrape_parse.py checks parity
+against.
+
+Usage (from the project root):
+    python -m benchmarks.scrape_parse                       # 200 generated pages per site
+    python -m benchmarks.scrape_parse --events 500 --repeat 5
+    python -m benchmarks.scrape_parse --pages saved_pages/  # saved pages, laid out as for fixtures.py
+"""
+import argparse
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+from project.services import scrape_parse
+from benchmarks.fixtures import detail_pages
+
+
+def legacy_parse_artsrepublic(html, fullUrl):
+    """parse_artsrepublic_detail_page as it was before the parsing backend."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.select_one('h1[itemprop="name"]').text.strip() if soup.select_one('h1[itemprop="name"]') else "Title not found"
+    start_date = soup.select_one('meta[itemprop="startDate"]')['content'] if soup.select_one('meta[itemprop="startDate"]') else None
+    end_date = soup.select_one('meta[itemprop="endDate"]')['content'] if soup.select_one('meta[itemprop="endDate"]') else None
+    image_url = soup.select_one('meta[itemprop="image"]')['content'] if soup.select_one('meta[itemprop="image"]') else None
+
+    location_div = soup.select_one('div[itemprop="location"]')
+    venue, address = "Venue not found", ""
+    if location_div and location_div.select_one('span[itemprop="name"]'):
+        full_location_string = location_div.select_one('span[itemprop="name"]').text.strip()
+        if ',' in full_location_string:
+            parts = full_location_string.split(',', 1)
+            venue, address = parts[0].strip(), parts[1].strip()
+        else:
+            venue, address = full_location_string, full_location_string
+
+    synopsis_div = soup.select_one('div.synopsis')
+    short_description = ""
+    if synopsis_div:
+        full_synopsis = ' '.join(p.text.replace("Synopsis:", "").strip() for p in synopsis_div.find_all('p'))
+        words = full_synopsis.split()
+        short_description = ' '.join(words[:50]) + '...' if len(words) > 50 else ' '.join(words)
+
+    website_link_tag = soup.select_one('div.data a[target="_blank"]')
+    registration_link = website_link_tag['href'] if website_link_tag else None
+
+    return {
+        "title": title, "description": short_description, "start_date": start_date,
+        "end_date": end_date, "venue_name": venue, "address": address,
+        "image_url": image_url, "registration_link": registration_link, "source": fullUrl
+    }
+
+
+def legacy_parse_eventfinda(html, full_url):
+    """parse_eventfinda_detail_page as it was before the parsing backend."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.select_one("h1.p-name").text.strip() if soup.select_one("h1.p-name") else "Title not found"
+    image_url = soup.select_one("img.photo")['src'] if soup.select_one("img.photo") else None
+    venue = soup.select_one("p.venue a.venue-name").text.strip() if soup.select_one("p.venue a.venue-name") else "Venue not found"
+    address = soup.select_one("span.adr").text.strip() if soup.select_one("span.adr") else venue
+
+    start_date = soup.select_one("span.dtstart span.value-title")['title'].split('T')[0] if soup.select_one("span.dtstart span.value-title") else None
+    end_date = soup.select_one("span.dtend span.value-title")['title'].split('T')[0] if start_date and soup.select_one("span.dtend span.value-title") else start_date
+
+    description_div = soup.select_one("div.module.description")
+    short_description = ""
+    if description_div:
+        full_description = description_div.get_text(separator=' ', strip=True)
+        words = full_description.split()
+        short_description = ' '.join(words[:50]) + '...' if len(words) > 50 else full_description
+
+    registration_link = soup.select_one("li.list-item-icon a.external-link")['href'] if soup.select_one("li.list-item-icon a.external-link") else full_url
+
+    return {
+        "title": title, "description": short_description, "start_date": start_date,
+        "end_date": end_date, "venue_name": venue, "address": address,
+        "image_url": image_url, "registration_link": registration_link, "source": full_url
+    }
+
+
+def is_artsrepublic(path):
+    return path.lstrip("/").startswith("events/")
+
+
+def load_saved_pages(directory):
+    """[(url path, html)] for every saved detail page under directory (list pages are skipped)."""
+    pages = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if not name.endswith(".html"):
+                continue
+            path = "/" + os.path.relpath(os.path.join(root, name), directory)[:-len(".html")]
+            if path in ("/events", "/whatson/events/singapore"):
+                continue
+            with open(os.path.join(root, name), encoding="utf-8") as f:
+                pages.append((path.replace(os.sep, "/"), f.read()))
+    return pages
+
+
+def parse_all(pages, parse_artsrepublic, parse_eventfinda, repeat):
+    """Seconds per pass over pages."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path, html in pages:
+            (parse_artsrepublic if is_artsrepublic(path) else parse_eventfinda)(html, path)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=200, help="generated detail pages per site")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--pages", help="directory of saved pages to parse instead of generated ones")
+    args = parser.parse_args()
+
+    pages = load_saved_pages(args.pages) if args.pages else detail_pages(args.events)
+    print(f"Pages: {len(pages)}, available backend: {scrape_parse.HTML_PARSER}")
+
+    legacy_s = parse_all(pages, legacy_parse_artsrepublic, legacy_parse_eventfinda, args.repeat)
+    print(f"{'legacy (html.parser, full page)':34} {legacy_s:8.3f} s")
+
+    backends = ["html.parser"] + (["lxml"] if scrape_parse.HTML_PARSER == "lxml" else [])
+    default_backend = scrape_parse.HTML_PARSER
+    for backend in backends:
+        scrape_parse.HTML_PARSER = backend
+        parsed_s = parse_all(
+            pages, scrape_parse.parse_artsrepublic_detail_page,
+            scrape_parse.parse_eventfinda_detail_page, args.repeat,
+        )
+        print(f"{backend + ' + strainer':34} {parsed_s:8.3f} s  speedup {legacy_s / parsed_s:5.2f}x")
+    scrape_parse.HTML_PARSER = default_backend
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/scrape_parse_pool.py
+"""
+Scaling benchmark for the scrapers' parse stage.
+
+Parses fixture detail pages (see benchmarks/fixtures.py) through
+project.services.scrape_parse.ParsePool with an increasing number of worker
+processes, and checks every run returns the same events as in-process parsing.
+Process start-up is timed separately from the parse itself.
+
+Usage (from the project root):
+    python -m benchmarks.scrape_parse_pool                    # 1, 2, 4, ... up to one per CPU
+    python -m benchmarks.scrape_parse_pool --workers 1 2 8 --chunk 4 --events 500
+    python -m benchmarks.scrape_parse_pool --pages saved_pages/
+"""
+import argparse
+import os
+import time
+
+from project.services.scrape_parse import (
+    ParsePool, parse_artsrepublic_detail_page, parse_eventfinda_detail_page,
+)
+from benchmarks.fixtures import detail_pages
+from benchmarks.scrape_parse import is_artsrepublic, load_saved_pages
+
+
+def run(pages, workers, chunk):
+    """(events, start-up seconds, parse seconds) for one pool size."""
+    by_site = (
+        (parse_artsrepublic_detail_page, [(p, html.encode("utf-8")) for p, html in pages if is_artsrepublic(p)]),
+        (parse_eventfinda_detail_page, [(p, html.encode("utf-8")) for p, html in pages if not is_artsrepublic(p)]),
+    )
+    with ParsePool(workers=workers, chunksize=chunk) as pool:
+        start = time.perf_counter()
+        # Spin the worker processes up before timing the parse
+        pool.parse(by_site[0][0], by_site[0][1][:workers * chunk + 1])
+        startup_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        events = []
+        for parse_page, site_pages in by_site:
+            events += pool.parse(parse_page, site_pages)
+        return events, startup_s, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=300, help="generated detail pages per site")
+    parser.add_argument("--workers", type=int, nargs="+", help="pool sizes to try")
+    parser.add_argument("--chunk", type=int, default=8, help="pages per worker task")
+    parser.add_argument("--pages", help="directory of saved pages to parse instead of generated ones")
+    args = parser.parse_args()
+
+    pages = load_saved_pages(args.pages) if args.pages else detail_pages(args.events)
+    cpus = os.cpu_count() or 1
+    sizes = args.workers or sorted({1, cpus} | {2 ** i for i in range(1, 8) if 2 ** i < cpus})
+    print(f"Pages: {len(pages)}, CPUs: {cpus}, chunk: {args.chunk}")
+
+    baseline, baseline_s = None, None
+    for workers in sizes:
+        events, startup_s, parse_s = run(pages, workers, args.chunk)
+        if baseline is None:
+            baseline, baseline_s = events, parse_s
+        print(f"workers={workers:<3} start-up {startup_s:6.2f} s  parse {parse_s:7.2f} s  "
+              f"{len(pages) / parse_s:7.0f} pages/s  speedup {baseline_s / parse_s:5.2f}x  "
+              f"identical: {events == baseline}")
+
+
+if __name__ == "__main__":
+    main()
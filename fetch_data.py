@@ -1,14 +1,36 @@
 import os
 import requests
-from bs4 import BeautifulSoup
+from contextlib import nullcontext
 from dotenv import load_dotenv
 from project import app
-from project.db import get_mongo_client
-from project.models import db, EventCache
+from project.db import get_mongo_client, close_mongo_clients, ensure_mongo_indexes, MONGO_DB_NAME
+from project.models import db
+from project.services.event_cache import upsert_event_cache
+from project.services.categorize import category_fields
+from project.services.read_model import sync_official_events
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
+from project.services.http_fetch import PageFetcher
+from project.services.sync_checkpoint import SyncCheckpoint
+from project.services.scrape_parse import (
+    parse_artsrepublic_list, parse_artsrepublic_detail_page,
+    parse_eventfinda_list, parse_eventfinda_detail_page, ParsePool, ParseError,
+)
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 # Load environment variables
 load_dotenv()
 
+# Events per MongoDB bulk_write
+MONGO_BATCH_SIZE = int(os.getenv("MONGO_BATCH_SIZE", 500))
+# Rows per INSERT ... ON DUPLICATE KEY UPDATE into 'event_cache' (one commit each)
+CACHE_BATCH_SIZE = int(os.getenv("CACHE_BATCH_SIZE", 200))
+# Detail pages per load batch; the sync checkpoints after each one
+SYNC_BATCH_SIZE = int(os.getenv("SYNC_BATCH_SIZE", 100))
+# Listing pages crawled per site
+SCRAPE_LIST_PAGES = int(os.getenv("SCRAPE_LIST_PAGES", 10))
+
 # --- STATISTICS FUNCTIONS (KEPT ORIGINAL) ---
 
 def fetch_gov_statistics():
@@ -74,8 +96,8 @@ def transform_and_load_statistics(client, stats_data):
         print("No statistics data found to load.")
         return
 
-    upserted_count = 0
-    modified_count = 0
+    # One unordered bulk write for every year
+    operations = []
     for year, data in stats_by_year.items():
         statistics_document = {
             "year": year,
@@ -83,154 +105,136 @@ def transform_and_load_statistics(client, stats_data):
             "employment_items": data["employment_items"],
             "activities": data["activities"]
         }
-        
-        result = statistics_collection.update_one(
-            {'year': year},
-            {'$set': statistics_document},
-            upsert=True
+        operations.append(UpdateOne({'year': year}, {'$set': statistics_document}, upsert=True))
+
+    try:
+        result = statistics_collection.bulk_write(operations, ordered=False)
+        upserted_count, matched_count, modified_count = (
+            result.upserted_count, result.matched_count, result.modified_count
+        )
+    except BulkWriteError as e:
+        print(f"Statistics bulk write errors: {e.details.get('writeErrors')}")
+        upserted_count, matched_count, modified_count = (
+            e.details.get("nUpserted", 0), e.details.get("nMatched", 0), e.details.get("nModified", 0)
         )
-        if result.upserted_id:
-            upserted_count += 1
-        elif result.modified_count > 0:
-            modified_count += 1
 
-    print(f"Statistics Load Complete. Inserted: {upserted_count} years. Updated: {modified_count} years.")
+    print(f"Statistics Load Complete. Inserted: {upserted_count} years. Updated: {modified_count} years. "
+          f"Unchanged: {matched_count - modified_count} years.")
 
 
-# --- SCRAPING FUNCTIONS (KEPT ORIGINAL) ---
+# --- SCRAPING FUNCTIONS ---
+# Listing pages are crawled first, then every detail page through one PageFetcher
+# (pooled keep-alive connections, per-host concurrency limit, retries, run deadline)
+# and parsed on one ParsePool; see the streaming pipeline below.
 
-def scrape_artsrepublic_sg():
-    """Scrapes event data from ArtsRepublic.sg."""
-    list_page_url = "https://artsrepublic.sg/events"
-    scraped_events = []
+ARTSREPUBLIC_BASE_URL = "https://artsrepublic.sg"
+EVENTFINDA_BASE_URL = "https://www.eventfinda.sg"
 
-    print("\nScraping artsrepublic.sg...")
-    try:
-        response = requests.get(list_page_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        event_links = soup.select('li a.event_thumbnail')
-        
-        if not event_links:
-            print("No event links found on artsrepublic.sg.")
-            return []
-            
-        print(f"Found {len(event_links)} event links. Scraping detail pages...")
-        for link_tag in event_links:
-            detail_url = link_tag.get('href')
-            if detail_url:
-                event_data = scrape_artsrepublic_detail_page(detail_url)
-                if event_data:
-                    scraped_events.append(event_data)
-    except requests.exceptions.RequestException as e:
-        print(f"Error scraping artsrepublic.sg list page: {e}")
-    return scraped_events
 
-def scrape_artsrepublic_detail_page(url):
+def crawl_listing(fetcher, site, page_url, parse_list, detail_url, timeout_s=None):
+    """
+    List stage over a paginated listing: reads up to SCRAPE_LIST_PAGES pages,
+    SCRAPE_PER_HOST at a time, and returns (detail page URLs in listing order
+    with duplicates dropped, listing page URLs read). Stops at the first page
+    that is missing, adds no new events, or is unchanged since the last sync
+    with every event on it already loaded.
+    """
+    detail_urls = {}
+    list_pages = []
+    print(f"\nScraping {site}...")
+    for first in range(1, SCRAPE_LIST_PAGES + 1, fetcher.per_host):
+        window = [page_url(n) for n in range(first, min(first + fetcher.per_host, SCRAPE_LIST_PAGES + 1))]
+        responses = fetcher.fetch_all(window, timeout_s)
+        for url in window:
+            response = responses[url]
+            if isinstance(response, Exception):
+                if not list_pages:
+                    raise response
+                past_end = getattr(getattr(response, "response", None), "status_code", None) == 404
+                if not past_end:
+                    print(f"Stopping {site} listing at {url}: {response}")
+                return list(detail_urls), list_pages
+            response.encoding = 'utf-8'
+            links = [detail_url(href) for href in parse_list(response.text)]
+            list_pages.append(url)
+            new_links = [link for link in links if link not in detail_urls]
+            detail_urls.update(dict.fromkeys(new_links))
+            if not new_links:
+                return list(detail_urls), list_pages
+            if response.unchanged and all(fetcher.is_loaded(link) for link in links):
+                print(f"Stopping {site} listing at {url}: unchanged since the last sync.")
+                return list(detail_urls), list_pages
+    return list(detail_urls), list_pages
+
+
+def _artsrepublic_list_page(n):
+    return f"{ARTSREPUBLIC_BASE_URL}/events" + (f"?page={n}" if n > 1 else "")
+
+
+def _eventfinda_list_page(n):
+    return f"{EVENTFINDA_BASE_URL}/whatson/events/singapore" + (f"/page/{n}" if n > 1 else "")
+
+
+def artsrepublic_detail_urls(fetcher):
+    """List stage for ArtsRepublic: (detail page URLs, listing page URLs)."""
+    detail_urls, list_pages = crawl_listing(
+        fetcher, "artsrepublic.sg", _artsrepublic_list_page, parse_artsrepublic_list,
+        lambda href: f"{ARTSREPUBLIC_BASE_URL}/{href.lstrip('/')}",
+    )
+    _report_listing("artsrepublic.sg", detail_urls, list_pages)
+    return detail_urls, list_pages
+
+
+def eventfinda_detail_urls(fetcher):
+    """List stage for Eventfinda: (detail page URLs, listing page URLs)."""
+    detail_urls, list_pages = crawl_listing(
+        fetcher, "eventfinda.sg", _eventfinda_list_page, parse_eventfinda_list,
+        lambda href: EVENTFINDA_BASE_URL + href, timeout_s=15,
+    )
+    _report_listing("eventfinda.sg", detail_urls, list_pages)
+    return detail_urls, list_pages
+
+
+def _report_listing(site, detail_urls, list_pages):
+    if not detail_urls:
+        print(f"No event links found on {site}.")
+    else:
+        print(f"Found {len(detail_urls)} event links on {len(list_pages)} list pages. Scraping detail pages...")
+
+
+def _fetcher_or_own(fetcher):
+    """The caller's fetcher as-is, or a new one that is closed when the block exits."""
+    return nullcontext(fetcher) if fetcher is not None else PageFetcher()
+
+
+def scrape_artsrepublic_sg(fetcher=None, parser=None):
+    """Scrapes event data from ArtsRepublic.sg."""
+    return _scrape_site("artsrepublic.sg", fetcher, parser)
+
+def scrape_artsrepublic_detail_page(url, fetcher=None):
     """Scrapes details from ArtsRepublic."""
     try:
-        base_url = "https://artsrepublic.sg"
-        fullUrl = f"{base_url}/{url.lstrip('/')}"
-        
-        response = requests.get(fullUrl, timeout=10)
+        fullUrl = f"{ARTSREPUBLIC_BASE_URL}/{url.lstrip('/')}"
+        with _fetcher_or_own(fetcher) as page_fetcher:
+            response = page_fetcher.fetch(fullUrl)
         response.encoding = 'utf-8'
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        title = soup.select_one('h1[itemprop="name"]').text.strip() if soup.select_one('h1[itemprop="name"]') else "Title not found"
-        start_date = soup.select_one('meta[itemprop="startDate"]')['content'] if soup.select_one('meta[itemprop="startDate"]') else None
-        end_date = soup.select_one('meta[itemprop="endDate"]')['content'] if soup.select_one('meta[itemprop="endDate"]') else None
-        image_url = soup.select_one('meta[itemprop="image"]')['content'] if soup.select_one('meta[itemprop="image"]') else None
-        
-        location_div = soup.select_one('div[itemprop="location"]')
-        venue, address = "Venue not found", ""
-        if location_div and location_div.select_one('span[itemprop="name"]'):
-            full_location_string = location_div.select_one('span[itemprop="name"]').text.strip()
-            if ',' in full_location_string:
-                parts = full_location_string.split(',', 1)
-                venue, address = parts[0].strip(), parts[1].strip()
-            else:
-                venue, address = full_location_string, full_location_string
-
-        synopsis_div = soup.select_one('div.synopsis')
-        short_description = ""
-        if synopsis_div:
-            full_synopsis = ' '.join(p.text.replace("Synopsis:", "").strip() for p in synopsis_div.find_all('p'))
-            words = full_synopsis.split()
-            short_description = ' '.join(words[:50]) + '...' if len(words) > 50 else ' '.join(words)
-        
-        website_link_tag = soup.select_one('div.data a[target="_blank"]')
-        registration_link = website_link_tag['href'] if website_link_tag else None
-        
-        return {
-            "title": title, "description": short_description, "start_date": start_date,
-            "end_date": end_date, "venue_name": venue, "address": address,
-            "image_url": image_url, "registration_link": registration_link, "source": fullUrl
-        }
+        return parse_artsrepublic_detail_page(response.text, fullUrl)
     except requests.exceptions.RequestException as e:
         print(f"Error scraping detail page {url}: {e}")
         return None
 
-def scrape_eventfinda_sg():
+def scrape_eventfinda_sg(fetcher=None, parser=None):
     """Scrapes event data from Eventfinda.sg."""
-    list_page_url = "https://www.eventfinda.sg/whatson/events/singapore"
-    scraped_events = []
-
-    print("\nScraping eventfinda.sg...")
-    try:
-        response = requests.get(list_page_url, timeout=15)
-        response.encoding = 'utf-8'
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        event_cards = soup.select('div.card.h-event')
-        
-        if not event_cards:
-            print("No event links found on eventfinda.sg.")
-            return []
-            
-        print(f"Found {len(event_cards)} event links. Scraping detail pages...")
-        for card in event_cards:
-            link_tag = card.select_one('h2.card-title a')
-            if link_tag and link_tag.has_attr('href'):
-                detail_url = link_tag['href']
-                event_data = scrape_eventfinda_detail_page(detail_url)
-                if event_data:
-                    scraped_events.append(event_data)
-    except requests.exceptions.RequestException as e:
-        print(f"Error scraping eventfinda.sg list page: {e}")
-    return scraped_events
+    return _scrape_site("eventfinda.sg", fetcher, parser)
 
-def scrape_eventfinda_detail_page(url):
+def scrape_eventfinda_detail_page(url, fetcher=None):
     """Scrapes details from Eventfinda."""
     try:
-        full_url = "https://www.eventfinda.sg" + url
-        response = requests.get(full_url, timeout=10)
+        full_url = EVENTFINDA_BASE_URL + url
+        with _fetcher_or_own(fetcher) as page_fetcher:
+            response = page_fetcher.fetch(full_url)
         response.encoding = 'utf-8'
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        title = soup.select_one("h1.p-name").text.strip() if soup.select_one("h1.p-name") else "Title not found"
-        image_url = soup.select_one("img.photo")['src'] if soup.select_one("img.photo") else None
-        venue = soup.select_one("p.venue a.venue-name").text.strip() if soup.select_one("p.venue a.venue-name") else "Venue not found"
-        address = soup.select_one("span.adr").text.strip() if soup.select_one("span.adr") else venue
-
-        start_date = soup.select_one("span.dtstart span.value-title")['title'].split('T')[0] if soup.select_one("span.dtstart span.value-title") else None
-        end_date = soup.select_one("span.dtend span.value-title")['title'].split('T')[0] if start_date and soup.select_one("span.dtend span.value-title") else start_date
-
-        description_div = soup.select_one("div.module.description")
-        short_description = ""
-        if description_div:
-            full_description = description_div.get_text(separator=' ', strip=True)
-            words = full_description.split()
-            short_description = ' '.join(words[:50]) + '...' if len(words) > 50 else full_description
-        
-        registration_link = soup.select_one("li.list-item-icon a.external-link")['href'] if soup.select_one("li.list-item-icon a.external-link") else full_url
-
-        return {
-            "title": title, "description": short_description, "start_date": start_date,
-            "end_date": end_date, "venue_name": venue, "address": address,
-            "image_url": image_url, "registration_link": registration_link, "source": full_url
-        }
+        return parse_eventfinda_detail_page(response.text, full_url)
     except Exception as e:
         print(f"Error scraping detail page {url}: {e}")
         return None
@@ -238,119 +242,340 @@ def scrape_eventfinda_detail_page(url):
 
 # --- UPDATED LOAD FUNCTION (SYNC MONGODB + MYSQL CACHE) ---
 
+def _mongo_event(event):
+    """The 'events' document for a scraped event dict."""
+    return {
+        "title": event.get("title"),
+        "title_sort": event.get("title").lower(),  # Keyset sort key for the feed
+        "description": event.get("description", ""),
+        "start_date": event.get("start_date"),
+        "end_date": event.get("end_date"),
+        "venue_name": event.get("venue_name"),
+        "address": event.get("address", ""),
+        "image_url": event.get("image_url"),
+        "registration_link": event.get("registration_link"),
+        "source": event.get("source"),
+        # Derived once here so the feed never re-categorizes on read
+        **category_fields(event.get("title"), event.get("description", "")),
+    }
+
+
+def upsert_event_batch(events_collection, mongo_events):
+    """
+    Upserts one batch of 'events' documents (keyed by source URL) with a single
+    unordered bulk_write. Returns ({source: _id}, counts) where counts has
+    inserted / modified / unchanged / failed.
+    """
+    counts = {"inserted": 0, "modified": 0, "unchanged": 0, "failed": 0}
+    operations = [
+        UpdateOne({'source': doc['source']}, {'$set': doc}, upsert=True) for doc in mongo_events
+    ]
+    try:
+        result = events_collection.bulk_write(operations, ordered=False)
+        details = {
+            "nUpserted": result.upserted_count,
+            "nMatched": result.matched_count,
+            "nModified": result.modified_count,
+            "upserted": [{"index": i, "_id": _id} for i, _id in result.upserted_ids.items()],
+            "writeErrors": [],
+        }
+    except BulkWriteError as e:
+        # Unordered: every other operation in the batch was still applied
+        details = e.details
+        for error in details.get("writeErrors", []):
+            print(f"MongoDB upsert error for {mongo_events[error['index']]['source']}: {error.get('errmsg')}")
+
+    counts["inserted"] = details.get("nUpserted", 0)
+    counts["modified"] = details.get("nModified", 0)
+    counts["unchanged"] = details.get("nMatched", 0) - counts["modified"]
+    failed = {error["index"] for error in details.get("writeErrors", [])}
+    counts["failed"] = len(failed)
+
+    ids = {mongo_events[u["index"]]['source']: u["_id"] for u in details.get("upserted", [])}
+    # Documents that already existed: one $in on source for the whole batch
+    existing = [
+        doc['source'] for i, doc in enumerate(mongo_events)
+        if i not in failed and doc['source'] not in ids
+    ]
+    if existing:
+        for doc in events_collection.find({'source': {'$in': existing}}, {'source': 1}):
+            ids[doc['source']] = doc['_id']
+    return ids, counts
+
+
+def sync_event_cache(rows):
+    """
+    Upserts 'event_cache' rows in chunks of CACHE_BATCH_SIZE: one multi-row
+    INSERT ... ON DUPLICATE KEY UPDATE title and one commit per chunk. If a chunk
+    fails, its rows are retried one at a time so only the bad row is lost.
+    Returns (rows synced, rows failed).
+    """
+    synced = failed = 0
+    for start in range(0, len(rows), CACHE_BATCH_SIZE):
+        chunk = rows[start:start + CACHE_BATCH_SIZE]
+        try:
+            upsert_event_cache(chunk, update_title=True)
+            db.session.commit()
+            synced += len(chunk)
+            continue
+        except Exception as e:
+            db.session.rollback()
+            print(f"MySQL Cache batch error ({len(chunk)} rows), retrying row by row: {e}")
+
+        for row in chunk:
+            try:
+                upsert_event_cache([row], update_title=True)
+                db.session.commit()
+                synced += 1
+            except Exception as e:
+                db.session.rollback()
+                print(f"MySQL Cache Error for {row['title']}: {e}")
+                failed += 1
+    return synced, failed
+
+
 def transform_and_load_events(client, events_data, site_name):
     """
-    1. Upserts events into MongoDB 'events' collection.
-    2. Upserts same events into MySQL 'event_cache' table (The Universal Adapter).
+    Returns the source URLs of the events written to MongoDB.
+
+    1. Upserts events into MongoDB 'events' collection (bulk_write batches of MONGO_BATCH_SIZE).
+    2. Upserts same events into MySQL 'event_cache' table (The Universal Adapter),
+       CACHE_BATCH_SIZE rows per statement.
     """
     if not client or not events_data:
-        return
+        return []
     
     db_mongo = client.get_database("event_calendar") 
     events_collection = db_mongo.events
 
-    upserted_count = 0
-    modified_count = 0
+    totals = {"inserted": 0, "modified": 0, "unchanged": 0, "failed": 0}
     skipped_count = 0
     cached_count = 0
+    cache_failed = 0
+    feed_docs = []  # Loaded documents, mirrored into the 'event_feed' read model at the end
 
+    # Basic validation; a source seen twice keeps its last version
+    mongo_events = {}
     for event in events_data:
-        # Basic validation
         if not event.get("title") or "not found" in event.get("title").lower() or not event.get("source"):
             print(f"Skipping invalid event data: {event.get('title')}")
             skipped_count += 1
             continue
+        mongo_events[event["source"]] = _mongo_event(event)
+    mongo_events = list(mongo_events.values())
 
-        mongo_event = {
-            "title": event.get("title"),
-            "description": event.get("description", ""),
-            "start_date": event.get("start_date"),
-            "end_date": event.get("end_date"),
-            "venue_name": event.get("venue_name"),
-            "address": event.get("address", ""),
-            "image_url": event.get("image_url"),
-            "registration_link": event.get("registration_link"),
-            "source": event.get("source") 
-        }
+    for start in range(0, len(mongo_events), MONGO_BATCH_SIZE):
+        batch = mongo_events[start:start + MONGO_BATCH_SIZE]
 
         # --- A. MongoDB Upsert ---
-        result = events_collection.update_one(
-            {'source': mongo_event['source']},
-            {'$set': mongo_event},
-            upsert=True
-        )
-        
-        mongo_id = None
-        if result.upserted_id:
-            upserted_count += 1
-            mongo_id = str(result.upserted_id)
-        elif result.modified_count > 0:
-            modified_count += 1
-            # Retrieve existing ID
-            doc = events_collection.find_one({'source': mongo_event['source']})
-            mongo_id = str(doc['_id'])
-        else:
-            # No change, but we still need ID for cache check
-            doc = events_collection.find_one({'source': mongo_event['source']})
-            if doc:
-                mongo_id = str(doc['_id'])
+        ids, counts = upsert_event_batch(events_collection, batch)
+        for key, value in counts.items():
+            totals[key] += value
+
+        cache_rows = []
+        for mongo_event in batch:
+            object_id = ids.get(mongo_event['source'])
+            if object_id is None:
+                continue
+            mongo_id = str(object_id)
+            feed_docs.append({**mongo_event, "_id": object_id})
+            cache_rows.append({
+                "event_identifier": f"official_{mongo_id}",
+                "source": 'official',
+                "original_id": mongo_id,
+                "title": mongo_event['title'][:255],  # Truncate for SQL safety
+            })
 
         # --- B. MySQL Cache Upsert ---
-        if mongo_id:
-            try:
-                event_identifier = f"official_{mongo_id}"
-                
-                # Check if exists in cache
-                existing_cache = EventCache.query.get(event_identifier)
-                
-                if not existing_cache:
-                    new_cache = EventCache(
-                        event_identifier=event_identifier,
-                        source='official',
-                        original_id=mongo_id,
-                        title=mongo_event['title'][:255] # Truncate for SQL safety
-                    )
-                    db.session.add(new_cache)
-                    cached_count += 1
-                else:
-                    # Sync title if changed
-                    if existing_cache.title != mongo_event['title'][:255]:
-                        existing_cache.title = mongo_event['title'][:255]
-                
-                # Commit frequently to keep connection fresh
-                db.session.commit()
-                
-            except Exception as e:
-                print(f"MySQL Cache Error for {mongo_event['title']}: {e}")
-                db.session.rollback()
+        synced, failed = sync_event_cache(cache_rows)
+        cached_count += synced
+        cache_failed += failed
+
+    # --- C. Read Model Sync ---
+    sync_official_events(feed_docs, db_mongo)
+    invalidate_feed_cache(db_mongo)
+    invalidate_event_details([f"official_{doc['_id']}" for doc in feed_docs], db_mongo)
+
+    print(f"'{site_name}' Load Complete. Mongo: +{totals['inserted']} inserted, ~{totals['modified']} modified, "
+          f"={totals['unchanged']} unchanged, !{totals['failed']} failed, {skipped_count} skipped. "
+          f"MySQL Cache: {cached_count} synced, {cache_failed} failed.")
+    return [doc["source"] for doc in feed_docs]
+
+
+# --- STREAMING PIPELINE ---
+# list -> fetch -> parse -> load, as generators: once the listing is crawled,
+# detail pages are fetched with at most SCRAPE_IN_FLIGHT requests ahead of the
+# parser, parsed one pool-full at a time and loaded in batches of
+# SYNC_BATCH_SIZE pages. Each stage only pulls
+# from the one before when it needs more, so a slow database holds back the
+# downloads instead of letting pages pile up in memory.
+
+SITES = {
+    "artsrepublic.sg": (artsrepublic_detail_urls, parse_artsrepublic_detail_page),
+    "eventfinda.sg": (eventfinda_detail_urls, parse_eventfinda_detail_page),
+}
+
+
+def new_stage_counters():
+    return {
+        "list_pages": 0, "listed": 0, "resumed": 0, "fetched": 0, "fetch_failed": 0, "unchanged": 0,
+        "parsed": 0, "parse_failed": 0, "batches": 0, "loaded": 0,
+    }
+
+
+def fetch_stage(fetcher, urls, counters):
+    """
+    Yields (url, body bytes) per fetched page, or (url, None) for pages
+    unchanged since their events were last loaded. Failed fetches are logged
+    and dropped.
+    """
+    for url, response in fetcher.iter_fetch(urls):
+        if isinstance(response, Exception):
+            print(f"Error scraping detail page {url}: {response}")
+            counters["fetch_failed"] += 1
+        elif getattr(response, "unchanged", False):
+            counters["unchanged"] += 1
+            yield url, None
+        else:
+            counters["fetched"] += 1
+            yield url, response.content
+
+
+def parse_stage(pages, parse_page, parser, counters):
+    """Yields (url, event dict or None); pages that fail to parse are logged and carry None."""
+    for url, result in parser.parse_stream(parse_page, pages):
+        if isinstance(result, ParseError):
+            print(f"Error parsing detail page {url}: {result}")
+            counters["parse_failed"] += 1
+            result = None
+        elif result:
+            counters["parsed"] += 1
+        yield url, result
+
+
+def batch_stage(items, size):
+    """Groups a stream into lists of at most size items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream_site_events(site, urls, fetcher, parser, counters, skip_urls=()):
+    """Runs the fetch and parse stages over one site's detail pages; yields (url, event dict or None)."""
+    todo = [url for url in urls if url not in skip_urls]
+    counters["listed"] += len(urls)
+    counters["resumed"] += len(urls) - len(todo)
+    if len(todo) < len(urls):
+        print(f"Resuming: {len(urls) - len(todo)} {site} pages were loaded before the interruption.")
+    yield from parse_stage(fetch_stage(fetcher, todo, counters), SITES[site][1], parser, counters)
+
+
+def _scrape_site(site, fetcher=None, parser=None):
+    """Every event from one site as a list, in listing order (no loading or checkpoints)."""
+    own_fetcher = fetcher is None
+    fetcher = fetcher or PageFetcher()
+    own_parser = parser is None
+    parser = parser or ParsePool()
+    try:
+        urls, _ = SITES[site][0](fetcher)
+        position = {url: i for i, url in enumerate(urls)}
+        results = stream_site_events(site, urls, fetcher, parser, new_stage_counters())
+        return [event for _, event in sorted(results, key=lambda r: position[r[0]]) if event]
+    except requests.exceptions.RequestException as e:
+        print(f"Error scraping {site} list page: {e}")
+        return []
+    finally:
+        if own_parser:
+            parser.close()
+        if own_fetcher:
+            fetcher.close()
+
 
-    print(f"'{site_name}' Load Complete. Mongo: +{upserted_count}/~{modified_count}. MySQL Cache Updated.")
+def sync_site(client, site, fetcher, parser, checkpoint, counters):
+    """
+    Streams one site's events into MongoDB / MariaDB in batches of SYNC_BATCH_SIZE
+    pages. After each batch is loaded its pages are marked loaded in the scrape
+    cache and recorded in the checkpoint; the listing pages are marked loaded
+    once the whole site is done, so the next run can stop its crawl early.
+    """
+    if checkpoint.site_done(site):
+        print(f"\nSkipping {site}: already synced before the interruption.")
+        return
+    try:
+        urls, list_pages = SITES[site][0](fetcher)
+        counters["list_pages"] += len(list_pages)
+        events = stream_site_events(site, urls, fetcher, parser, counters, checkpoint.completed(site))
+        for batch in batch_stage(events, SYNC_BATCH_SIZE):
+            batch_events = [event for _, event in batch if event]
+            label = f"{site} batch {checkpoint.batches(site) + 1}"
+            loaded = transform_and_load_events(client, batch_events, label) if batch_events else []
+            fetcher.mark_loaded(loaded)
+            checkpoint.complete_batch(site, [url for url, _ in batch])
+            counters["batches"] += 1
+            counters["loaded"] += len(loaded)
+    except requests.exceptions.RequestException as e:
+        print(f"Error scraping {site} list page: {e}")
+        return
+    fetcher.mark_loaded(list_pages)
+    checkpoint.finish_site(site)
 
 
 # --- MAIN EXECUTION BLOCK ---
 
 if __name__ == "__main__":
-    print("--- Starting Full Data Synchronization ---")
+    import sys
+
+    # --replay:   serve every page from the scrape cache (no network)
+    # --full:     parse and load every page, even ones unchanged since the last load
+    # --no-cache: don't read or write the scrape cache
+    # --restart:  ignore the checkpoint left by an interrupted sync
+    replay = "--replay" in sys.argv
+    print("--- Starting Full Data Synchronization ---" + (" (replay)" if replay else ""))
 
     
     with app.app_context():
         mongo_client = get_mongo_client()
         if mongo_client:
+            ensure_mongo_indexes(mongo_client.get_database(MONGO_DB_NAME))
+
             # 1. Load Statistics
             statistics_data = fetch_gov_statistics()
             transform_and_load_statistics(mongo_client, statistics_data)
 
-            # 2. Load Events from ArtsRepublic
-            artsrepublic_events = scrape_artsrepublic_sg()
-            if artsrepublic_events: 
-                transform_and_load_events(mongo_client, artsrepublic_events, "artsrepublic.sg")
-            
-            # 3. Load Events from Eventfinda
-            eventfinda_events = scrape_eventfinda_sg()
-            if eventfinda_events: 
-                transform_and_load_events(mongo_client, eventfinda_events, "eventfinda.sg")
+            # One fetcher (connection pool, scrape cache, SCRAPE_DEADLINE_S) for the whole run
+            fetcher = PageFetcher(
+                cache_dir="" if "--no-cache" in sys.argv else None,
+                replay=replay,
+                skip_unchanged="--full" not in sys.argv,
+            )
+            # ... and one pool of parser processes (SCRAPE_PARSE_WORKERS)
+            parser = ParsePool()
+            checkpoint = SyncCheckpoint(resume="--restart" not in sys.argv)
+            if checkpoint.resumed:
+                print("Resuming the interrupted sync from its checkpoint (--restart to start over).")
+            stages = new_stage_counters()
+
+            # 2-3. Stream events from ArtsRepublic, then Eventfinda, into load batches
+            for site in SITES:
+                sync_site(mongo_client, site, fetcher, parser, checkpoint, stages)
+            if all(checkpoint.site_done(site) for site in SITES):
+                checkpoint.clear()
+
+            fetcher.close()
+            parser.close()
+            counters = fetcher.counters
+            print(f"Pages requested: {counters['requests']} (retries: {counters['retries']}, "
+                  f"failed: {counters['failures']}, not modified: {counters['not_modified']}, "
+                  f"unchanged: {counters['unchanged']}, replayed: {counters['replayed']})")
+            print("Pipeline: " + ", ".join(f"{stage} {count}" for stage, count in stages.items())
+                  + f" (parser processes: {parser.workers})")
             
-            mongo_client.close()
+            close_mongo_clients()
             print("\nMongoDB connection closed. Sync finished.")
         else:
             print("Could not connect to MongoDB. Aborting script.")
\ No newline at end of file
@@ -0,0 +1,25 @@
+from project import app, db
+
+def migrate_indexes():
+    """
+    Creates indexes declared on the models (__table_args__) that are missing from
+    existing tables. db.create_all() only adds them to tables it creates itself.
+    """
+    print("--- Starting Index Migration ---")
+
+    with app.app_context():
+        created_count = 0
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(bind=db.engine, checkfirst=True)
+                    print(f"   > {table.name}.{index.name}: ok")
+                    created_count += 1
+                except Exception as e:
+                    print(f"   ! {table.name}.{index.name}: {e}")
+
+        print(f"--- Index Migration Complete ---")
+        print(f"   > Checked: {created_count}")
+
+if __name__ == "__main__":
+    migrate_indexes()
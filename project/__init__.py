@@ -30,13 +30,18 @@ MARIADB_URI = (
     f"?ssl_ca={os.getenv('SSL_CA_PATH', 'ca.pem')}"
 )
 
-app.config["SQLALCHEMY_DATABASE_URI"] = MARIADB_URI
+# SQLALCHEMY_DATABASE_URI overrides the MariaDB URI (the tests run on SQLite)
+app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("SQLALCHEMY_DATABASE_URI", MARIADB_URI)
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False 
 
 # --- 5. Initialize SQLAlchemy and Import Models ---
 from .models import db 
 db.init_app(app)
 
+# --- 5b. Configure the pooled MongoDB client (pool size / timeouts via MONGO_* env vars) ---
+from .db import init_mongo
+init_mongo(app)
+
 # --- 6. Register Blueprints and Core Routes ---
 
 # CRITICAL: This one line is all that's needed to activate routes.py
@@ -58,6 +63,31 @@ from .routes.stats import stats_bp
 # Configure session secret key (needed for Flask sessions)
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
 
+# Fan-out settings for endpoints that query MongoDB and MariaDB in parallel
+app.config["FANOUT_WORKERS"] = int(os.getenv("FANOUT_WORKERS", 8))
+app.config["FEED_OFFICIAL_TIMEOUT_MS"] = int(os.getenv("FEED_OFFICIAL_TIMEOUT_MS", 5000))
+app.config["FEED_COMMUNITY_TIMEOUT_MS"] = int(os.getenv("FEED_COMMUNITY_TIMEOUT_MS", 5000))
+app.config["EVENT_DETAIL_TIMEOUT_MS"] = int(os.getenv("EVENT_DETAIL_TIMEOUT_MS", 5000))
+
+# Serve /api/all-events and /api/event/<id> from the 'event_feed' read model (see rebuild_event_feed.py)
+app.config["FEED_READ_MODEL"] = os.getenv("FEED_READ_MODEL", "false").lower() in ("1", "true", "yes")
+
+# /api/all-events response cache (FEED_CACHE_TTL_S=0 disables it)
+app.config["FEED_CACHE_TTL_S"] = float(os.getenv("FEED_CACHE_TTL_S", 30))
+app.config["FEED_CACHE_SIZE"] = int(os.getenv("FEED_CACHE_SIZE", 256))
+
+# How often each process checks for cache invalidations published by other processes
+app.config["CACHE_SYNC_S"] = float(os.getenv("CACHE_SYNC_S", 1))
+
+# /api/event/<id> payload cache (misses for unknown ids are kept for the shorter negative TTL)
+app.config["EVENT_DETAIL_CACHE_SIZE"] = int(os.getenv("EVENT_DETAIL_CACHE_SIZE", 1024))
+app.config["EVENT_DETAIL_CACHE_TTL_S"] = float(os.getenv("EVENT_DETAIL_CACHE_TTL_S", 300))
+app.config["EVENT_DETAIL_NEGATIVE_TTL_S"] = float(os.getenv("EVENT_DETAIL_NEGATIVE_TTL_S", 10))
+
+# Per-session bookmarked-id sets behind /api/bookmarks/check (BOOKMARK_CACHE_TTL_S=0 disables them)
+app.config["BOOKMARK_CACHE_TTL_S"] = float(os.getenv("BOOKMARK_CACHE_TTL_S", 60))
+app.config["BOOKMARK_CACHE_SIZE"] = int(os.getenv("BOOKMARK_CACHE_SIZE", 1024))
+
 # Register Blueprints
 app.register_blueprint(main_bp)
 app.register_blueprint(auth_bp, url_prefix='/api')
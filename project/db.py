@@ -1,30 +1,137 @@
 # project/db.py
 
+import atexit
 import os
+import threading
 import pymongo
 import mysql.connector
+from flask import current_app, has_app_context
 from mysql.connector import Error
 
+MONGO_DB_NAME = "event_calendar"
+
+# Pool / timeout settings for the shared MongoClient.
+# Each one can be overridden in app.config or via an environment variable of the same name.
+MONGO_CONFIG_DEFAULTS = {
+    "MONGO_MAX_POOL_SIZE": 50,
+    "MONGO_MIN_POOL_SIZE": 0,
+    "MONGO_MAX_IDLE_TIME_MS": 60000,
+    "MONGO_CONNECT_TIMEOUT_MS": 5000,
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": 5000,
+    "MONGO_SOCKET_TIMEOUT_MS": 20000,
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": 5000,
+}
+
+# One MongoClient per (process, settings). The client owns its own connection pool,
+# so every request in this process reuses the same sockets instead of reconnecting.
+_mongo_clients = {}
+_mongo_pid = os.getpid()
+_mongo_lock = threading.Lock()
+
+
+def _reset_mongo_clients_after_fork():
+    """Drop clients inherited from the parent process (their sockets are not fork-safe)."""
+    global _mongo_pid, _mongo_lock
+    _mongo_clients.clear()
+    _mongo_pid = os.getpid()
+    _mongo_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_mongo_clients_after_fork)
+
+
+def _mongo_settings():
+    """Reads the Mongo URI and pool settings from the app config (or env outside the app)."""
+    config = current_app.config if has_app_context() else {}
+    settings = {"MONGO_URI": config.get("MONGO_URI") or os.getenv("MONGO_URI")}
+    for key, default in MONGO_CONFIG_DEFAULTS.items():
+        settings[key] = int(config.get(key, os.getenv(key, default)))
+    return settings
+
+
+def init_mongo(app):
+    """Registers the Mongo URI and pool settings on the app config."""
+    app.config.setdefault("MONGO_URI", os.getenv("MONGO_URI"))
+    for key, default in MONGO_CONFIG_DEFAULTS.items():
+        app.config.setdefault(key, int(os.getenv(key, default)))
+    app.extensions["mongo_clients"] = _mongo_clients
+
+
 def get_mongo_client():
-    """Establishes a connection to MongoDB and returns the client object."""
-    try:
-        mongo_uri = os.getenv("MONGO_URI")
-        client = pymongo.MongoClient(mongo_uri)
-        client.admin.command('ping')
-        print("MongoDB connection successful.")
+    """Returns the pooled MongoDB client for this process (created on first use)."""
+    if os.getpid() != _mongo_pid:
+        _reset_mongo_clients_after_fork()
+
+    settings = _mongo_settings()
+    key = tuple(sorted(settings.items()))
+    client = _mongo_clients.get(key)
+    if client:
         return client
-    except Exception as e:
-        print(f"Error connecting to MongoDB: {e}")
+
+    with _mongo_lock:
+        client = _mongo_clients.get(key)
+        if client:
+            return client
+        try:
+            client = pymongo.MongoClient(
+                settings["MONGO_URI"],
+                maxPoolSize=settings["MONGO_MAX_POOL_SIZE"],
+                minPoolSize=settings["MONGO_MIN_POOL_SIZE"],
+                maxIdleTimeMS=settings["MONGO_MAX_IDLE_TIME_MS"],
+                connectTimeoutMS=settings["MONGO_CONNECT_TIMEOUT_MS"],
+                serverSelectionTimeoutMS=settings["MONGO_SERVER_SELECTION_TIMEOUT_MS"],
+                socketTimeoutMS=settings["MONGO_SOCKET_TIMEOUT_MS"],
+                waitQueueTimeoutMS=settings["MONGO_WAIT_QUEUE_TIMEOUT_MS"],
+            )
+        except Exception as e:
+            print(f"Error connecting to MongoDB: {e}")
+            return None
+        _mongo_clients[key] = client
+        return client
+
+
+def get_mongo_db():
+    """Returns the 'event_calendar' database on the pooled client, or None."""
+    client = get_mongo_client()
+    if not client:
         return None
+    return client.get_database(MONGO_DB_NAME)
+
+
+def ensure_mongo_indexes(db_mongo):
+    """Creates the indexes the event feed relies on (safe to call repeatedly)."""
+    db_mongo.events.create_index([("source", 1)])
+    db_mongo.events.create_index([("start_date", 1), ("_id", 1)])
+    db_mongo.events.create_index([("title_sort", 1), ("_id", 1)])
+    db_mongo.events.create_index([("category", 1), ("start_date", 1), ("_id", 1)])
+
+
+def close_mongo_clients():
+    """Closes every pooled client owned by this process (used on shutdown and by scripts)."""
+    if os.getpid() != _mongo_pid:
+        _mongo_clients.clear()
+        return
+    with _mongo_lock:
+        for client in _mongo_clients.values():
+            client.close()
+        _mongo_clients.clear()
+
+
+atexit.register(close_mongo_clients)
 
 
 def get_mongo_status():
     """Pings the MongoDB Atlas cluster to check the connection."""
     client = get_mongo_client()
-    if client:
-        client.close()
+    if not client:
+        return "disconnected"
+    try:
+        client.admin.command('ping')
         return "connected"
-    return "disconnected"
+    except Exception as e:
+        print(f"Error connecting to MongoDB: {e}")
+        return "disconnected"
 
 
 def get_mariadb_connection():
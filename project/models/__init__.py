@@ -12,4 +12,5 @@ from .event import Event
 from .event_tag import EventTag
 from .bookmark import Bookmark  
 from .review import Review
-from .event_cache import EventCache
\ No newline at end of file
+from .event_cache import EventCache
+from .event_rating import EventRating
\ No newline at end of file
@@ -14,6 +14,13 @@ class Bookmark(db.Model):
     
     created_at = db.Column(db.DateTime, nullable=False , default=db.func.now())
 
+    # Newest-first expanded bookmark pages per user, and bulk "is bookmarked" checks
+    # (see services/bookmarks.py)
+    __table_args__ = (
+        db.Index("ix_bookmark_user_created", "user_id", "created_at", "id"),
+        db.Index("ix_bookmark_user_event", "user_id", "event_identifier"),
+    )
+
     def as_dict(self):
         return {
             "id": self.id,
@@ -13,7 +13,7 @@ class Event(db.Model):
     image_url = db.Column(db.String(2048))
     venue_id = db.Column(db.Integer, db.ForeignKey("venue.id"), nullable=False)
 
-    tags = db.relationship("EventTag", backref="event", cascade="all, delete")
+    tags = db.relationship("EventTag", backref="event", cascade="all, delete", order_by="EventTag.id")
     # FIX: Renamed attribute to 'bookmarked_by' and target to "Bookmark"
     bookmarked_by = db.relationship("Bookmark", backref="event", cascade="all, delete")
     reviews = db.relationship("Review", backref="event", cascade="all, delete")
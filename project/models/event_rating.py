@@ -0,0 +1,25 @@
+# project/models/event_rating.py
+from . import db
+
+class EventRating(db.Model):
+    """
+    Running review totals per event (official or community), maintained by the
+    review endpoints in the same transaction as the review itself.
+    Rebuild with rebuild_ratings.py if it ever drifts.
+    """
+    __tablename__ = "event_rating"
+    event_identifier = db.Column(db.String(255), primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.Integer, nullable=False, default=0)
+    score_1 = db.Column(db.Integer, nullable=False, default=0)
+    score_2 = db.Column(db.Integer, nullable=False, default=0)
+    score_3 = db.Column(db.Integer, nullable=False, default=0)
+    score_4 = db.Column(db.Integer, nullable=False, default=0)
+    score_5 = db.Column(db.Integer, nullable=False, default=0)
+
+    def as_dict(self):
+        return {
+            "count": self.review_count,
+            "average": round(self.score_sum / self.review_count, 1) if self.review_count else None,
+            "histogram": {str(s): getattr(self, f"score_{s}") for s in range(1, 6)},
+        }
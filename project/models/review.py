@@ -16,6 +16,11 @@ class Review(db.Model):
     body = db.Column(db.Text)
     created_at = db.Column(db.DateTime, nullable=False)
 
+    # Newest-first review pages per event (see services/reviews.py)
+    __table_args__ = (
+        db.Index("ix_review_event_created", "event_identifier", "created_at", "id"),
+    )
+
     def as_dict(self):
         return {
             "id": self.id,
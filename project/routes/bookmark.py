@@ -1,7 +1,15 @@
 # project/routes/bookmark.py
 from flask import Blueprint, request, jsonify, session
 from project.models import db, Bookmark
-from project.models.event_cache import EventCache
+from project.services.event_cache import ensure_event_cache
+from project.services.bookmarks import (
+    parse_bookmark_args,
+    load_bookmark_page,
+    bookmark_status,
+    new_bookmark_token,
+    record_bookmark_change,
+    MAX_CHECK_IDS,
+)
 from datetime import datetime
 
 bookmark_bp = Blueprint("bookmark", __name__)
@@ -9,8 +17,15 @@ bookmark_bp = Blueprint("bookmark", __name__)
 # GET all bookmarks
 @bookmark_bp.route("/bookmarks", methods=["GET"])
 def get_bookmarks():
+    """
+    The user's bookmarked ids. With ?expand=1 returns pages of bookmarks with the
+    event details attached instead ('sort' = bookmarked|event_date, 'limit', 'cursor').
+    """
     if "user_id" not in session:
         return jsonify({"error": "Auth required"}), 401
+
+    if request.args.get("expand") in ("1", "true"):
+        return get_expanded_bookmarks(session["user_id"])
         
     bookmarks = Bookmark.query.filter_by(user_id=session["user_id"]).all()
     
@@ -20,22 +35,61 @@ def get_bookmarks():
         "bookmarks": [b.as_dict() for b in bookmarks]
     })
 
-# GET check if specific event is bookmarked
-@bookmark_bp.route("/bookmarks/check", methods=["GET"])
+def get_expanded_bookmarks(user_id):
+    try:
+        sort, limit, cursor = parse_bookmark_args(request.args)
+    except ValueError:
+        return jsonify({"status": "error", "error": "Invalid sort, limit or cursor"}), 400
+
+    items, next_cursor, partial = load_bookmark_page(user_id, sort, limit, cursor)
+    return jsonify({
+        "status": "success",
+        "items": items,
+        "sort": sort,
+        "limit": limit,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+        "meta": {"partial": partial},
+    })
+
+# GET check if specific event(s) are bookmarked
+@bookmark_bp.route("/bookmarks/check", methods=["GET", "POST"])
 def check_bookmark():
+    """
+    ?event_id=x answers {"is_bookmarked"} for one event. ?event_ids=a,b,c (or POST
+    {"ids": [...]}) answers {"bookmarked": {id: bool}} for many with one lookup.
+    """
+    if request.method == "POST":
+        data = request.get_json(silent=True) or {}
+        ids = data.get("ids")
+        if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+            return jsonify({"error": "ids must be a list of event ids"}), 400
+    elif request.args.get("event_ids") is not None:
+        ids = request.args.get("event_ids").split(",")
+    else:
+        ids = None
+
+    if ids is None:
+        event_id = request.args.get("event_id")
+        if not event_id:
+            return jsonify({"error": "Event ID required"}), 400
+        if "user_id" not in session:
+            return jsonify({"is_bookmarked": False}), 200
+        status = bookmark_status(session["user_id"], [event_id], _session_token())
+        return jsonify({"is_bookmarked": status[event_id]}), 200
+
+    ids = [i.strip() for i in ids if i.strip()]
+    if len(ids) > MAX_CHECK_IDS:
+        return jsonify({"error": f"At most {MAX_CHECK_IDS} ids per request"}), 400
     if "user_id" not in session:
-        return jsonify({"is_bookmarked": False}), 200
-    
-    event_id = request.args.get("event_id")
-    if not event_id:
-        return jsonify({"error": "Event ID required"}), 400
-    
-    bookmark = Bookmark.query.filter_by(
-        user_id=session["user_id"],
-        event_identifier=event_id
-    ).first()
-    
-    return jsonify({"is_bookmarked": bookmark is not None}), 200
+        return jsonify({"bookmarked": {i: False for i in ids}}), 200
+    return jsonify({"bookmarked": bookmark_status(session["user_id"], ids, _session_token())}), 200
+
+def _session_token():
+    """The session's bookmark-set token (see services/bookmarks.py), created on first use."""
+    if "bookmark_token" not in session:
+        session["bookmark_token"] = new_bookmark_token()
+    return session["bookmark_token"]
 
 # POST Add Bookmark
 @bookmark_bp.route("/bookmarks", methods=["POST"])
@@ -59,36 +113,11 @@ def add_bookmark():
         return jsonify({"status": "added", "message": "Already bookmarked"}), 200
 
     # 2. [AUTO-CACHE] Ensure event exists in Cache Table
-    cached_event = EventCache.query.get(event_identifier)
-    
-    if not cached_event:
-        source_type = 'community' if event_identifier.startswith('community_') else 'official'
-        original_id = event_identifier.replace(f'{source_type}_', '')
-        
-        # Try fetch title
-        title = "Saved Event"
-        if source_type == 'official':
-            try:
-                from project.db import get_mongo_client
-                from bson import ObjectId
-                client = get_mongo_client()
-                if client:
-                    doc = client.get_database("event_calendar").events.find_one({'_id': ObjectId(original_id)})
-                    if doc: title = doc.get('title', title)
-                    client.close()
-            except: pass
-            
-        new_cache = EventCache(
-            event_identifier=event_identifier,
-            source=source_type,
-            original_id=original_id,
-            title=title
-        )
-        try:
-            db.session.add(new_cache)
-            db.session.commit()
-        except:
-            db.session.rollback()
+    try:
+        if ensure_event_cache([event_identifier]):
+            return jsonify({"error": "Invalid event identifier format"}), 400
+    except Exception as e:
+        return jsonify({"error": f"Failed to cache event: {str(e)}"}), 500
 
     # 3. Create Bookmark
     new_bookmark = Bookmark(
@@ -101,6 +130,9 @@ def add_bookmark():
     try:
         db.session.add(new_bookmark)
         db.session.commit()
+        session["bookmark_token"] = record_bookmark_change(
+            session["user_id"], session.get("bookmark_token"), event_identifier, added=True
+        )
         return jsonify({"status": "added", "message": "Event saved"}), 201
     except Exception as e:
         db.session.rollback()
@@ -127,6 +159,9 @@ def remove_bookmark(event_identifier):
     try:
         db.session.delete(bookmark)
         db.session.commit()
+        session["bookmark_token"] = record_bookmark_change(
+            session["user_id"], session.get("bookmark_token"), event_identifier, added=False
+        )
         return jsonify({"status": "removed", "message": "Bookmark removed"}), 200
     except Exception as e:
         db.session.rollback()
@@ -1,19 +1,68 @@
 from flask import Blueprint, request, jsonify, current_app, session
-from project.models import db, Event, Venue, Tag, EventCache
-from project.db import get_mongo_client
-from bson import ObjectId
+from project.models import db, Event, Venue, Tag, EventCache, EventTag, Bookmark
+from project.db import get_mongo_db
 from werkzeug.utils import secure_filename
-from sqlalchemy.orm import joinedload
 from datetime import datetime
 import os
-from datetime import datetime, timedelta
+import time
 from project.db import get_mongo_status, get_mariadb_status
+from project.services.event_shape import shape_official_event, shape_community_event
+from project.services.read_model import (
+    fetch_feed_page,
+    count_feed,
+    sync_community_events,
+    remove_feed_events,
+)
+from project.services.event_lookup import (
+    lookup_event_details,
+    invalidate_event_details,
+    detail_cache_stats,
+    FOUND,
+    NOT_FOUND,
+    INVALID,
+)
+from project.services.executor import (
+    submit_in_app_context, gather, statement_budget, MONGO_POOL, MARIADB_POOL,
+)
+from project.services.reviews import REVIEW_PAGE_SIZE, review_page_payload
+from project.services.ratings import load_rating, load_ratings, remove_ratings
+from project.services.event_cache import forget_event_cache
+from project.services.ttl_cache import MISSING
+from project.services.feed_cache import (
+    feed_cache_key,
+    lookup_feed_response,
+    store_feed_response,
+    invalidate_feed_cache,
+    feed_cache_stats,
+)
+from project.services.event_query import (
+    FEED_SOURCES,
+    parse_feed_args,
+    includes_source,
+    matches_category,
+    build_mongo_filter,
+    build_community_query,
+    community_feed_options,
+    parse_page_size,
+    resolve_sort,
+    decode_cursor,
+    encode_cursor,
+    event_position,
+    is_after,
+    order_events,
+    collect_page,
+    mongo_sort,
+    mongo_range,
+    community_order,
+    community_range,
+)
 
 
 event_bp = Blueprint("event", __name__)
 
 ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "webp"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+BATCH_MAX_IDS = 500  # /events/batch
 
 
 def allowed_file(filename):
@@ -85,293 +134,369 @@ def find_or_create_venue(name, address, postal_code):
         # Update address and postal code if provided
         venue.address = address
         venue.postal_code = postal_code
+        db.session.commit()
+        # Other events at this venue show its address in the read model
+        sync_community_events(venue_id=venue.id)
     else:
         # Create new venue
         venue = Venue(name=name, address=address, postal_code=postal_code)
         db.session.add(venue)
+        db.session.commit()
 
-    db.session.commit()
     return venue
 
 
-def _categorize_event(text):
-    text_lower = text.lower()
-    categories = {
-        "Comedy": ["comedy", "stand-up", "funny", "sitcom", "humor", "humour"],
-        "Crafts": ["craft", "crafts"],
-        "Dance": ["dance", "disco", "samba", "tango", "waltz"],
-        "Family Friendly": ["family", "kid", "kids"],
-        "Festival": ["festival", "festive", "competition", "fair"],
-        "Film": ["film", "movie", "cinema"],
-        "Food & Drink": ["food", "drink"],
-        "Free": ["free"],
-        "Literature": ["literature", "article", "poetry", "novel", "story"],
-        "Music": ["music", "concert", "band", "orchestra"],
-        "Nightlife": ["night", "party"],
-        "Outdoor": ["outdoor", "outside", "adventure"],
-        "Photography": ["photo", "photography", "picture", "image"],
-        "Tech": ["tech", "technology", "machine"],
-        "Theatre": ["theatre", "theater", "play", "drama", "musical"],
-        "Visual Arts": ["art", "exhibition", "gallery", "painting"],
-        "Wellness": ["health", "wellness", "yoga", "spa", "massage"],
-        "Workshops": ["workshop", "class", "course"],
-    }
-    for category, keywords in categories.items():
-        if any(keyword in text_lower for keyword in keywords):
-            return category
-    return "other"
+def _fetch_official_page(params, cursor, limit, now_str, max_time_ms=None):
+    """
+    Official rows after the cursor, in feed order (at most 'limit'). With max_time_ms,
+    MongoDB aborts any query that runs longer.
+    """
+    db_mongo = get_mongo_db()
+    if db_mongo is None:
+        return []
+    field, descending = resolve_sort(params)
+    base_filter = build_mongo_filter(params, now_str)
+
+    def fetch_chunk(after, size):
+        conditions = [base_filter]
+        after_range = mongo_range(field, descending, after)
+        if after_range:
+            conditions.append(after_range)
+        docs = db_mongo.events.find({"$and": conditions}).sort(mongo_sort(field, descending))
+        if max_time_ms:
+            docs = docs.max_time_ms(max_time_ms)
+        if size:
+            docs = docs.limit(size)
+        return [shape_official_event(e) for e in docs]
+
+    def accept(event):
+        return matches_category(event, params) and is_after(
+            event_position(event, field), cursor, descending
+        )
 
+    return collect_page(fetch_chunk, accept, cursor, limit, field)
 
-@event_bp.route("/all-events", methods=["GET"])
-def get_all_events():
-    """Unified endpoint with Time Filtering & Explicit Sorting"""
-    category = request.args.get("category", "all")
-    source_filter = request.args.get("source", "all")
-    time_filter = request.args.get("time", "upcoming")
-    sort_option = request.args.get("sort", "default")  # New Parameter
-    search_query = request.args.get("q", "").lower()
 
-    all_events = []
-    now_str = datetime.now().isoformat()
+def _fetch_community_page(params, cursor, limit, now):
+    """Community rows after the cursor, in feed order (at most 'limit')."""
+    field, descending = resolve_sort(params)
+    base_query = build_community_query(params, now).options(*community_feed_options())
 
-    # 1. Fetch Mongo (Official)
-    try:
-        client = get_mongo_client()
-        if client:
-            db_mongo = client.get_database("event_calendar")
-            for e in db_mongo.events.find({}):
-                cat = _categorize_event(
-                    e.get("title", "") + " " + e.get("description", "")
-                )
-                # Capitalize to match database tag format (e.g., "music" -> "Music")
-                cat = cat.replace('-', ' ').title()
-                start_date = e.get("start_date")
-                all_events.append(
-                    {
-                        "id": f"official_{str(e['_id'])}",
-                        "title": e.get("title"),
-                        "description": e.get("description"),
-                        "date": start_date if start_date else "TBA",
-                        "venue": e.get("venue_name"),
-                        "location": e.get("address"),
-                        "image": e.get("image_url"),
-                        "category": cat,
-                        "source": "official",
-                        "start_date": start_date,
-                        "tags": [cat],
-                    }
-                )
-            client.close()
-    except Exception as e:
-        print(f"Mongo Error: {e}")
+    def fetch_chunk(after, size):
+        query = base_query
+        after_range = community_range(field, descending, after)
+        if after_range is not None:
+            query = query.filter(after_range)
+        query = query.order_by(*community_order(field, descending))
+        if size:
+            query = query.limit(size)
+        return [shape_community_event(e) for e in query.all()]
 
-    # 2. Fetch MySQL (Community)
-    try:
-        community_events = Event.query.options(joinedload(Event.tags)).all()
-        for e in community_events:
-            venue = Venue.query.get(e.venue_id) if e.venue_id else None
-            tags = [t.tag.tag_name for t in e.tags] if e.tags else []
-            cat = tags[0] if tags else "Other"
-
-            # NEW: Get Creator Info
-            creator_profile = e.creator.profile if e.creator else None
-            creator_data = (
-                {
-                    "id": e.creator.id,
-                    "username": e.creator.username,
-                    "avatar": creator_profile.avatar_url if creator_profile else None,
-                }
-                if e.creator
-                else None
-            )
-            sg_time = (
-                e.start_datetime + timedelta(hours=8) if e.start_datetime else None
-            )
-            all_events.append(
-                {
-                    "id": f"community_{e.id}",
-                    "title": e.title,
-                    "description": e.description,
-                    "date": (sg_time.strftime("%Y-%m-%d %H:%M") if sg_time else "TBA"),
-                    "venue": venue.name if venue else "TBA",
-                    "location": venue.address if venue else "",
-                    "image": e.image_url,
-                    "category": cat,
-                    "source": "community",
-                    "start_date": (
-                        (e.start_datetime.isoformat() + "Z") if e.start_datetime else ""
-                    ),
-                    "tags": tags,
-                    "creator": creator_data,  # <--- ADDED THIS
-                }
-            )
-    except Exception as e:
-        print(f"MySQL Error: {e}")
-
-    # 3. FILTERING
-    filtered_events = []
-    for e in all_events:
-        # Search
-        if search_query:
-            text = (str(e.get("title")) + " " + str(e.get("venue"))).lower()
-            if search_query not in text:
-                continue
-        # Source
-        if source_filter != "all" and e["source"] != source_filter:
-            continue
-        # Category
-        if category != "all" and e["category"] != category:
-            continue
-        # Time
-        event_date = e.get("start_date")
-        if not event_date:
-            continue
+    def accept(event):
+        return matches_category(event, params) and is_after(
+            event_position(event, field), cursor, descending
+        )
 
-        if time_filter == "upcoming":
-            if event_date >= now_str:
-                filtered_events.append(e)
-        elif time_filter == "past":
-            if event_date < now_str:
-                filtered_events.append(e)
-        else:
-            filtered_events.append(e)
-
-    # 4. SORTING
-    # Determine sort key and direction
-    if sort_option == "title_asc":
-        filtered_events.sort(key=lambda x: x.get("title", "").lower())
-    elif sort_option == "title_desc":
-        filtered_events.sort(key=lambda x: x.get("title", "").lower(), reverse=True)
-    elif sort_option == "date_desc":
-        filtered_events.sort(key=lambda x: x.get("start_date") or "0000", reverse=True)
-    elif sort_option == "date_asc":
-        filtered_events.sort(key=lambda x: x.get("start_date") or "9999", reverse=False)
+    return collect_page(fetch_chunk, accept, cursor, limit, field)
+
+
+def _fetch_source(source, params, cursor, fetch_size, now, with_count, timeout_ms):
+    """
+    Fetches one backend's page (and its total on the first page). Runs on the
+    backend's fan-out pool; every query is bounded by the source's timeout so a
+    slow backend can't hold a pool thread much past the request's deadline.
+    """
+    now_str = now.isoformat()
+    if source == "official":
+        db_mongo = get_mongo_db()
+        if db_mongo is None:
+            raise RuntimeError("MongoDB unavailable")
+        events = _fetch_official_page(params, cursor, fetch_size, now_str, max_time_ms=timeout_ms)
+        count = (
+            db_mongo.events.count_documents(build_mongo_filter(params, now_str), maxTimeMS=timeout_ms)
+            if with_count else None
+        )
     else:
-        # Smart Default: Upcoming = Soonest First, Past = Most Recent First
-        is_reverse = True if time_filter == "past" else False
-        filtered_events.sort(
-            key=lambda x: x.get("start_date") or "9999", reverse=is_reverse
+        with statement_budget(timeout_ms):
+            events = _fetch_community_page(params, cursor, fetch_size, now)
+            count = build_community_query(params, now).count() if with_count else None
+    return events, count
+
+
+def _fetch_from_sources(params, cursor, fetch_size, now, with_count):
+    """
+    Fans out to the backends the 'source' filter allows (filters are pushed into
+    each query) and merges their rows into feed order.
+    Returns (events, counts, meta).
+    """
+    field, descending = resolve_sort(params)
+    timeouts = {
+        "official": current_app.config["FEED_OFFICIAL_TIMEOUT_MS"],
+        "community": current_app.config["FEED_COMMUNITY_TIMEOUT_MS"],
+    }
+    pools = {"official": MONGO_POOL, "community": MARIADB_POOL}
+    futures = {
+        source: submit_in_app_context(
+            _fetch_source, source, params, cursor, fetch_size, now, with_count, timeouts[source],
+            pool=pools[source],
         )
+        for source in FEED_SOURCES
+        if includes_source(params, source)
+    }
+    outcomes = gather(futures, timeouts)
+
+    events = []
+    counts = {"official": 0, "community": 0}
+    meta = {"sources": {}, "partial": False}
+    for source in FEED_SOURCES:
+        outcome = outcomes.get(source)
+        if outcome is None:
+            meta["sources"][source] = {"status": "skipped", "ms": 0, "returned": 0}
+            continue
+        if outcome["status"] == "ok":
+            source_events, source_count = outcome["result"]
+            events += source_events
+            counts[source] = source_count or 0
+        else:
+            source_events = []
+            meta["partial"] = True
+        meta["sources"][source] = {
+            "status": outcome["status"],
+            "ms": outcome["ms"],
+            "returned": len(source_events),
+        }
+    order_events(events, field, descending)
+    return events, counts, meta
 
-    # 5. Counts
-    official_count = sum(1 for e in filtered_events if e["source"] == "official")
-    community_count = sum(1 for e in filtered_events if e["source"] == "community")
 
-    return jsonify(
-        {
+def _fetch_from_read_model(params, cursor, fetch_size, now, with_count):
+    """Reads pre-shaped rows from the 'event_feed' read model. Returns (events, counts, meta)."""
+    field, descending = resolve_sort(params)
+    now_str = now.isoformat()
+    start = time.perf_counter()
+    counts = {"official": 0, "community": 0}
+    try:
+        events = fetch_feed_page(params, field, descending, cursor, fetch_size, now_str)
+        if with_count:
+            counts = count_feed(params, now_str)
+        status = "ok"
+    except Exception as e:
+        print(f"Read model query failed: {e}")
+        events, status = [], "error"
+    meta = {
+        "sources": {
+            "read_model": {
+                "status": status,
+                "ms": round((time.perf_counter() - start) * 1000, 1),
+                "returned": len(events),
+            }
+        },
+        "partial": status != "ok",
+    }
+    return events, counts, meta
+
+
+@event_bp.route("/all-events", methods=["GET"])
+def get_all_events():
+    """
+    Unified endpoint with Time Filtering & Explicit Sorting.
+    Pass 'limit' (and the returned 'next_cursor' as 'cursor') to page through the feed.
+    Official (Mongo) and community (MariaDB) rows are fetched in parallel, or from the
+    'event_feed' read model when FEED_READ_MODEL is on; 'meta.sources' reports each
+    backend's status and timing. Complete responses are cached (see services/feed_cache.py).
+    """
+    params = parse_feed_args(request.args)
+    try:
+        limit = parse_page_size(request.args.get("limit"))
+        cursor_token = request.args.get("cursor")
+        cursor = decode_cursor(cursor_token) if cursor_token else None
+    except ValueError:
+        return jsonify({"status": "error", "error": "Invalid limit or cursor"}), 400
+
+    field, descending = resolve_sort(params)
+    read_model = current_app.config["FEED_READ_MODEL"]
+    cache_key = feed_cache_key(params, field, descending, limit, cursor_token, read_model)
+    cached, cache_epoch = lookup_feed_response(cache_key)
+    if cached is not MISSING:
+        return jsonify({**cached, "meta": {**cached["meta"], "cache": "hit"}})
+
+    now = datetime.now()
+    response = _build_feed_response(params, limit, cursor, field, descending, read_model, now)
+    # Partial responses (a backend timed out or failed) are never cached
+    if not response["meta"]["partial"]:
+        store_feed_response(cache_key, params, response, now, cache_epoch)
+    return jsonify({**response, "meta": {**response["meta"], "cache": "miss"}})
+
+
+def _build_feed_response(params, limit, cursor, field, descending, read_model, now):
+    """Computes the /api/all-events payload for the feed as of 'now'."""
+    # Fetch one extra row so we know whether another page exists
+    fetch_size = limit + 1 if limit else None
+    with_count = bool(limit) and cursor is None
+
+    # 1. Rows in feed order, from the read model or straight from both backends
+    if read_model:
+        events, counts, meta = _fetch_from_read_model(params, cursor, fetch_size, now, with_count)
+    else:
+        events, counts, meta = _fetch_from_sources(params, cursor, fetch_size, now, with_count)
+
+    if not limit:
+        official_count = sum(1 for e in events if e["source"] == "official")
+        community_count = sum(1 for e in events if e["source"] == "community")
+        return {
             "status": "success",
-            "total": len(filtered_events),
+            "total": len(events),
             "official_count": official_count,
             "community_count": community_count,
-            "events": filtered_events,
+            "events": events,
+            "meta": meta,
         }
-    )
+
+    # 2. Paginated response
+    has_more = len(events) > limit
+    page = events[:limit]
+    response = {
+        "status": "success",
+        "events": page,
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(event_position(page[-1], field)) if has_more else None,
+        "meta": meta,
+    }
+    if with_count:
+        response["total"] = counts["official"] + counts["community"]
+        response["official_count"] = counts["official"]
+        response["community_count"] = counts["community"]
+    return response
 
 
 @event_bp.route("/event/<event_id>", methods=["GET"])
 def get_unified_event(event_id):
     """Get Single Event (Unified) with End Date support"""
     try:
-        if event_id.startswith("official_"):
-            client = get_mongo_client()
-            if not client:
-                return jsonify({"error": "DB Error"}), 500
+        status, event = lookup_event_details([event_id])[event_id]
+    except Exception as ex:
+        print(f"Error fetching event: {ex}")
+        return jsonify({"error": str(ex)}), 500
 
-            event = client.get_database("event_calendar").events.find_one(
-                {"_id": ObjectId(event_id.replace("official_", ""))}
-            )
-            client.close()
-            if not event:
-                return jsonify({"error": "Not Found"}), 404
+    if status == FOUND:
+        # Ratings change with every review, so they are attached after the detail cache
+        return jsonify({"status": "success", "event": {**event, "rating": load_rating(event_id)}})
+    if status in (NOT_FOUND, INVALID):
+        return jsonify({"error": "Not Found"}), 404
+    return jsonify({"error": "DB Error"}), 500
+
+
+@event_bp.route("/events/batch", methods=["GET", "POST"])
+def get_events_batch():
+    """
+    Looks up many events in one call: GET ?ids=a,b,c or POST {"ids": [...]} for long lists.
+    Events come back in the requested order; ids that cannot be returned get an entry
+    with status 'not_found', 'invalid' or 'error' and event = null.
+    """
+    if request.method == "POST":
+        data = request.get_json(silent=True) or {}
+        ids = data.get("ids")
+        if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+            return jsonify({"status": "error", "error": "ids must be a list of event ids"}), 400
+    else:
+        ids = [i for i in request.args.get("ids", "").split(",") if i]
 
-            start_date_raw = event.get("start_date", "")
+    ids = [i.strip() for i in ids]
+    if len(ids) > BATCH_MAX_IDS:
+        return jsonify({"status": "error", "error": f"At most {BATCH_MAX_IDS} ids per request"}), 400
 
-            # --- FIX 1: Generate Category/Tags for Official Events ---
-            cat = _categorize_event(event.get("title", "") + " " + event.get("description", ""))
-            cat = cat.replace('-', ' ').title()
-            # ---------------------------------------------------------
+    results = lookup_event_details(list(dict.fromkeys(ids)))
+    ratings = load_ratings([i for i, (status, _) in results.items() if status == FOUND])
 
-            return jsonify(
-                {
-                    "status": "success",
-                    "event": {
-                        "id": event_id,
-                        "title": event.get("title"),
-                        "description": event.get("description"),
-                        "start_date": start_date_raw,
-                        "end_date": event.get("end_date"),
-                        "date": start_date_raw if start_date_raw else "Date TBA",
-                        "venue": event.get("venue_name"),
-                        "address": event.get("address"),
-                        "image": event.get("image_url"),
-                        "registration_link": event.get("registration_link"),
-                        "source": "official",
-                        "tags": [cat],  # <--- ADD THIS LINE
-                        "category": cat # <--- ADD THIS LINE (Optional but good for consistency)
-                    },
-                }
-            )
+    events = [
+        {
+            "id": i,
+            "status": results[i][0],
+            "event": {**results[i][1], "rating": ratings[i]} if results[i][0] == FOUND else None,
+        }
+        for i in ids
+    ]
+    return jsonify(
+        {
+            "status": "success",
+            "events": events,
+            "found": sum(1 for e in events if e["status"] == FOUND),
+            "requested": len(ids),
+        }
+    )
 
-        elif event_id.startswith("community_"):
-            # Ensure we eagerly load tags to prevent N+1 queries if possible, though .get() loads relationships lazily by default
-            e = Event.query.get(int(event_id.replace("community_", "")))
-            if not e:
-                return jsonify({"error": "Not Found"}), 404
-            
-            creator_profile = e.creator.profile if e.creator else None
-            creator_data = (
-                {
-                    "id": e.creator.id,
-                    "username": e.creator.username,
-                    "avatar": creator_profile.avatar_url if creator_profile else None,
-                }
-                if e.creator
-                else None
-            )
-            sg_time = (
-                e.start_datetime + timedelta(hours=8) if e.start_datetime else None
-            )
-            formatted_date = (
-                sg_time.strftime("%Y-%m-%d %H:%M") if sg_time else "Date TBA"
-            )
-            venue_name = e.venue.name if e.venue else "TBA"
-            venue_addr = e.venue.address if e.venue else ""
 
-            # --- FIX 2: Fetch Tags for Community Events ---
-            tags = [t.tag.tag_name for t in e.tags] if e.tags else []
-            # ----------------------------------------------
+def _detail_event(event_id):
+    status, event = lookup_event_details([event_id])[event_id]
+    if status == FOUND:
+        event = {**event, "rating": load_rating(event_id)}
+    return status, event
+
+
+def _detail_viewer(event_id, user_id):
+    """Bookmark state and user-applied tags (both live in MariaDB)."""
+    is_bookmarked = bool(user_id) and (
+        Bookmark.query.filter_by(user_id=user_id, event_identifier=event_id).first() is not None
+    )
+    tags = (
+        db.session.query(Tag.id, Tag.tag_name)
+        .join(EventTag, EventTag.tag_id == Tag.id)
+        .filter(EventTag.event_identifier == event_id)
+        .order_by(EventTag.id)
+        .all()
+    )
+    return {
+        "is_bookmarked": is_bookmarked,
+        "tags": [{"id": tag_id, "tag_name": name} for tag_id, name in tags],
+    }
+
+
+@event_bp.route("/event/<event_id>/detail", methods=["GET"])
+def get_event_detail_page(event_id):
+    """
+    Everything the event detail page needs in one round trip: the unified event,
+    the first page of reviews (with authors and the caller's own review), the
+    caller's bookmark state and the event's tags. The parts are fetched in parallel.
+    """
+    user_id = session.get("user_id")
+    futures = {
+        "event": submit_in_app_context(
+            _detail_event, event_id,
+            pool=MONGO_POOL if event_id.startswith("official_") else MARIADB_POOL,
+        ),
+        "reviews": submit_in_app_context(
+            review_page_payload, event_id, REVIEW_PAGE_SIZE, None, user_id
+        ),
+        "viewer": submit_in_app_context(_detail_viewer, event_id, user_id),
+    }
+    timeout_ms = current_app.config["EVENT_DETAIL_TIMEOUT_MS"]
+    outcomes = gather(futures, {name: timeout_ms for name in futures})
+
+    status, event = outcomes["event"]["result"] or (None, None)
+    if status in (NOT_FOUND, INVALID):
+        return jsonify({"error": "Not Found"}), 404
+    if status != FOUND:
+        return jsonify({"error": "Failed to load event"}), 500
+
+    reviews = outcomes["reviews"]["result"]
+    viewer = outcomes["viewer"]["result"] or {"is_bookmarked": False, "tags": []}
+    return jsonify(
+        {
+            "status": "success",
+            "event": event,
+            "reviews": reviews,
+            "is_bookmarked": viewer["is_bookmarked"],
+            "tags": viewer["tags"],
+            "current_user_id": user_id,
+            "meta": {
+                "parts": {name: {"status": o["status"], "ms": o["ms"]} for name, o in outcomes.items()},
+                "partial": any(o["status"] != "ok" for o in outcomes.values()),
+            },
+        }
+    )
 
-            return jsonify(
-                {
-                    "status": "success",
-                    "event": {
-                        "id": f"community_{e.id}",
-                        "title": e.title,
-                        "description": e.description,
-                        "start_date": (
-                            (e.start_datetime.isoformat() + "Z")
-                            if e.start_datetime
-                            else ""
-                        ),
-                        "end_date": (
-                            (e.end_datetime.isoformat() + "Z")
-                            if e.end_datetime
-                            else None
-                        ),
-                        "date": formatted_date,
-                        "venue": venue_name,
-                        "address": venue_addr,
-                        "image": e.image_url,
-                        "source": "community",
-                        "creator": creator_data,
-                        "tags": tags,  # <--- ADD THIS LINE
-                    },
-                }
-            )
 
-    except Exception as ex:
-        print(f"Error fetching event: {ex}")
-        return jsonify({"error": str(ex)}), 500
 # GET user's own events
 @event_bp.route("/events/my-events", methods=["GET"])
 def get_my_events():
@@ -491,6 +616,9 @@ def create_event():
                     return jsonify({"error": str(e)}), 400
 
         db.session.commit()
+        sync_community_events([event.id])
+        invalidate_feed_cache()
+        invalidate_event_details([f"community_{event.id}"])
         return jsonify(event.as_dict()), 201
 
     except Exception as e:
@@ -570,6 +698,9 @@ def update_event(event_id):
                     return jsonify({"error": str(e)}), 400
 
         db.session.commit()
+        sync_community_events([event.id])
+        invalidate_feed_cache()
+        invalidate_event_details([f"community_{event.id}"])
         return jsonify(event.as_dict())
 
     except Exception as e:
@@ -609,7 +740,12 @@ def delete_event(event_id):
         db.session.delete(cache_entry)
     # --- FIX END ---
     db.session.delete(event)
+    remove_ratings([event_identifier])
     db.session.commit()
+    forget_event_cache([event_identifier])
+    remove_feed_events([event_identifier])
+    invalidate_feed_cache()
+    invalidate_event_details([event_identifier])
     return jsonify({"message": "Event deleted successfully"})
 
 
@@ -628,6 +764,8 @@ def health_check():
                     "message": "Backend is running",
                     "mongodb": mongo_status,
                     "mariadb": mariadb_status,
+                    "feed_cache": feed_cache_stats(),
+                    "event_detail_cache": detail_cache_stats(),
                 }
             ),
             200,
@@ -1,8 +1,10 @@
 # routes/event_tag.py
 from flask import Blueprint, request, jsonify
-from project.models import db, EventTag, EventCache, Event
-from project.db import get_mongo_client
-from bson import ObjectId
+from project.models import db, EventTag
+from project.services.read_model import sync_community_events
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
+from project.services.event_cache import ensure_event_cache
 
 
 event_tag_bp = Blueprint("event_tag", __name__)
@@ -45,51 +47,11 @@ def create_event_tag():
 
     # --- 1. AUTO-CACHE LOGIC (The "Bridge") ---
     # Ensure the event exists in the cache table before tagging it
-    cached_event = EventCache.query.get(event_identifier)
-    
-    if not cached_event:
-        # Determine source
-        if event_identifier.startswith('official_'):
-            source_type = 'official'
-            original_id = event_identifier.replace('official_', '')
-            event_title = "Official Event"
-            
-            # Fetch title from MongoDB for cache
-            try:
-                client = get_mongo_client()
-                if client:
-                    mongo_doc = client.get_database("event_calendar").events.find_one({'_id': ObjectId(original_id)})
-                    if mongo_doc:
-                        event_title = mongo_doc.get('title', event_title)
-                    client.close()
-            except Exception as e:
-                print(f"Mongo Fetch Error: {e}")
-
-        elif event_identifier.startswith('community_'):
-            source_type = 'community'
-            original_id = event_identifier.replace('community_', '')
-            event_title = "Community Event"
-            
-            # Fetch title from SQL for cache
-            sql_event = Event.query.get(int(original_id))
-            if sql_event:
-                event_title = sql_event.title
-        else:
+    try:
+        if ensure_event_cache([event_identifier]):
             return jsonify({"error": "Invalid event identifier format"}), 400
-
-        # Create Cache Entry
-        new_cache = EventCache(
-            event_identifier=event_identifier,
-            source=source_type,
-            original_id=original_id,
-            title=event_title[:255]
-        )
-        try:
-            db.session.add(new_cache)
-            db.session.commit()
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": f"Failed to cache event: {str(e)}"}), 500
+    except Exception as e:
+        return jsonify({"error": f"Failed to cache event: {str(e)}"}), 500
 
     # --- 2. DUPLICATE CHECK ---
     existing = EventTag.query.filter_by(
@@ -116,6 +78,10 @@ def create_event_tag():
     
     db.session.add(new_tag)
     db.session.commit()
+    if numeric_id is not None:
+        sync_community_events([numeric_id])
+        invalidate_feed_cache()
+        invalidate_event_details([event_identifier])
     
     return jsonify(new_tag.as_dict()), 201
 
@@ -127,4 +93,7 @@ def delete_event_tag(event_id, tag_id):
         return jsonify({"error": "EventTag not found"}), 404
     db.session.delete(et)
     db.session.commit()
+    sync_community_events([event_id])
+    invalidate_feed_cache()
+    invalidate_event_details([f"community_{event_id}"])
     return jsonify({"message": "EventTag deleted"})
@@ -1,33 +1,44 @@
 from flask import Blueprint, request, jsonify, session
 from project.models import db, Review, User
 from datetime import datetime
+from project.services.reviews import (
+    parse_review_page_size,
+    decode_review_cursor,
+    load_all_reviews,
+    review_page_payload,
+)
+from project.services.ratings import apply_review_change, load_ratings, MAX_RATING_IDS
+from project.services.event_cache import ensure_event_cache
 
 review_bp = Blueprint("review", __name__)
 
 # GET reviews (FIXED: Filters by event_id)
 @review_bp.route("/reviews", methods=["GET"])
 def get_reviews():
+    """
+    Reviews of one event, newest first, with author username/avatar.
+    Pass 'limit' (and the returned 'next_cursor' as 'cursor') to page through them.
+    """
     # 1. Get the event_id from the URL (e.g., ?event_id=community_5)
     event_id = request.args.get('event_id')
     
     if not event_id:
         return jsonify([]) # Return empty list if no ID provided
-        
-    # 2. Filter reviews by this specific ID
-    # We use event_identifier because it stores both "official_..." and "community_..."
-    reviews = Review.query.filter_by(event_identifier=event_id).order_by(Review.created_at.desc()).all()
-    
-    # 3. Join with User data manually (to show username/avatar)
-    results = []
-    for r in reviews:
-        user = User.query.get(r.user_id)
-        results.append({
-            **r.as_dict(),
-            "username": user.username if user else "Anonymous",
-            "user_avatar": user.profile.avatar_url if user and user.profile else None
-        })
-        
-    return jsonify(results)
+
+    try:
+        limit = parse_review_page_size(request.args.get("limit"))
+        cursor_token = request.args.get("cursor")
+        cursor = decode_review_cursor(cursor_token) if cursor_token else None
+    except ValueError:
+        return jsonify({"status": "error", "error": "Invalid limit or cursor"}), 400
+
+    # 2. Legacy response: the full list
+    if limit is None:
+        return jsonify(load_all_reviews(event_id))
+
+    # 3. Paginated response
+    payload = review_page_payload(event_id, limit, cursor, session.get("user_id"))
+    return jsonify({"status": "success", **payload})
 
 # GET single review (Keep this for editing)
 @review_bp.route("/reviews/<int:review_id>", methods=["GET"])
@@ -58,44 +69,12 @@ def create_review():
     if existing:
         return jsonify({"error": "You have already reviewed this event"}), 400
 
-    # 2. [AUTO-CACHE] Ensure event exists in Cache Table
-    from project.models.event_cache import EventCache
-    
-    cached_event = EventCache.query.get(event_identifier)
-    
-    if not cached_event:
-        # It's missing! We must cache it now to satisfy the Foreign Key.
-        source_type = 'community' if event_identifier.startswith('community_') else 'official'
-        original_id = event_identifier.replace(f'{source_type}_', '')
-        
-        # Try to fetch title for "Official" events (nice to have)
-        event_title = "Cached Event"
-        if source_type == 'official':
-            try:
-                from project.db import get_mongo_client
-                from bson import ObjectId
-                client = get_mongo_client()
-                if client:
-                    mongo_event = client.get_database("event_calendar").events.find_one({'_id': ObjectId(original_id)})
-                    if mongo_event:
-                        event_title = mongo_event.get('title', 'Official Event')
-                    client.close()
-            except Exception:
-                pass # If Mongo fails, we just use default title
-        
-        # Create the Cache Entry
-        new_cache = EventCache(
-            event_identifier=event_identifier,
-            source=source_type,
-            original_id=original_id,
-            title=event_title
-        )
-        try:
-            db.session.add(new_cache)
-            db.session.commit() # Commit cache FIRST
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": f"Failed to cache event: {str(e)}"}), 500
+    # 2. [AUTO-CACHE] Ensure event exists in Cache Table (FK target of the review)
+    try:
+        if ensure_event_cache([event_identifier]):
+            return jsonify({"error": "Invalid event identifier format"}), 400
+    except Exception as e:
+        return jsonify({"error": f"Failed to cache event: {str(e)}"}), 500
 
     # 3. Determine numeric ID (Legacy support for community events)
     numeric_id = None
@@ -118,6 +97,8 @@ def create_review():
     
     try:
         db.session.add(review)
+        # Aggregate is updated in the same transaction as the review
+        apply_review_change(event_identifier, new_score=review.score)
         db.session.commit()
         
         # Return with user info for immediate display
@@ -141,11 +122,14 @@ def update_review(review_id):
     if review.user_id != session["user_id"]: return jsonify({"error": "Unauthorized"}), 403
 
     data = request.get_json()
+    old_score = review.score
     if "score" in data: review.score = int(data["score"])
     if "title" in data: review.title = data["title"]
     if "body" in data: review.body = data["body"] #Frontend sends "body" or "comment"? Adjusted to model.
     if "comment" in data: review.body = data["comment"] # Handle both just in case
 
+    if review.score != old_score:
+        apply_review_change(review.event_identifier, old_score=old_score, new_score=review.score)
     db.session.commit()
     return jsonify(review.as_dict())
 
@@ -159,6 +143,16 @@ def delete_review(review_id):
         
     if review.user_id != session["user_id"]: return jsonify({"error": "Unauthorized"}), 403
         
+    apply_review_change(review.event_identifier, old_score=review.score)
     db.session.delete(review)
     db.session.commit()
-    return jsonify({"message": "Review deleted"})
\ No newline at end of file
+    return jsonify({"message": "Review deleted"})
+
+
+# GET rating aggregates for many events (?ids=a,b,c)
+@review_bp.route("/ratings", methods=["GET"])
+def get_ratings():
+    ids = [i.strip() for i in request.args.get("ids", "").split(",") if i.strip()]
+    if len(ids) > MAX_RATING_IDS:
+        return jsonify({"status": "error", "error": f"At most {MAX_RATING_IDS} ids per request"}), 400
+    return jsonify({"status": "success", "ratings": load_ratings(ids)})
\ No newline at end of file
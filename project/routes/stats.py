@@ -1,5 +1,5 @@
 from flask import Blueprint, render_template, jsonify
-from project.db import get_mongo_client
+from project.db import get_mongo_db
 
 stats_bp = Blueprint('stats', __name__)
 
@@ -10,12 +10,11 @@ def get_stats():
     Fetches stats from MongoDB using an Aggregation Pipeline.
     Calculates total funding and activity count per year.
     """
-    client = get_mongo_client()
-    if not client: 
+    db = get_mongo_db()
+    if db is None: 
         return jsonify({"error": "Database connection failed"}), 500
     
     try:
-        db = client.get_database("event_calendar")
         
         # Aggregation Pipeline:
         pipeline = [
@@ -40,6 +39,4 @@ def get_stats():
         
     except Exception as e:
         print(f"Stats Error: {e}")
-        return jsonify({"error": str(e)}), 500
-    finally:
-        client.close()
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
\ No newline at end of file
@@ -1,9 +1,17 @@
 # routes/tag.py
 from flask import Blueprint, request, jsonify
-from project.models import db, Tag
+from project.models import db, Tag, EventTag
+from project.services.read_model import sync_community_events
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
 
 tag_bp = Blueprint("tag", __name__)
 
+def _tagged_event_ids(tag_id):
+    """Community events carrying this tag (their feed rows show its name)."""
+    rows = EventTag.query.filter(EventTag.tag_id == tag_id, EventTag.event_id.isnot(None)).all()
+    return {et.event_id for et in rows}
+
 # GET all tags
 @tag_bp.route("/tags", methods=["GET"])
 def get_tags():
@@ -37,6 +45,10 @@ def update_tag(tag_id):
         tag.tag_name = data["tag_name"]
     
     db.session.commit()
+    event_ids = _tagged_event_ids(tag_id)
+    sync_community_events(event_ids)
+    invalidate_feed_cache()
+    invalidate_event_details([f"community_{i}" for i in event_ids])
     return jsonify(tag.as_dict())
 
 # DELETE tag
@@ -45,6 +57,10 @@ def delete_tag(tag_id):
     tag = Tag.query.get(tag_id)
     if not tag:
         return jsonify({"error": "Tag not found"}), 404
+    event_ids = _tagged_event_ids(tag_id)
     db.session.delete(tag)
     db.session.commit()
+    sync_community_events(event_ids)
+    invalidate_feed_cache()
+    invalidate_event_details([f"community_{i}" for i in event_ids])
     return jsonify({"message": "Tag deleted"})
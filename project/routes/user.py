@@ -1,7 +1,11 @@
 # routes/user.py
 from flask import Blueprint, request, jsonify, session
-from project.models import db, User, UserProfile, Event
+from project.models import db, User, UserProfile, Event, Review
 from werkzeug.security import generate_password_hash
+from project.services.read_model import remove_feed_events
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
+from project.services.ratings import apply_review_change, remove_ratings
 import os
 
 user_bp = Blueprint("user", __name__)
@@ -107,11 +111,20 @@ def delete_account():
         if user.profile and user.profile.avatar_url:
             delete_user_avatar(user_id)
         
-        # Step 3: Delete user (cascades will handle all related records)
+        # Step 3: Take the user's reviews out of the rating aggregates, and drop
+        # the aggregates of their events (whose reviews cascade away too)
+        for review in Review.query.filter_by(user_id=user_id).all():
+            apply_review_change(review.event_identifier, old_score=review.score)
+        remove_ratings([f"community_{event.id}" for event in user_events])
+
+        # Step 4: Delete user (cascades will handle all related records)
         db.session.delete(user)
         db.session.commit()
+        remove_feed_events([f"community_{event.id}" for event in user_events])
+        invalidate_feed_cache()
+        invalidate_event_details([f"community_{event.id}" for event in user_events])
         
-        # Step 4: Clear session
+        # Step 5: Clear session
         session.clear()
         
         return jsonify({
@@ -1,6 +1,9 @@
 # routes/user_profile.py
 from flask import Blueprint, request, jsonify
 from project.models import db, UserProfile
+from project.services.read_model import sync_community_events
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
 import os
 import re
 from werkzeug.utils import secure_filename
@@ -192,6 +195,10 @@ def update_my_profile():
     profile.postal_code = postal_code if postal_code else None
     
     db.session.commit()
+    # The creator's avatar is shown on their community events
+    sync_community_events(user_id=session["user_id"])
+    invalidate_feed_cache()
+    invalidate_event_details()
     return jsonify({
         "message": "Profile updated successfully",
         "profile": profile.as_dict()
@@ -1,6 +1,9 @@
 # routes/venue.py
 from flask import Blueprint, request, jsonify
 from project.models import db, Venue
+from project.services.read_model import sync_community_events
+from project.services.feed_cache import invalidate_feed_cache
+from project.services.event_lookup import invalidate_event_details
 
 venue_bp = Blueprint("venue", __name__)
 
@@ -53,6 +56,9 @@ def update_venue(venue_id):
             setattr(venue, field, data[field])
     
     db.session.commit()
+    sync_community_events(venue_id=venue.id)
+    invalidate_feed_cache()
+    invalidate_event_details()
     return jsonify(venue.as_dict())
 
 # DELETE venue
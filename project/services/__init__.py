@@ -0,0 +1,2 @@
+# project/services/__init__.py
+# Shared helpers used by the route blueprints (query planning, caching, lookups).
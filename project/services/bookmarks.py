@@ -0,0 +1,259 @@
+# project/services/bookmarks.py
+"""
+The expanded /api/bookmarks listing: a user's bookmarks with their unified event
+details already attached.
+
+Community events come from one SELECT joining bookmark -> event_cache -> event ->
+venue; official events from one $in query against MongoDB. Pages are ordered by
+bookmark date (newest first, keyset-paged in SQL) or by event date (soonest first,
+TBA last). Official dates live in MongoDB, so the event date order is built in
+Python from all of the user's bookmarks on every page request: O(N) in the
+number of bookmarks per page, fine for personal bookmark lists.
+
+bookmark_status() answers "is it bookmarked?" for many events at once, either
+from one IN query or from the session's cached set of bookmarked ids.
+"""
+import base64
+import json
+import threading
+import uuid
+from datetime import datetime
+from bson import ObjectId
+from flask import current_app
+from sqlalchemy import Integer, and_, cast, or_
+from project.db import get_mongo_db
+from project.models import db, Bookmark, EventCache, Event
+from project.services.event_shape import (
+    shape_official_detail,
+    shape_community_detail,
+    community_detail_options,
+)
+from project.services.event_lookup import FOUND, NOT_FOUND, UNAVAILABLE
+from project.services.event_query import _community_date_bound
+from project.services.ttl_cache import TTLCache, MISSING
+
+BOOKMARK_PAGE_SIZE = 50
+MAX_BOOKMARK_PAGE_SIZE = 200
+BOOKMARK_SORTS = ("bookmarked", "event_date")
+
+MAX_CHECK_IDS = 500  # /bookmarks/check
+
+# Sort key of events without a usable date; "~" sorts after every ISO date
+UNDATED = "~"
+
+_set_cache = None
+_set_cache_lock = threading.Lock()
+
+
+def parse_bookmark_args(args):
+    """Returns (sort, limit, cursor) from the query string. Raises ValueError on bad input."""
+    sort = args.get("sort", "bookmarked")
+    if sort not in BOOKMARK_SORTS:
+        raise ValueError("Invalid sort")
+    limit = args.get("limit")
+    limit = BOOKMARK_PAGE_SIZE if limit in (None, "") else max(1, min(int(limit), MAX_BOOKMARK_PAGE_SIZE))
+    token = args.get("cursor")
+    cursor = decode_bookmark_cursor(token) if token else None
+    if cursor is not None and sort == "bookmarked":
+        cursor = (datetime.fromisoformat(cursor[0]), cursor[1])
+    return sort, limit, cursor
+
+
+def encode_bookmark_cursor(key, bookmark_id):
+    raw = json.dumps([key, bookmark_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_bookmark_cursor(token):
+    """Returns (sort key, bookmark id). Raises ValueError for anything encode_bookmark_cursor didn't produce."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        key, bookmark_id = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    # type() rather than isinstance: JSON true/false would pass as an int
+    if not isinstance(key, str) or type(bookmark_id) is not int:
+        raise ValueError("Invalid cursor")
+    return key, bookmark_id
+
+
+def _bookmark_rows(user_id):
+    """(Bookmark, EventCache, Event or None) rows with community events eagerly loaded."""
+    return (
+        db.session.query(Bookmark, EventCache, Event)
+        .join(EventCache, EventCache.event_identifier == Bookmark.event_identifier)
+        .outerjoin(Event, and_(
+            EventCache.source == "community",
+            Event.id == cast(EventCache.original_id, Integer),
+        ))
+        .options(*community_detail_options())
+        .filter(Bookmark.user_id == user_id)
+    )
+
+
+def _load_official_docs(caches):
+    """{event_identifier: Mongo doc} for the official bookmarks (one $in). Raises if MongoDB is down."""
+    object_ids = {
+        ObjectId(c.original_id): c.event_identifier
+        for c in caches
+        if c.source == "official" and ObjectId.is_valid(c.original_id)
+    }
+    if not object_ids:
+        return {}
+    db_mongo = get_mongo_db()
+    if db_mongo is None:
+        raise RuntimeError("MongoDB unavailable")
+    docs = db_mongo.events.find({"_id": {"$in": list(object_ids)}})
+    return {object_ids[doc["_id"]]: doc for doc in docs}
+
+
+def _event_date_key(cache, event, docs):
+    if event is not None:
+        return event.start_datetime.replace(microsecond=0).isoformat() if event.start_datetime else UNDATED
+    doc = docs.get(cache.event_identifier)
+    bound, _ = _community_date_bound(doc.get("start_date") or "") if doc else (None, None)
+    return bound.isoformat() if bound else UNDATED
+
+
+def _expanded_item(bookmark, cache, event, docs, official_ok):
+    if event is not None:
+        status, detail = FOUND, shape_community_detail(event)
+    elif cache.source == "official" and not official_ok:
+        status, detail = UNAVAILABLE, None
+    elif cache.event_identifier in docs:
+        status, detail = FOUND, shape_official_detail(docs[cache.event_identifier])
+    else:
+        status, detail = NOT_FOUND, None
+    return {
+        "id": bookmark.event_identifier,
+        "bookmarked_at": bookmark.created_at.isoformat() if bookmark.created_at else None,
+        "status": status,
+        "event": detail,
+    }
+
+
+def _official_docs_or_none(caches):
+    try:
+        return _load_official_docs(caches), True
+    except Exception as e:
+        print(f"Bookmark lookup error (official): {e}")
+        return {}, False
+
+
+def load_bookmark_page(user_id, sort="bookmarked", limit=BOOKMARK_PAGE_SIZE, cursor=None):
+    """
+    One page of the user's bookmarks with event details, after the cursor from
+    parse_bookmark_args.
+    Returns (items, next_cursor or None, partial) where partial means MongoDB was
+    unreachable and official events came back with status 'error'.
+    """
+    query = _bookmark_rows(user_id)
+
+    if sort == "bookmarked":
+        if cursor is not None:
+            created_at, bookmark_id = cursor
+            query = query.filter(or_(
+                Bookmark.created_at < created_at,
+                and_(Bookmark.created_at == created_at, Bookmark.id < bookmark_id),
+            ))
+        rows = query.order_by(Bookmark.created_at.desc(), Bookmark.id.desc()).limit(limit + 1).all()
+        page = rows[:limit]
+        docs, official_ok = _official_docs_or_none([cache for _, cache, _ in page])
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1][0]
+            next_cursor = encode_bookmark_cursor(last.created_at.isoformat(), last.id)
+    else:
+        # Every bookmark is needed to order by a date that partly lives in MongoDB
+        rows = query.all()
+        docs, official_ok = _official_docs_or_none([cache for _, cache, _ in rows])
+        keyed = sorted(
+            ((_event_date_key(cache, event, docs), bookmark.id), (bookmark, cache, event))
+            for bookmark, cache, event in rows
+        )
+        if cursor is not None:
+            keyed = [entry for entry in keyed if entry[0] > tuple(cursor)]
+        page = [row for _, row in keyed[:limit]]
+        next_cursor = encode_bookmark_cursor(*keyed[limit - 1][0]) if len(keyed) > limit else None
+
+    items = [_expanded_item(bookmark, cache, event, docs, official_ok) for bookmark, cache, event in page]
+    return items, next_cursor, not official_ok
+
+
+# --- Bulk status checks ---
+
+def get_bookmark_set_cache():
+    """This process's {user_id: (session token, frozenset of bookmarked ids)} cache."""
+    global _set_cache
+    if _set_cache is None:
+        with _set_cache_lock:
+            if _set_cache is None:
+                _set_cache = TTLCache(
+                    current_app.config["BOOKMARK_CACHE_SIZE"],
+                    current_app.config["BOOKMARK_CACHE_TTL_S"],
+                )
+    return _set_cache
+
+
+def new_bookmark_token():
+    """Version tag for a session's view of its bookmarks; changes on every add/remove."""
+    return uuid.uuid4().hex
+
+
+def _bookmark_set(user_id, token):
+    """
+    All of the user's bookmarked ids, cached against the session's token. The set
+    is reloaded when this session's token moves on (its own add/remove, on any
+    worker) or when another session changes the user's bookmarks on this worker.
+    A change another session makes on a different worker doesn't reach this
+    worker's cache: it can serve the old set for up to BOOKMARK_CACHE_TTL_S.
+    """
+    cache = get_bookmark_set_cache()
+    cached = cache.get(user_id)
+    if cached is not MISSING and cached[0] == token:
+        return cached[1]
+    epoch = cache.epoch
+    ids = frozenset(
+        identifier for (identifier,) in
+        db.session.query(Bookmark.event_identifier).filter(Bookmark.user_id == user_id)
+    )
+    cache.set(user_id, (token, ids), epoch=epoch)
+    return ids
+
+
+def bookmark_status(user_id, identifiers, token=None):
+    """
+    {identifier: bool} for every requested id. Uses the session's cached set when
+    a token is given and the cache is enabled, otherwise one IN query.
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    if not identifiers:
+        return {}
+    if token and current_app.config["BOOKMARK_CACHE_TTL_S"] > 0:
+        bookmarked = _bookmark_set(user_id, token)
+    else:
+        bookmarked = {
+            identifier for (identifier,) in
+            db.session.query(Bookmark.event_identifier).filter(
+                Bookmark.user_id == user_id,
+                Bookmark.event_identifier.in_(identifiers),
+            )
+        }
+    return {identifier: identifier in bookmarked for identifier in identifiers}
+
+
+def record_bookmark_change(user_id, old_token, event_identifier, added):
+    """
+    Applies a committed add/remove to the cached set (when it is the caller's
+    current one) and returns the session's new token.
+    """
+    token = new_bookmark_token()
+    if _set_cache is None:
+        return token
+    cached = _set_cache.get(user_id)
+    if cached is not MISSING and old_token and cached[0] == old_token:
+        ids = cached[1] | {event_identifier} if added else cached[1] - {event_identifier}
+        _set_cache.set(user_id, (token, ids))
+    else:
+        _set_cache.delete(user_id)
+    return token
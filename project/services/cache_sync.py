@@ -0,0 +1,73 @@
+# project/services/cache_sync.py
+"""
+Cross-process invalidation for the in-process caches.
+
+Each web worker (and the ETL script) keeps its own caches. When any process
+changes event data it bumps a generation counter in MongoDB ('cache_state');
+every other process notices within CACHE_SYNC_S seconds and clears all of its
+registered caches.
+"""
+import threading
+import time
+from flask import current_app
+from pymongo import ReturnDocument
+from project.db import get_mongo_db
+
+CACHE_STATE_COLLECTION = "cache_state"
+GENERATION_ID = "events"
+
+_caches = []
+_state = {"generation": None, "checked_at": 0.0}
+_lock = threading.Lock()
+
+
+def register_cache(cache):
+    """Adds a TTLCache to the set cleared when another process publishes a change."""
+    _caches.append(cache)
+    return cache
+
+
+def sync_caches():
+    """Clears the registered caches if another process published a change since the last check."""
+    now = time.monotonic()
+    if now - _state["checked_at"] < current_app.config["CACHE_SYNC_S"]:
+        return
+    _state["checked_at"] = now
+    try:
+        db_mongo = get_mongo_db()
+        if db_mongo is None:
+            return
+        doc = db_mongo[CACHE_STATE_COLLECTION].find_one({"_id": GENERATION_ID})
+        generation = doc["generation"] if doc else 0
+    except Exception as e:
+        print(f"Cache generation check failed: {e}")
+        return
+    with _lock:
+        if _state["generation"] is not None and generation != _state["generation"]:
+            for cache in _caches:
+                cache.clear()
+        _state["generation"] = generation
+
+
+def publish_change(db_mongo=None):
+    """Tells every other process to drop its cached event data."""
+    try:
+        db_mongo = db_mongo if db_mongo is not None else get_mongo_db()
+        if db_mongo is None:
+            return
+        doc = db_mongo[CACHE_STATE_COLLECTION].find_one_and_update(
+            {"_id": GENERATION_ID},
+            {"$inc": {"generation": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        with _lock:
+            # This process invalidates its own entries directly; only a bump from
+            # someone else in the meantime requires clearing everything here too
+            previous = _state["generation"]
+            if previous is not None and doc["generation"] != previous + 1:
+                for cache in _caches:
+                    cache.clear()
+            _state["generation"] = doc["generation"]
+    except Exception as e:
+        print(f"Cache invalidation publish error: {e}")
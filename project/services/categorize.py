@@ -0,0 +1,99 @@
+# project/services/categorize.py
+"""
+Keyword-based categories for official (scraped) events.
+The category is computed once when fetch_data.py loads an event and stored on
+the Mongo document as 'category' / 'tags'. Documents loaded before that (until
+backfill_events.py has run) are categorized on read, see category_pattern.
+"""
+import re
+
+CATEGORY_KEYWORDS = {
+    "Comedy": ["comedy", "stand-up", "funny", "sitcom", "humor", "humour"],
+    "Crafts": ["craft", "crafts"],
+    "Dance": ["dance", "disco", "samba", "tango", "waltz"],
+    "Family Friendly": ["family", "kid", "kids"],
+    "Festival": ["festival", "festive", "competition", "fair"],
+    "Film": ["film", "movie", "cinema"],
+    "Food & Drink": ["food", "drink"],
+    "Free": ["free"],
+    "Literature": ["literature", "article", "poetry", "novel", "story"],
+    "Music": ["music", "concert", "band", "orchestra"],
+    "Nightlife": ["night", "party"],
+    "Outdoor": ["outdoor", "outside", "adventure"],
+    "Photography": ["photo", "photography", "picture", "image"],
+    "Tech": ["tech", "technology", "machine"],
+    "Theatre": ["theatre", "theater", "play", "drama", "musical"],
+    "Visual Arts": ["art", "exhibition", "gallery", "painting"],
+    "Wellness": ["health", "wellness", "yoga", "spa", "massage"],
+    "Workshops": ["workshop", "class", "course"],
+}
+
+
+def _compile_keyword_table(categories):
+    """
+    Flattens the categories into (keyword, category) pairs in priority order.
+    A keyword that contains a keyword of the same or an earlier category (e.g.
+    'crafts' -> 'craft', 'musical' -> 'music') can never change the result, so
+    it is dropped from the table.
+    """
+    ranked = [
+        (keyword, category, rank)
+        for rank, (category, keywords) in enumerate(categories.items())
+        for keyword in keywords
+    ]
+    return tuple(
+        (keyword, category)
+        for keyword, category, rank in ranked
+        if not any(
+            other != keyword and other in keyword and other_rank <= rank
+            for other, _, other_rank in ranked
+        )
+    )
+
+
+# Built once at import; categorize_event is called for every ingested/backfilled event
+_KEYWORD_TABLE = _compile_keyword_table(CATEGORY_KEYWORDS)
+
+
+def categorize_event(text):
+    """Returns the first category whose keywords appear in the text, or 'other'."""
+    text_lower = text.lower()
+    for keyword, category in _KEYWORD_TABLE:
+        if keyword in text_lower:
+            return category
+    return "other"
+
+
+def category_pattern(category):
+    """
+    Regex form of categorize_event for one category (in event_category's format),
+    for matching the text of documents that were never categorized at ingest:
+    one of the category's keywords and none of the keywords that win over it
+    ('Other': no keyword at all). None for a category that can't occur.
+    """
+    include, exclude = [], []
+    for keyword, cat in _KEYWORD_TABLE:
+        if cat.replace('-', ' ').title() == category:
+            include.append(re.escape(keyword))
+        elif not include:
+            exclude.append(re.escape(keyword))
+    if not include and category != "Other":
+        return None
+    pattern = "^"
+    if exclude:
+        pattern += "(?!.*(?:" + "|".join(exclude) + "))"
+    if include:
+        pattern += "(?=.*(?:" + "|".join(include) + "))"
+    return pattern
+
+
+def event_category(title, description):
+    """Category in the same format as the SQL tag names (e.g. 'other' -> 'Other')."""
+    cat = categorize_event((title or "") + " " + (description or ""))
+    return cat.replace('-', ' ').title()
+
+
+def category_fields(title, description):
+    """The derived fields stored on an official event document."""
+    cat = event_category(title, description)
+    return {"category": cat, "tags": [cat]}
@@ -0,0 +1,138 @@
+# project/services/event_cache.py
+"""
+Makes sure 'event_cache' rows exist before reviews, bookmarks or event tags
+reference them (they are the foreign-key target for both event sources).
+
+Identifiers already known to have a row are remembered per process (dropped
+when any process publishes an event change, checked every CACHE_SYNC_S), so
+the common case costs no SQL queries. Identifiers new to the process are titled with
+one $in lookup (official) and one IN query (community) and written with a
+single insert-or-ignore statement, without first checking which rows exist:
+rows already there (or created by a concurrent request) are left unchanged.
+"""
+from bson import ObjectId
+from sqlalchemy.dialects import mysql, sqlite
+from project.db import get_mongo_db
+from project.models import db, Event, EventCache
+from project.services.ttl_cache import TTLCache, MISSING
+from project.services.cache_sync import register_cache, sync_caches
+
+OFFICIAL_TITLE = "Official Event"
+COMMUNITY_TITLE = "Community Event"
+
+# Known-present identifiers; cleared with the other caches when any process
+# publishes an event change (event deletion removes cache rows)
+_known = register_cache(TTLCache(50000, 3600))
+
+
+def split_cache_identifiers(identifiers):
+    """Returns ({identifier: (source, original_id)}, [invalid identifiers])."""
+    parsed, invalid = {}, []
+    for identifier in identifiers:
+        source, _, original_id = identifier.partition("_")
+        if source in ("official", "community") and original_id:
+            parsed[identifier] = (source, original_id)
+        else:
+            invalid.append(identifier)
+    return parsed, invalid
+
+
+def _official_titles(original_ids):
+    """{original_id: title} for the official events found (one $in query)."""
+    object_ids = [ObjectId(i) for i in original_ids if ObjectId.is_valid(i)]
+    if not object_ids:
+        return {}
+    try:
+        db_mongo = get_mongo_db()
+        if db_mongo is None:
+            return {}
+        docs = db_mongo.events.find({"_id": {"$in": object_ids}}, {"title": 1})
+        return {str(doc["_id"]): doc.get("title") for doc in docs}
+    except Exception as e:
+        print(f"Mongo Fetch Error: {e}")
+        return {}
+
+
+def _community_titles(original_ids):
+    """{original_id: title} for the community events found (one IN query)."""
+    event_ids = [int(i) for i in original_ids if i.isdigit()]
+    if not event_ids:
+        return {}
+    rows = db.session.query(Event.id, Event.title).filter(Event.id.in_(event_ids))
+    return {str(event_id): title for event_id, title in rows}
+
+
+def upsert_event_cache(rows, update_title=False):
+    """
+    Writes event_cache rows (dicts of the model's columns) in one statement.
+    Existing rows are left alone, or get the new title with update_title=True.
+    Does not commit.
+    """
+    if not rows:
+        return
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ("mysql", "mariadb"):
+        stmt = mysql.insert(EventCache).values(rows)
+        # ON DUPLICATE KEY UPDATE with the key itself is the no-op "ignore"
+        # (unlike INSERT IGNORE it doesn't also swallow other errors)
+        update = {"title": stmt.inserted.title} if update_title else {
+            "event_identifier": stmt.inserted.event_identifier
+        }
+        stmt = stmt.on_duplicate_key_update(**update)
+    else:
+        # Local SQLite databases
+        stmt = sqlite.insert(EventCache).values(rows)
+        if update_title:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["event_identifier"], set_={"title": stmt.excluded.title}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["event_identifier"])
+    db.session.execute(stmt)
+
+
+def ensure_event_cache(identifiers):
+    """
+    Makes sure every identifier has an event_cache row, committing any it had to
+    create. Returns the identifiers that aren't 'official_<id>' / 'community_<id>'.
+    """
+    # Rows deleted by another worker must not be taken as known: the caller's
+    # insert would then fail on the foreign key
+    sync_caches()
+    parsed, invalid = split_cache_identifiers(dict.fromkeys(identifiers))
+    pending = {i: p for i, p in parsed.items() if _known.get(i) is MISSING}
+    if not pending:
+        return invalid
+
+    # No existence check: identifiers new to this process are titled and
+    # written as-is, and rows another request already created are ignored
+    epoch = _known.epoch
+    official = _official_titles([o for s, o in pending.values() if s == "official"])
+    community = _community_titles([o for s, o in pending.values() if s == "community"])
+    rows = []
+    for identifier, (source, original_id) in pending.items():
+        if source == "official":
+            title = official.get(original_id) or OFFICIAL_TITLE
+        else:
+            title = community.get(original_id) or COMMUNITY_TITLE
+        rows.append({
+            "event_identifier": identifier,
+            "source": source,
+            "original_id": original_id,
+            "title": title[:255],
+        })
+    try:
+        upsert_event_cache(rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    for identifier in pending:
+        _known.set(identifier, True, epoch=epoch)
+    return invalid
+
+
+def forget_event_cache(identifiers):
+    """Call after deleting event_cache rows in this process."""
+    _known.delete(*identifiers)
@@ -0,0 +1,174 @@
+# project/services/event_lookup.py
+"""
+Loads event detail payloads (the /api/event/<id> shape) for many unified ids at once:
+one $in query against MongoDB for official events and one IN query against MariaDB
+for community events.
+
+Looked-up payloads are kept in a per-process LRU (EVENT_DETAIL_CACHE_SIZE entries,
+EVENT_DETAIL_CACHE_TTL_S seconds). Unknown ids are cached as misses for
+EVENT_DETAIL_NEGATIVE_TTL_S so repeated 404 probes don't reach the databases.
+Writes call invalidate_event_details().
+"""
+import threading
+from bson import ObjectId
+from flask import current_app
+from project.db import get_mongo_db
+from project.models import Event
+from project.services.event_shape import (
+    shape_official_detail,
+    shape_community_detail,
+    community_detail_options,
+)
+from project.services.read_model import find_feed_details
+from project.services.ttl_cache import TTLCache, MISSING
+from project.services.cache_sync import register_cache, sync_caches, publish_change
+
+# Lookup outcomes per identifier
+FOUND = "ok"
+NOT_FOUND = "not_found"
+INVALID = "invalid"
+UNAVAILABLE = "error"
+
+_detail_cache = None
+_detail_cache_lock = threading.Lock()
+
+
+def split_identifiers(identifiers):
+    """
+    Splits unified ids by source.
+    Returns ({ObjectId: id}, {int: id}, [invalid ids]).
+    """
+    official, community, invalid = {}, {}, []
+    for identifier in identifiers:
+        source, _, native_id = identifier.partition("_")
+        if source == "official" and ObjectId.is_valid(native_id):
+            official[ObjectId(native_id)] = identifier
+        elif source == "community" and native_id.isdigit():
+            community[int(native_id)] = identifier
+        else:
+            invalid.append(identifier)
+    return official, community, invalid
+
+
+def load_official_details(object_ids):
+    """{ObjectId: detail} for the official events that exist. Raises if MongoDB is down."""
+    if not object_ids:
+        return {}
+    db_mongo = get_mongo_db()
+    if db_mongo is None:
+        raise RuntimeError("MongoDB unavailable")
+    docs = db_mongo.events.find({"_id": {"$in": list(object_ids)}})
+    return {doc["_id"]: shape_official_detail(doc) for doc in docs}
+
+
+def load_community_details(event_ids):
+    """{event id: detail} for the community events that exist."""
+    if not event_ids:
+        return {}
+    events = (
+        Event.query.options(*community_detail_options())
+        .filter(Event.id.in_(list(event_ids)))
+        .all()
+    )
+    return {e.id: shape_community_detail(e) for e in events}
+
+
+def load_event_details(identifiers):
+    """
+    Looks up every identifier with at most one query per backend.
+    Returns {identifier: (status, detail or None)} where status is one of
+    FOUND, NOT_FOUND, INVALID or UNAVAILABLE (backend down).
+    """
+    official, community, invalid = split_identifiers(identifiers)
+    results = {identifier: (INVALID, None) for identifier in invalid}
+
+    try:
+        found = load_official_details(official.keys())
+        for object_id, identifier in official.items():
+            detail = found.get(object_id)
+            results[identifier] = (FOUND, detail) if detail else (NOT_FOUND, None)
+    except Exception as e:
+        print(f"Batch lookup error (official): {e}")
+        results.update({identifier: (UNAVAILABLE, None) for identifier in official.values()})
+
+    try:
+        found = load_community_details(community.keys())
+        for event_id, identifier in community.items():
+            detail = found.get(event_id)
+            results[identifier] = (FOUND, detail) if detail else (NOT_FOUND, None)
+    except Exception as e:
+        print(f"Batch lookup error (community): {e}")
+        results.update({identifier: (UNAVAILABLE, None) for identifier in community.values()})
+
+    return results
+
+
+def get_detail_cache():
+    """This process's event detail cache."""
+    global _detail_cache
+    if _detail_cache is None:
+        with _detail_cache_lock:
+            if _detail_cache is None:
+                _detail_cache = register_cache(TTLCache(
+                    current_app.config["EVENT_DETAIL_CACHE_SIZE"],
+                    current_app.config["EVENT_DETAIL_CACHE_TTL_S"],
+                ))
+    return _detail_cache
+
+
+def _load_uncached(identifiers):
+    """Read model first when FEED_READ_MODEL is on, then the primary stores for the rest."""
+    results = {}
+    if current_app.config["FEED_READ_MODEL"]:
+        try:
+            results = {i: (FOUND, d) for i, d in find_feed_details(identifiers).items()}
+        except Exception as e:
+            print(f"Read model batch lookup failed: {e}")
+    results.update(load_event_details([i for i in identifiers if i not in results]))
+    return results
+
+
+def lookup_event_details(identifiers):
+    """
+    load_event_details behind the detail cache (and the 'event_feed' read model
+    when FEED_READ_MODEL is on). Returns {identifier: (status, detail or None)}.
+    """
+    cache = get_detail_cache()
+    sync_caches()
+    epoch = cache.epoch
+
+    results, pending = {}, []
+    for identifier in identifiers:
+        cached = cache.get(identifier)
+        if cached is MISSING:
+            pending.append(identifier)
+        else:
+            results[identifier] = cached
+
+    if pending:
+        loaded = _load_uncached(pending)
+        negative_ttl = current_app.config["EVENT_DETAIL_NEGATIVE_TTL_S"]
+        for identifier, (status, detail) in loaded.items():
+            if status == FOUND:
+                cache.set(identifier, (status, detail), epoch=epoch)
+            elif status == NOT_FOUND:
+                cache.set(identifier, (status, None), negative_ttl, epoch)
+        results.update(loaded)
+    return results
+
+
+def invalidate_event_details(identifiers=None, db_mongo=None):
+    """
+    Drops cached payloads for the given ids (all of them if None) in this process,
+    and tells every other process to drop its cached event data.
+    """
+    if _detail_cache is not None:
+        if identifiers is None:
+            _detail_cache.clear()
+        else:
+            _detail_cache.delete(*identifiers)
+    publish_change(db_mongo)
+
+
+def detail_cache_stats():
+    return _detail_cache.stats() if _detail_cache is not None else None
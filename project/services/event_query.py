@@ -0,0 +1,397 @@
+# project/services/event_query.py
+"""
+Query planning for the unified /api/all-events feed.
+
+Turns the feed's request parameters (source, time, category, q) into a MongoDB
+filter for official events and SQLAlchemy WHERE clauses for community events,
+so each backend only returns rows that can appear in the response.
+"""
+import base64
+import json
+import re
+from datetime import datetime
+from bson import ObjectId
+from sqlalchemy import LargeBinary, and_, cast, false, func, literal, or_, select
+from sqlalchemy.orm import configure_mappers, contains_eager, joinedload, load_only, selectinload
+from project.models import Event, Venue, Tag, EventTag, User, UserProfile
+from project.services.categorize import category_pattern
+
+FEED_SOURCES = ("official", "community")
+
+
+def parse_feed_args(args):
+    """Normalises the feed query string into a plain dict of filters."""
+    return {
+        "category": args.get("category", "all"),
+        "source": args.get("source", "all"),
+        "time": args.get("time", "upcoming"),
+        "sort": args.get("sort", "default"),
+        "q": args.get("q", "").lower(),
+    }
+
+
+def includes_source(params, source):
+    """True if the 'source' filter lets this backend contribute events at all."""
+    return params["source"] in ("all", source)
+
+
+def matches_category(event, params):
+    """Category check on shaped events (a safety net; both backends filter in the query)."""
+    return params["category"] == "all" or event["category"] == params["category"]
+
+
+# --- MongoDB (Official) ---
+
+def legacy_category_filter(category):
+    """
+    Matches documents without a stored 'category' that event_category would put
+    in this category, so results don't depend on backfill_events.py having run.
+    None if no document can be in the category.
+    """
+    pattern = category_pattern(category)
+    if pattern is None:
+        return None
+    text = {"$concat": [
+        {"$ifNull": ["$title", ""]},
+        " ",
+        {"$ifNull": ["$description", ""]},
+    ]}
+    # "s": keywords are matched anywhere in the text, across line breaks
+    match = {"$regexMatch": {"input": text, "regex": pattern, "options": "is"}}
+    return {"category": {"$exists": False}, "$expr": match}
+
+
+def build_mongo_filter(params, now_str):
+    """
+    Builds the 'events' collection filter.
+    Category is matched on the stored 'category' field; documents loaded before
+    that field existed are categorized in the query (see legacy_category_filter).
+    start_date is stored as an ISO string, so time windows are plain string ranges
+    (same comparison the feed used to do in Python). Empty/missing dates never match.
+    """
+    conditions = []
+
+    if params["category"] != "all":
+        # Stored at ingest by fetch_data.py (see services/categorize.py)
+        category = {"category": params["category"]}
+        legacy = legacy_category_filter(params["category"])
+        conditions.append({"$or": [category, legacy]} if legacy else category)
+
+    if params["time"] == "upcoming":
+        conditions.append({"start_date": {"$gte": now_str}})
+    elif params["time"] == "past":
+        conditions.append({"start_date": {"$gt": "", "$lt": now_str}})
+    else:
+        conditions.append({"start_date": {"$gt": ""}})
+
+    if params["q"]:
+        # Search matches "<title> <venue>" as one string, like the old Python filter
+        conditions.append({
+            "$expr": {
+                "$regexMatch": {
+                    "input": {"$concat": [
+                        {"$ifNull": ["$title", "None"]},
+                        " ",
+                        {"$ifNull": ["$venue_name", "None"]},
+                    ]},
+                    "regex": re.escape(params["q"]),
+                    "options": "i",
+                }
+            }
+        })
+
+    return {"$and": conditions} if len(conditions) > 1 else conditions[0]
+
+
+# --- MariaDB (Community) ---
+
+def first_tag_name():
+    """Correlated subquery for an event's first tag (its category in the feed)."""
+    return (
+        select(Tag.tag_name)
+        .join(EventTag, EventTag.tag_id == Tag.id)
+        .where(EventTag.event_id == Event.id)
+        .order_by(EventTag.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def community_feed_options():
+    """
+    Loader options for shaping community feed rows without per-row queries:
+    venue comes from the query's own join, creator + profile are joined in the
+    same SELECT, and all tags (with their names) arrive in one extra SELECT.
+    Only the columns the feed shows are loaded.
+    """
+    configure_mappers()  # backref attributes (Event.venue / Event.creator) must exist
+    return (
+        load_only(
+            Event.id, Event.user_id, Event.venue_id, Event.title,
+            Event.description, Event.start_datetime, Event.image_url,
+        ),
+        contains_eager(Event.venue).load_only(Venue.name, Venue.address),
+        joinedload(Event.creator)
+        .load_only(User.id, User.username)
+        .joinedload(User.profile)
+        .load_only(UserProfile.avatar_url),
+        selectinload(Event.tags)
+        .load_only(EventTag.id, EventTag.tag_id, EventTag.event_id)
+        .joinedload(EventTag.tag)
+        .load_only(Tag.tag_name),
+    )
+
+
+def build_community_query(params, now):
+    """
+    Builds the community Event query with the feed filters applied in SQL.
+    Community start_date is rendered as '<iso>Z', which sorts after any local
+    'now' string in the same second, hence the comparison on whole seconds.
+    """
+    query = Event.query.outerjoin(Venue, Event.venue_id == Venue.id)
+    now_floor = now.replace(microsecond=0)
+
+    if params["time"] == "upcoming":
+        query = query.filter(Event.start_datetime >= now_floor)
+    elif params["time"] == "past":
+        query = query.filter(Event.start_datetime < now_floor)
+
+    if params["q"]:
+        search_text = func.lower(
+            func.coalesce(Event.title, "None") + " " + func.coalesce(Venue.name, "TBA")
+        )
+        query = query.filter(search_text.contains(params["q"], autoescape=True))
+
+    if params["category"] != "all":
+        tag_name = first_tag_name()
+        if params["category"] == "Other":
+            query = query.filter(or_(tag_name == "Other", tag_name.is_(None)))
+        else:
+            query = query.filter(tag_name == params["category"])
+
+    return query
+
+
+# --- Time windows ---
+
+def next_time_boundary(now, db_mongo=None):
+    """
+    Earliest moment (naive local datetime) at which an event leaves the 'upcoming'
+    window and enters 'past', or None if no event is pending or it cannot be told.
+    Responses for time=upcoming/past stay correct until then.
+    """
+    now_str = now.isoformat()
+    boundaries = []
+
+    if db_mongo is not None:
+        doc = db_mongo.events.find_one(
+            {"start_date": {"$gte": now_str}}, {"start_date": 1}, sort=[("start_date", 1)]
+        )
+        if doc:
+            bound, _ = _community_date_bound(doc["start_date"])
+            if bound is None:
+                return None
+            boundaries.append(bound)
+
+    first_community = (
+        Event.query.with_entities(func.min(Event.start_datetime))
+        .filter(Event.start_datetime >= now.replace(microsecond=0))
+        .scalar()
+    )
+    if first_community is not None:
+        boundaries.append(first_community)
+
+    return min(boundaries) if boundaries else None
+
+
+# --- Sorting & keyset pagination ---
+#
+# Every feed row has a position (sort value, source rank, native id). Official rows
+# (rank 0) come before community rows (rank 1) on equal sort values, matching the
+# old "Mongo first, then MySQL" stable sort. Ties always break ascending, even for
+# the *_desc modes. A cursor is just the position of the last row on the page.
+
+DEFAULT_PAGE_SIZE = 60
+MAX_PAGE_SIZE = 200
+SOURCE_RANK = {"official": 0, "community": 1}
+
+
+def parse_page_size(value):
+    """Parses the 'limit' argument. Returns None when pagination is not requested."""
+    if value in (None, ""):
+        return None
+    limit = int(value)
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def resolve_sort(params):
+    """Returns (field, descending) for the requested sort mode."""
+    sort_option = params["sort"]
+    if sort_option == "title_asc":
+        return "title", False
+    if sort_option == "title_desc":
+        return "title", True
+    if sort_option == "date_desc":
+        return "date", True
+    if sort_option == "date_asc":
+        return "date", False
+    # Smart Default: Upcoming = Soonest First, Past = Most Recent First
+    return "date", params["time"] == "past"
+
+
+def sort_value(event, field):
+    if field == "title":
+        return (event.get("title") or "").lower()
+    return event.get("start_date") or ""
+
+
+def event_position(event, field):
+    """Keyset position of a shaped feed event."""
+    source, native_id = event["id"].split("_", 1)
+    if source == "community":
+        native_id = int(native_id)
+    return (sort_value(event, field), SOURCE_RANK[source], native_id)
+
+
+def encode_cursor(position):
+    raw = json.dumps(list(position), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Decodes an opaque cursor. Raises ValueError if it was not produced by encode_cursor."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        value, rank, native_id = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    # type() rather than isinstance/==: JSON true/false and 1.0 must not pass as ints
+    if not isinstance(value, str) or type(rank) is not int or rank not in (0, 1):
+        raise ValueError("Invalid cursor")
+    if rank == 1 and type(native_id) is not int:
+        raise ValueError("Invalid cursor")
+    if rank == 0 and not ObjectId.is_valid(native_id):
+        raise ValueError("Invalid cursor")
+    return (value, rank, native_id)
+
+
+def is_after(position, cursor, descending):
+    """True if a row at 'position' comes strictly after 'cursor' in the feed order."""
+    if cursor is None:
+        return True
+    if position[0] != cursor[0]:
+        return position[0] < cursor[0] if descending else position[0] > cursor[0]
+    return position[1:] > cursor[1:]
+
+
+def order_events(events, field, descending):
+    """Sorts shaped events into feed order (value, then ascending tie-break)."""
+    events.sort(key=lambda e: event_position(e, field)[1:])
+    events.sort(key=lambda e: sort_value(e, field), reverse=descending)
+    return events
+
+
+def collect_page(fetch_chunk, accept, cursor, limit, field):
+    """
+    Pulls rows from one backend in keyset order until 'limit' rows pass 'accept'.
+    fetch_chunk(after, size) must return shaped events strictly after 'after'.
+    With limit=None everything after the cursor is returned in one fetch.
+    """
+    if limit is None:
+        return [e for e in fetch_chunk(cursor, None) if accept(e)]
+
+    results = []
+    after = cursor
+    while len(results) < limit:
+        chunk = fetch_chunk(after, limit)
+        for e in chunk:
+            if accept(e):
+                results.append(e)
+                if len(results) == limit:
+                    break
+        if len(chunk) < limit:
+            break
+        after = event_position(chunk[-1], field)
+    return results
+
+
+def mongo_sort(field, descending):
+    direction = -1 if descending else 1
+    key = "title_sort" if field == "title" else "start_date"
+    return [(key, direction), ("_id", 1)]
+
+
+def mongo_range(field, descending, cursor):
+    """Mongo condition selecting official rows after the cursor (None for the first page)."""
+    if cursor is None:
+        return None
+    key = "title_sort" if field == "title" else "start_date"
+    value, rank, native_id = cursor
+    op = "$lt" if descending else "$gt"
+    if rank != SOURCE_RANK["official"]:
+        # Cursor sits on a community row; official rows with the same value came before it
+        return {key: {op: value}}
+    return {"$or": [
+        {key: {op: value}},
+        {key: value, "_id": {"$gt": ObjectId(native_id)}},
+    ]}
+
+
+def _community_date_bound(value):
+    """
+    Maps a start_date string to a whole-second datetime for range queries on
+    Event.start_datetime. Returns (bound, rendered) where rendered is the bound's
+    own '<iso>Z' string, or (None, None) if the value is not a date.
+    """
+    text = value[:-1] if value.endswith("Z") else value
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            parsed = datetime.strptime(value[:10], "%Y-%m-%d")
+        except ValueError:
+            return None, None
+    bound = parsed.replace(tzinfo=None, microsecond=0)
+    return bound, bound.isoformat() + "Z"
+
+
+def _community_compare(field, op, value):
+    """SQL clause equivalent to '<community sort value> <op> value'."""
+    if field == "title":
+        column = cast(func.lower(Event.title), LargeBinary)
+        bound = literal(value.encode("utf-8"), LargeBinary)
+        return {">": column > bound, "<": column < bound, "==": column == bound}[op]
+
+    bound, rendered = _community_date_bound(value)
+    if bound is None:
+        return None
+    column = Event.start_datetime
+    if op == "==":
+        return column == bound if rendered == value else false()
+    strict = column > bound if op == ">" else column < bound
+    rendered_matches = rendered > value if op == ">" else rendered < value
+    return or_(strict, column == bound) if rendered_matches else strict
+
+
+def community_order(field, descending):
+    if field == "title":
+        column = cast(func.lower(Event.title), LargeBinary)
+    else:
+        column = Event.start_datetime
+    return [column.desc() if descending else column.asc(), Event.id.asc()]
+
+
+def community_range(field, descending, cursor):
+    """SQL condition selecting community rows after the cursor (None = no bound)."""
+    if cursor is None:
+        return None
+    value, rank, native_id = cursor
+    op = "<" if descending else ">"
+    past_value = _community_compare(field, op, value)
+    same_value = _community_compare(field, "==", value)
+    if past_value is None:
+        return None
+    if rank == SOURCE_RANK["official"]:
+        # Community rows with the cursor's value come after an official cursor row
+        return or_(past_value, same_value)
+    return or_(past_value, and_(same_value, Event.id > native_id))
@@ -0,0 +1,118 @@
+# project/services/event_shape.py
+"""
+Shapes official (Mongo) and community (MariaDB) events into the unified JSON
+payloads used by the feed ("feed rows") and the event detail page ("details").
+"""
+from datetime import timedelta
+from sqlalchemy.orm import configure_mappers, joinedload, selectinload
+from project.models import Event, EventTag, User
+from project.services.categorize import event_category
+
+
+def official_category(doc):
+    """Category is stored at ingest; only documents loaded before that need it computed."""
+    return doc.get("category") or event_category(doc.get("title"), doc.get("description"))
+
+
+def shape_official_event(e):
+    """Shapes a Mongo 'events' document into a feed row."""
+    cat = official_category(e)
+    start_date = e.get("start_date")
+    return {
+        "id": f"official_{str(e['_id'])}",
+        "title": e.get("title"),
+        "description": e.get("description"),
+        "date": start_date if start_date else "TBA",
+        "venue": e.get("venue_name"),
+        "location": e.get("address"),
+        "image": e.get("image_url"),
+        "category": cat,
+        "source": "official",
+        "start_date": start_date,
+        "tags": [cat],
+    }
+
+
+def shape_official_detail(event):
+    """Shapes a Mongo 'events' document for the event detail page."""
+    start_date_raw = event.get("start_date", "")
+    cat = official_category(event)
+    return {
+        "id": f"official_{str(event['_id'])}",
+        "title": event.get("title"),
+        "description": event.get("description"),
+        "start_date": start_date_raw,
+        "end_date": event.get("end_date"),
+        "date": start_date_raw if start_date_raw else "Date TBA",
+        "venue": event.get("venue_name"),
+        "address": event.get("address"),
+        "image": event.get("image_url"),
+        "registration_link": event.get("registration_link"),
+        "source": "official",
+        "tags": [cat],
+        "category": cat,
+    }
+
+
+def _creator_data(e):
+    creator_profile = e.creator.profile if e.creator else None
+    return (
+        {
+            "id": e.creator.id,
+            "username": e.creator.username,
+            "avatar": creator_profile.avatar_url if creator_profile else None,
+        }
+        if e.creator
+        else None
+    )
+
+
+def shape_community_event(e):
+    """Shapes a community Event row into a feed row."""
+    venue = e.venue
+    tags = [t.tag.tag_name for t in e.tags] if e.tags else []
+    cat = tags[0] if tags else "Other"
+    sg_time = e.start_datetime + timedelta(hours=8) if e.start_datetime else None
+    return {
+        "id": f"community_{e.id}",
+        "title": e.title,
+        "description": e.description,
+        "date": (sg_time.strftime("%Y-%m-%d %H:%M") if sg_time else "TBA"),
+        "venue": venue.name if venue else "TBA",
+        "location": venue.address if venue else "",
+        "image": e.image_url,
+        "category": cat,
+        "source": "community",
+        "start_date": (e.start_datetime.isoformat() + "Z") if e.start_datetime else "",
+        "tags": tags,
+        "creator": _creator_data(e),
+    }
+
+
+def shape_community_detail(e):
+    """Shapes a community Event row for the event detail page."""
+    sg_time = e.start_datetime + timedelta(hours=8) if e.start_datetime else None
+    return {
+        "id": f"community_{e.id}",
+        "title": e.title,
+        "description": e.description,
+        "start_date": (e.start_datetime.isoformat() + "Z") if e.start_datetime else "",
+        "end_date": (e.end_datetime.isoformat() + "Z") if e.end_datetime else None,
+        "date": sg_time.strftime("%Y-%m-%d %H:%M") if sg_time else "Date TBA",
+        "venue": e.venue.name if e.venue else "TBA",
+        "address": e.venue.address if e.venue else "",
+        "image": e.image_url,
+        "source": "community",
+        "creator": _creator_data(e),
+        "tags": [t.tag.tag_name for t in e.tags] if e.tags else [],
+    }
+
+
+def community_detail_options():
+    """Eager loads venue, creator/profile and tags so shaping needs no extra queries."""
+    configure_mappers()  # backref attributes (Event.venue / Event.creator) must exist
+    return (
+        joinedload(Event.venue),
+        joinedload(Event.creator).joinedload(User.profile),
+        selectinload(Event.tags).joinedload(EventTag.tag),
+    )
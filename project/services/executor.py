@@ -0,0 +1,132 @@
+# project/services/executor.py
+"""
+Bounded thread pools for fanning out backend calls (MongoDB / MariaDB) inside a request.
+
+Each backend gets its own pool (FANOUT_WORKERS threads), so calls stuck on a slow
+backend can only exhaust that backend's pool and never queue up the healthy
+one's work. Callers should also bound the work itself to its time budget
+(max_time_ms for MongoDB, statement_budget for MariaDB): a future that misses
+its deadline can't be interrupted once it's running.
+
+Work submitted through submit_in_app_context runs inside its own Flask app context,
+so Flask-SQLAlchemy gives the worker its own scoped session and removes it afterwards.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from project.models import db
+
+DEFAULT_WORKERS = 8
+MONGO_POOL = "mongo"
+MARIADB_POOL = "mariadb"
+
+_executors = {}
+_executor_pid = os.getpid()
+_executor_lock = threading.Lock()
+
+
+def _reset_executor_after_fork():
+    """Worker threads do not survive fork(); the child builds its own pools on first use."""
+    global _executor_pid, _executor_lock
+    _executors.clear()
+    _executor_pid = os.getpid()
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor_after_fork)
+
+
+def get_executor(pool=MARIADB_POOL):
+    """Returns this process's executor for one backend (sized by the FANOUT_WORKERS config)."""
+    if os.getpid() != _executor_pid:
+        _reset_executor_after_fork()
+    executor = _executors.get(pool)
+    if executor is None:
+        with _executor_lock:
+            executor = _executors.get(pool)
+            if executor is None:
+                workers = int(current_app.config.get("FANOUT_WORKERS", DEFAULT_WORKERS))
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"fanout-{pool}")
+                _executors[pool] = executor
+    return executor
+
+
+def submit_in_app_context(fn, *args, pool=MARIADB_POOL, **kwargs):
+    """
+    Runs fn(*args, **kwargs) on the given backend's executor inside a fresh app context.
+    The future resolves to (result, elapsed_ms).
+    """
+    app = current_app._get_current_object()
+
+    def run():
+        start = time.perf_counter()
+        with app.app_context():
+            result = fn(*args, **kwargs)
+        return result, (time.perf_counter() - start) * 1000
+
+    return get_executor(pool).submit(run)
+
+
+# Connection execution option read by _apply_statement_budget (seconds)
+STATEMENT_BUDGET_OPTION = "max_statement_time"
+
+
+@event.listens_for(Engine, "before_cursor_execute", retval=True)
+def _apply_statement_budget(conn, cursor, statement, parameters, context, executemany):
+    """
+    Prefixes SELECTs on a connection with a statement budget with MariaDB's
+    SET STATEMENT ... FOR, so the limit lives on the statement and nothing is
+    left set on the pooled connection.
+    """
+    budget = conn.get_execution_options().get(STATEMENT_BUDGET_OPTION)
+    if (budget and conn.dialect.name == "mysql"
+            and statement.lstrip()[:6].upper() == "SELECT"):
+        statement = f"SET STATEMENT max_statement_time={budget:g} FOR {statement}"
+    return statement, parameters
+
+
+@contextmanager
+def statement_budget(timeout_ms):
+    """
+    Makes MariaDB abort any query in this block (on this worker's session) that
+    runs longer than timeout_ms. A no-op on other databases. Must be the first
+    use of the session in its transaction; the transaction ends with the block.
+    """
+    db.session.connection(execution_options={STATEMENT_BUDGET_OPTION: timeout_ms / 1000.0})
+    try:
+        yield
+    finally:
+        # The option belongs to this transaction's connection only
+        db.session.rollback()
+
+
+def gather(futures, timeouts_ms):
+    """
+    Waits for a dict of {name: future}, each with its own timeout (ms) counted from now.
+    Returns {name: {"status": "ok"|"timeout"|"error", "result": ..., "ms": ...}}.
+    A future that misses its deadline is cancelled if it hasn't started yet; one
+    that is already running finishes in its pool and its result is dropped.
+    """
+    start = time.perf_counter()
+    outcomes = {}
+    for name, future in futures.items():
+        timeout_ms = timeouts_ms[name]
+        remaining = start + timeout_ms / 1000.0 - time.perf_counter()
+        try:
+            result, elapsed_ms = future.result(timeout=max(0.0, remaining))
+            outcomes[name] = {"status": "ok", "result": result, "ms": round(elapsed_ms, 1)}
+        except FutureTimeout:
+            future.cancel()
+            print(f"Fan-out '{name}' timed out after {timeout_ms}ms")
+            outcomes[name] = {"status": "timeout", "result": None, "ms": timeout_ms}
+        except Exception as e:
+            print(f"Fan-out '{name}' failed: {e}")
+            outcomes[name] = {"status": "error", "result": None, "ms": None}
+    return outcomes
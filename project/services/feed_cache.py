@@ -0,0 +1,97 @@
+# project/services/feed_cache.py
+"""
+Response cache for /api/all-events.
+
+Entries are keyed by the normalised feed parameters and live for FEED_CACHE_TTL_S
+seconds at most. Responses that depend on 'now' (time=upcoming/past) also expire
+at the next moment an event moves from upcoming to past.
+
+Writes call invalidate_feed_cache(), which clears this process's cache and tells
+the other processes to clear theirs (see services/cache_sync.py).
+"""
+import threading
+from datetime import datetime
+from flask import current_app
+from project.db import get_mongo_db
+from project.services.ttl_cache import TTLCache, MISSING
+from project.services.event_query import next_time_boundary
+from project.services.cache_sync import register_cache, sync_caches, publish_change
+
+# Maximum time a computed upcoming/past boundary is trusted without a write
+BOUNDARY_TTL_S = 3600
+
+_feed_cache = None
+_boundary_cache = register_cache(TTLCache(1, BOUNDARY_TTL_S))
+_feed_cache_lock = threading.Lock()
+
+
+def get_feed_cache():
+    """This process's feed cache (sized by FEED_CACHE_SIZE / FEED_CACHE_TTL_S)."""
+    global _feed_cache
+    if _feed_cache is None:
+        with _feed_cache_lock:
+            if _feed_cache is None:
+                _feed_cache = register_cache(TTLCache(
+                    current_app.config["FEED_CACHE_SIZE"], current_app.config["FEED_CACHE_TTL_S"]
+                ))
+    return _feed_cache
+
+
+def feed_cache_key(params, field, descending, limit, cursor_token, read_model):
+    return (
+        params["category"], params["source"], params["time"], field, descending,
+        params["q"], limit, cursor_token, read_model,
+    )
+
+
+def lookup_feed_response(key):
+    """Returns (cached response or MISSING, epoch to pass to store_feed_response)."""
+    cache = get_feed_cache()
+    sync_caches()
+    epoch = cache.epoch
+    return cache.get(key), epoch
+
+
+def _seconds_until_boundary(now):
+    """Seconds from 'now' until the next upcoming -> past transition (None if there is none)."""
+    epoch = _boundary_cache.epoch
+    boundary = _boundary_cache.get("boundary")
+    if boundary is MISSING:
+        boundary = next_time_boundary(now, get_mongo_db())
+        if boundary is not None:
+            _boundary_cache.set("boundary", boundary, (boundary - now).total_seconds(), epoch)
+    if boundary is None:
+        return None
+    return (boundary - now).total_seconds()
+
+
+def store_feed_response(key, params, response, now, epoch):
+    """Caches a response computed at 'now'."""
+    cache = get_feed_cache()
+    if cache.ttl_seconds <= 0:
+        return
+    ttl = None
+    if params["time"] in ("upcoming", "past"):
+        try:
+            ttl = _seconds_until_boundary(now)
+        except Exception as e:
+            print(f"Feed cache boundary lookup failed: {e}")
+            return
+        if ttl is not None:
+            # Measured from when the response was computed, not from now
+            ttl -= (datetime.now() - now).total_seconds()
+            if ttl <= 0:
+                return
+    cache.set(key, response, ttl, epoch)
+
+
+def invalidate_feed_cache(db_mongo=None):
+    """Drops cached feed responses here and, via MongoDB, in every other process."""
+    if _feed_cache is not None:
+        _feed_cache.clear()
+    _boundary_cache.clear()
+    publish_change(db_mongo)
+
+
+def feed_cache_stats():
+    return _feed_cache.stats() if _feed_cache is not None else None
@@ -0,0 +1,104 @@
+# project/services/http_cache.py
+"""
+On-disk HTTP cache for the scrapers (used by PageFetcher).
+
+Every fetched page is stored as <sha1 of url>.body plus a .json file with its
+ETag / Last-Modified validators and a SHA-256 of the body. The next run sends
+If-None-Match / If-Modified-Since and rebuilds the response from disk on a 304.
+
+The metadata also remembers the hash of the version last loaded into the
+database (mark_loaded), so a page whose body hasn't changed since then can skip
+parsing and loading entirely. In replay mode nothing goes to the network.
+"""
+import hashlib
+import json
+import os
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheMiss(requests.exceptions.RequestException):
+    """Replay mode was asked for a page that isn't in the cache."""
+
+
+def body_hash(body):
+    return hashlib.sha256(body).hexdigest()
+
+
+class PageCache:
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url, suffix):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+
+    def _write(self, path, data):
+        # Write-then-rename so an interrupted run never leaves half a file behind
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def meta(self, url):
+        """The stored metadata for url, or None."""
+        try:
+            with open(self._path(url, ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def body(self, url):
+        with open(self._path(url, ".body"), "rb") as f:
+            return f.read()
+
+    def conditional_headers(self, meta):
+        """Validators to send with the next request for a cached page."""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, url, response, previous=None):
+        """Saves a 200 response. Returns the new metadata."""
+        body = response.content
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "sha256": body_hash(body),
+            "fetched_at": time.time(),
+            "loaded_sha256": (previous or {}).get("loaded_sha256"),
+        }
+        self._write(self._path(url, ".body"), body)
+        self._write(self._path(url, ".json"), json.dumps(meta).encode("utf-8"))
+        return meta
+
+    def response(self, url, meta):
+        """A requests.Response rebuilt from the cached copy of url."""
+        try:
+            body = self.body(url)
+        except OSError:
+            raise CacheMiss(f"Cached body missing for {url}")
+        response = requests.models.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": meta.get("content_type") or "text/html"}
+        )
+        return response
+
+    def mark_loaded(self, urls):
+        """Records that the current cached version of each url is in the database."""
+        for url in urls:
+            meta = self.meta(url)
+            if meta and meta.get("loaded_sha256") != meta["sha256"]:
+                meta["loaded_sha256"] = meta["sha256"]
+                self._write(self._path(url, ".json"), json.dumps(meta).encode("utf-8"))
@@ -0,0 +1,228 @@
+# project/services/http_fetch.py
+"""
+Concurrent page fetching for the scrapers in fetch_data.py.
+
+One PageFetcher per sync run shares a keep-alive requests.Session (so pages
+from the same site reuse connections), caps how many requests run against
+each host at once, retries timeouts / connection errors / 429 / 5xx with
+exponential backoff, and gives up on anything still pending when the run's
+deadline passes. fetch_all returns every page at once; iter_fetch streams them
+with a bounded number in flight.
+
+With a PageCache (SCRAPE_CACHE_DIR) requests are conditional, and responses
+carry .unchanged = True when the body is the version already loaded into the
+database, so scrapers can skip parsing it. replay=True serves only from the cache.
+"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from project.services.http_cache import PageCache, CacheMiss
+
+# Each one can be overridden via an environment variable of the same name.
+FETCH_CONFIG_DEFAULTS = {
+    "SCRAPE_WORKERS": 16,          # detail pages fetched at once, across all hosts
+    "SCRAPE_PER_HOST": 4,          # ... and against any single host
+    "SCRAPE_RETRIES": 3,           # extra attempts after the first
+    "SCRAPE_BACKOFF_S": 0.5,       # first retry delay; doubles each attempt
+    "SCRAPE_TIMEOUT_S": 10,        # per request (connect and read)
+    "SCRAPE_DEADLINE_S": 600,      # whole sync run
+    "SCRAPE_IN_FLIGHT": 32,        # fetches started ahead of a streaming consumer (iter_fetch)
+    "SCRAPE_CACHE_DIR": ".scrape_cache",  # on-disk HTTP cache ("" disables it)
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+USER_AGENT = "event-calendar-sync/1.0"
+
+
+def fetch_settings():
+    return {
+        key: type(default)(os.getenv(key, default))
+        for key, default in FETCH_CONFIG_DEFAULTS.items()
+    }
+
+
+class DeadlineExceeded(requests.exceptions.RequestException):
+    """The run's deadline passed before the page could be fetched."""
+
+
+class PageFetcher:
+    def __init__(self, workers=None, per_host=None, retries=None, backoff_s=None,
+                 timeout_s=None, deadline_s=None, cache_dir=None, replay=False, skip_unchanged=True):
+        settings = fetch_settings()
+        self.workers = workers or settings["SCRAPE_WORKERS"]
+        self.per_host = per_host or settings["SCRAPE_PER_HOST"]
+        self.retries = settings["SCRAPE_RETRIES"] if retries is None else retries
+        self.backoff_s = settings["SCRAPE_BACKOFF_S"] if backoff_s is None else backoff_s
+        self.timeout_s = timeout_s or settings["SCRAPE_TIMEOUT_S"]
+        self.deadline = time.monotonic() + (deadline_s or settings["SCRAPE_DEADLINE_S"])
+        self.in_flight = max(settings["SCRAPE_IN_FLIGHT"], 1)
+
+        cache_dir = settings["SCRAPE_CACHE_DIR"] if cache_dir is None else cache_dir
+        self.cache = PageCache(cache_dir) if cache_dir else None
+        if replay and self.cache is None:
+            raise ValueError("Replay mode needs SCRAPE_CACHE_DIR")
+        self.replay = replay
+        # Replayed pages are always parsed, so offline runs exercise the whole pipeline
+        self.skip_unchanged = skip_unchanged and not replay
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        # Enough pooled connections per host for every concurrent request to keep its own
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(self.per_host, self.workers))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+        # Updated from the fetch threads
+        self._counters_lock = threading.Lock()
+        self.counters = {
+            "requests": 0, "retries": 0, "failures": 0, "not_modified": 0, "replayed": 0, "unchanged": 0,
+        }
+
+    def _count(self, name):
+        with self._counters_lock:
+            self.counters[name] += 1
+
+    def remaining(self):
+        return self.deadline - time.monotonic()
+
+    def _slot(self, url):
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def fetch(self, url, timeout_s=None):
+        """
+        GETs one page (with retries, through the cache). Returns the Response; raises
+        a requests RequestException once retries or the deadline run out.
+        """
+        meta = self.cache.meta(url) if self.cache else None
+        if self.replay:
+            if meta is None:
+                raise CacheMiss(f"Not in the scrape cache: {url}")
+            self._count("replayed")
+            response = self.cache.response(url, meta)
+            response.unchanged = False
+            return response
+
+        response = self._get(url, timeout_s, self.cache.conditional_headers(meta) if meta else {})
+        if response.status_code == 304:
+            if meta is None:
+                raise requests.exceptions.HTTPError(f"Unexpected 304 for {url}", response=response)
+            self._count("not_modified")
+            response = self.cache.response(url, meta)
+        elif self.cache:
+            meta = self.cache.store(url, response, meta)
+
+        response.unchanged = bool(
+            self.skip_unchanged and meta and meta.get("loaded_sha256") == meta["sha256"]
+        )
+        if response.unchanged:
+            self._count("unchanged")
+        return response
+
+    def mark_loaded(self, urls):
+        """Call once the pages' events are in the database; unchanged re-fetches are then skipped."""
+        if self.cache:
+            self.cache.mark_loaded(urls)
+
+    def is_loaded(self, url):
+        """Whether some version of url has been loaded into the database (per the cache)."""
+        meta = self.cache.meta(url) if self.cache else None
+        return bool(meta and meta.get("loaded_sha256"))
+
+    def _get(self, url, timeout_s, headers):
+        timeout_s = timeout_s or self.timeout_s
+        attempt = 0
+        while True:
+            remaining = self.remaining()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Deadline passed before fetching {url}")
+            try:
+                with self._slot(url):
+                    self._count("requests")
+                    response = self.session.get(url, headers=headers, timeout=min(timeout_s, remaining))
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                error = requests.exceptions.HTTPError(
+                    f"{response.status_code} for {url}", response=response
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+
+            if attempt >= self.retries:
+                raise error
+            attempt += 1
+            self._count("retries")
+            # Exponential backoff with jitter so parallel retries don't line up
+            delay = self.backoff_s * (2 ** (attempt - 1)) * (0.5 + random.random())
+            if delay >= self.remaining():
+                raise error
+            time.sleep(delay)
+
+    def iter_fetch(self, urls, timeout_s=None, in_flight=None):
+        """
+        Fetches pages concurrently and yields (url, Response or the exception raised)
+        as each one finishes. At most in_flight (SCRAPE_IN_FLIGHT) fetches are
+        started ahead of the consumer, so a slow consumer holds back new requests.
+        Pages still pending at the deadline get DeadlineExceeded.
+        """
+        urls = iter(dict.fromkeys(urls))
+        in_flight = in_flight or self.in_flight
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scrape")
+        pending = {}
+        try:
+            while True:
+                for url in urls:
+                    pending[pool.submit(self.fetch, url, timeout_s)] = url
+                    if len(pending) >= in_flight:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, timeout=max(self.remaining(), 0), return_when=FIRST_COMPLETED)
+                if not done:
+                    # Deadline: everything in flight or not yet started is given up
+                    for future in pending:
+                        future.cancel()
+                    for url in list(pending.values()) + list(urls):
+                        self._count("failures")
+                        yield url, DeadlineExceeded(f"Deadline passed fetching {url}")
+                    return
+                for future in done:
+                    url = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self._count("failures")
+                        result = e
+                    yield url, result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_all(self, urls, timeout_s=None):
+        """
+        Fetches many pages concurrently. Returns {url: Response or the exception
+        raised}; pages still pending at the deadline get DeadlineExceeded.
+        """
+        urls = list(urls)
+        return dict(self.iter_fetch(urls, timeout_s, in_flight=max(len(urls), 1)))
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,120 @@
+# project/services/ratings.py
+"""
+Per-event rating aggregates (count, sum, 1-5 histogram) kept in the 'event_rating'
+table, so averages never need the review rows.
+
+apply_review_change() only stages SQL on the current session; the caller's
+commit makes the review and its aggregate change atomic.
+"""
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
+from project.models import db, Review, EventRating
+
+RATING_SCORES = range(1, 6)
+MAX_RATING_IDS = 500  # /ratings?ids=
+
+
+def empty_rating():
+    return {"count": 0, "average": None, "histogram": {str(s): 0 for s in RATING_SCORES}}
+
+
+def _score_column(score):
+    return f"score_{score}" if score in RATING_SCORES else None
+
+
+def apply_review_change(event_identifier, old_score=None, new_score=None):
+    """
+    Stages the aggregate update for one review being added (new_score only),
+    removed (old_score only) or re-scored (both). Scores outside 1-5 still count
+    towards count/sum but have no histogram bucket.
+    """
+    count_delta = (new_score is not None) - (old_score is not None)
+    deltas = {"review_count": count_delta, "score_sum": (new_score or 0) - (old_score or 0)}
+    for score, step in ((old_score, -1), (new_score, 1)):
+        column = _score_column(score)
+        if column:
+            deltas[column] = deltas.get(column, 0) + step
+
+    # Relative UPDATE so concurrent reviews of the same event never lose increments
+    values = {getattr(EventRating, k): getattr(EventRating, k) + v for k, v in deltas.items() if v}
+    if not values:
+        return
+    updated = (
+        EventRating.query.filter_by(event_identifier=event_identifier)
+        .update(values, synchronize_session=False)
+    )
+    if updated or count_delta <= 0:
+        # No row to edit or remove from means the table predates these reviews;
+        # rebuild_ratings.py reconciles that
+        return
+
+    # First review of this event: create its row (or retry if another request just did)
+    try:
+        with db.session.begin_nested():
+            initial = {f"score_{s}": 0 for s in RATING_SCORES}
+            initial.update(deltas)
+            db.session.add(EventRating(event_identifier=event_identifier, **initial))
+    except IntegrityError:
+        EventRating.query.filter_by(event_identifier=event_identifier).update(
+            values, synchronize_session=False
+        )
+
+
+def remove_ratings(event_identifiers):
+    """Stages deletion of the aggregates of deleted events."""
+    if event_identifiers:
+        EventRating.query.filter(EventRating.event_identifier.in_(list(event_identifiers))).delete(
+            synchronize_session=False
+        )
+
+
+def load_ratings(event_identifiers):
+    """{identifier: rating payload} for every requested id (one IN query)."""
+    ratings = {identifier: empty_rating() for identifier in event_identifiers}
+    if not ratings:
+        return ratings
+    rows = EventRating.query.filter(EventRating.event_identifier.in_(list(ratings))).all()
+    for row in rows:
+        ratings[row.event_identifier] = row.as_dict()
+    return ratings
+
+
+def load_rating(event_identifier):
+    return load_ratings([event_identifier])[event_identifier]
+
+
+def rebuild_ratings():
+    """
+    Recomputes every aggregate from the review table in one GROUP BY.
+    Returns (rows written, stale rows removed). The caller commits.
+    """
+    columns = [
+        func.sum(case((Review.score == s, 1), else_=0)).label(f"score_{s}") for s in RATING_SCORES
+    ]
+    rows = (
+        db.session.query(
+            Review.event_identifier,
+            func.count(Review.id).label("review_count"),
+            func.sum(Review.score).label("score_sum"),
+            *columns,
+        )
+        .group_by(Review.event_identifier)
+        .all()
+    )
+
+    live = set()
+    for row in rows:
+        live.add(row.event_identifier)
+        db.session.merge(EventRating(
+            event_identifier=row.event_identifier,
+            review_count=row.review_count,
+            score_sum=int(row.score_sum or 0),
+            **{f"score_{s}": int(getattr(row, f"score_{s}") or 0) for s in RATING_SCORES},
+        ))
+
+    stale = [
+        identifier for (identifier,) in db.session.query(EventRating.event_identifier)
+        if identifier not in live
+    ]
+    remove_ratings(stale)
+    return len(rows), len(stale)
@@ -0,0 +1,299 @@
+# project/services/read_model.py
+"""
+Materialized read model for the unified event feed.
+
+The Mongo collection 'event_feed' holds one pre-shaped row per official and
+community event (the exact /api/all-events row, plus the /api/event/<id>
+payload under 'detail'). It is kept in sync by fetch_data.py (official events)
+and by the community write endpoints, and can be regenerated from scratch with
+rebuild_event_feed.py. /api/all-events reads it when FEED_READ_MODEL is enabled.
+
+Every write-side hook also stamps the rows it touched in 'event_feed_changes'
+(kept for a day), so a rebuild can re-apply changes made while it was copying.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from pymongo import ReplaceOne, UpdateOne
+from project.db import get_mongo_db
+from project.models import Event
+from project.services.event_query import SOURCE_RANK
+from project.services.event_shape import (
+    shape_official_event,
+    shape_official_detail,
+    shape_community_event,
+    shape_community_detail,
+    community_detail_options,
+)
+
+FEED_COLLECTION = "event_feed"
+CHANGES_COLLECTION = "event_feed_changes"
+SYNC_BATCH_SIZE = 500
+CHANGES_TTL_S = 86400
+# Changes stamped this long before a rebuild started are re-applied too (clock skew between hosts)
+CHANGES_SKEW_S = 60
+
+# Internal fields that are never returned to clients
+_HIDDEN_FIELDS = {"_id": 0, "source_rank": 0, "native_id": 0, "title_sort": 0, "search_text": 0, "detail": 0}
+
+
+def get_feed_collection(db_mongo=None):
+    db_mongo = db_mongo if db_mongo is not None else get_mongo_db()
+    return db_mongo[FEED_COLLECTION] if db_mongo is not None else None
+
+
+def ensure_feed_indexes(collection):
+    """Indexes for every feed filter + sort combination (safe to call repeatedly)."""
+    for key in ("start_date", "title_sort"):
+        collection.create_index([(key, 1), ("source_rank", 1), ("native_id", 1)])
+        collection.create_index([("source", 1), (key, 1), ("source_rank", 1), ("native_id", 1)])
+        collection.create_index([("category", 1), (key, 1), ("source_rank", 1), ("native_id", 1)])
+
+
+# --- Building rows ---
+
+def _feed_document(row, detail, native_id):
+    return {
+        **row,
+        "_id": row["id"],
+        "source_rank": SOURCE_RANK[row["source"]],
+        "native_id": native_id,
+        "title_sort": (row.get("title") or "").lower(),
+        # Same text the feed search has always matched: "<title> <venue>"
+        "search_text": (str(row.get("title")) + " " + str(row.get("venue"))).lower(),
+        "detail": detail,
+    }
+
+
+def official_feed_document(doc):
+    return _feed_document(shape_official_event(doc), shape_official_detail(doc), doc["_id"])
+
+
+def community_feed_document(event):
+    return _feed_document(shape_community_event(event), shape_community_detail(event), event.id)
+
+
+def _record_changes(db_mongo, identifiers):
+    """Stamps feed rows as changed now (read back by rebuild_read_model)."""
+    if not identifiers:
+        return
+    changes = db_mongo[CHANGES_COLLECTION]
+    now = datetime.now(timezone.utc)
+    changes.bulk_write(
+        [UpdateOne({"_id": i}, {"$set": {"at": now}}, upsert=True) for i in identifiers], ordered=False
+    )
+
+
+def _write_documents(collection, documents):
+    for i in range(0, len(documents), SYNC_BATCH_SIZE):
+        batch = documents[i:i + SYNC_BATCH_SIZE]
+        collection.bulk_write(
+            [ReplaceOne({"_id": d["_id"]}, d, upsert=True) for d in batch], ordered=False
+        )
+
+
+# --- Write-side hooks ---
+
+def sync_official_events(docs, db_mongo=None):
+    """Upserts feed rows for official 'events' documents (called by the ETL)."""
+    try:
+        collection = get_feed_collection(db_mongo)
+        if collection is not None and docs:
+            documents = [official_feed_document(d) for d in docs]
+            _write_documents(collection, documents)
+            _record_changes(collection.database, [d["_id"] for d in documents])
+    except Exception as e:
+        print(f"Read model sync error (official): {e}")
+
+
+def sync_community_events(event_ids=None, user_id=None, venue_id=None):
+    """
+    Re-shapes community events after a write. Select them by id, creator or venue.
+    Ids that no longer exist in MariaDB are removed from the read model.
+    """
+    try:
+        collection = get_feed_collection()
+        if collection is None:
+            return
+        query = Event.query.options(*community_detail_options())
+        if event_ids is not None:
+            query = query.filter(Event.id.in_(list(event_ids)))
+        if user_id is not None:
+            query = query.filter(Event.user_id == user_id)
+        if venue_id is not None:
+            query = query.filter(Event.venue_id == venue_id)
+        events = query.all()
+        documents = [community_feed_document(e) for e in events]
+        _write_documents(collection, documents)
+        changed = [d["_id"] for d in documents]
+
+        if event_ids is not None:
+            missing = [f"community_{i}" for i in set(event_ids) - {e.id for e in events}]
+            if missing:
+                collection.delete_many({"_id": {"$in": missing}})
+                changed += missing
+        _record_changes(collection.database, changed)
+    except Exception as e:
+        print(f"Read model sync error (community): {e}")
+
+
+def remove_feed_events(identifiers):
+    """Drops rows for deleted events, e.g. ['community_12']."""
+    try:
+        collection = get_feed_collection()
+        if collection is not None and identifiers:
+            collection.delete_many({"_id": {"$in": list(identifiers)}})
+            _record_changes(collection.database, list(identifiers))
+    except Exception as e:
+        print(f"Read model sync error (delete): {e}")
+
+
+def _refresh_rows(collection, identifiers):
+    """Re-derives the given feed rows from 'events' / MariaDB; rows whose event is gone are deleted."""
+    official, community = [], []
+    for identifier in identifiers:
+        source, _, native = identifier.partition("_")
+        if source == "official" and ObjectId.is_valid(native):
+            official.append(ObjectId(native))
+        elif source == "community" and native.isdigit():
+            community.append(int(native))
+
+    documents = []
+    for i in range(0, len(official), SYNC_BATCH_SIZE):
+        chunk = official[i:i + SYNC_BATCH_SIZE]
+        documents += [official_feed_document(d) for d in collection.database.events.find({"_id": {"$in": chunk}})]
+    for i in range(0, len(community), SYNC_BATCH_SIZE):
+        chunk = community[i:i + SYNC_BATCH_SIZE]
+        query = Event.query.options(*community_detail_options()).filter(Event.id.in_(chunk))
+        documents += [community_feed_document(e) for e in query]
+    _write_documents(collection, documents)
+
+    gone = set(identifiers) - {d["_id"] for d in documents}
+    if gone:
+        collection.delete_many({"_id": {"$in": list(gone)}})
+
+
+def _replay_changes(db_mongo, collection, since):
+    """Applies every change stamped at or after 'since' to collection. Returns how many rows."""
+    identifiers = [c["_id"] for c in db_mongo[CHANGES_COLLECTION].find({"at": {"$gte": since}}, {"_id": 1})]
+    _refresh_rows(collection, identifiers)
+    return len(identifiers)
+
+
+def rebuild_read_model(db_mongo=None):
+    """
+    Regenerates 'event_feed' from MongoDB 'events' and the MariaDB 'event' table.
+    Rows are written to a staging collection which then replaces the live one,
+    so readers never see a half-built feed. Rows the app changed while the copy
+    ran are re-derived into the staging collection before the swap and into the
+    live one again after it, so no concurrent write is lost.
+    Returns the number of rows written.
+    """
+    db_mongo = db_mongo if db_mongo is not None else get_mongo_db()
+    db_mongo[CHANGES_COLLECTION].create_index("at", expireAfterSeconds=CHANGES_TTL_S)
+    since = datetime.now(timezone.utc) - timedelta(seconds=CHANGES_SKEW_S)
+    staging = db_mongo[FEED_COLLECTION + "_rebuild"]
+    staging.drop()
+
+    written = 0
+    batch = []
+    for doc in db_mongo.events.find({}):
+        batch.append(official_feed_document(doc))
+        if len(batch) >= SYNC_BATCH_SIZE:
+            _write_documents(staging, batch)
+            written += len(batch)
+            batch = []
+
+    for event in Event.query.options(*community_detail_options()).yield_per(SYNC_BATCH_SIZE):
+        batch.append(community_feed_document(event))
+        if len(batch) >= SYNC_BATCH_SIZE:
+            _write_documents(staging, batch)
+            written += len(batch)
+            batch = []
+
+    if batch:
+        _write_documents(staging, batch)
+        written += len(batch)
+
+    _replay_changes(db_mongo, staging, since)
+    ensure_feed_indexes(staging)
+    if staging.estimated_document_count():
+        staging.rename(FEED_COLLECTION, dropTarget=True)
+    else:
+        staging.drop()
+        db_mongo[FEED_COLLECTION].delete_many({})
+    # Writes that hit the old live collection between the replay and the swap
+    _replay_changes(db_mongo, db_mongo[FEED_COLLECTION], since)
+    return written
+
+
+# --- Read side ---
+
+def build_feed_filter(params, now_str):
+    """Read-model equivalent of the per-backend feed filters (see event_query)."""
+    conditions = []
+    if params["source"] != "all":
+        conditions.append({"source": params["source"]})
+    if params["category"] != "all":
+        conditions.append({"category": params["category"]})
+
+    # Both sources store start_date as an ISO string, compared exactly like the old Python filter
+    if params["time"] == "upcoming":
+        conditions.append({"start_date": {"$gte": now_str}})
+    elif params["time"] == "past":
+        conditions.append({"start_date": {"$gt": "", "$lt": now_str}})
+    else:
+        conditions.append({"start_date": {"$gt": ""}})
+
+    if params["q"]:
+        conditions.append({"search_text": {"$regex": re.escape(params["q"])}})
+    return {"$and": conditions}
+
+
+def _feed_range(key, descending, cursor):
+    value, rank, native_id = cursor
+    native_id = ObjectId(native_id) if rank == SOURCE_RANK["official"] else native_id
+    return {"$or": [
+        {key: {"$lt" if descending else "$gt": value}},
+        {key: value, "source_rank": {"$gt": rank}},
+        {key: value, "source_rank": rank, "native_id": {"$gt": native_id}},
+    ]}
+
+
+def fetch_feed_page(params, field, descending, cursor, limit, now_str):
+    """Feed rows after the cursor, already in feed order."""
+    collection = get_feed_collection()
+    if collection is None:
+        raise RuntimeError("MongoDB unavailable")
+    key = "title_sort" if field == "title" else "start_date"
+    query = build_feed_filter(params, now_str)
+    if cursor is not None:
+        query["$and"].append(_feed_range(key, descending, cursor))
+    docs = collection.find(query, _HIDDEN_FIELDS).sort(
+        [(key, -1 if descending else 1), ("source_rank", 1), ("native_id", 1)]
+    )
+    if limit:
+        docs = docs.limit(limit)
+    return list(docs)
+
+
+def count_feed(params, now_str):
+    """Per-source totals for the current filters."""
+    collection = get_feed_collection()
+    counts = {"official": 0, "community": 0}
+    pipeline = [
+        {"$match": build_feed_filter(params, now_str)},
+        {"$group": {"_id": "$source", "n": {"$sum": 1}}},
+    ]
+    for row in collection.aggregate(pipeline):
+        counts[row["_id"]] = row["n"]
+    return counts
+
+
+def find_feed_details(event_ids):
+    """{id: detail} for the given ids that are in the read model (one $in query)."""
+    collection = get_feed_collection()
+    if collection is None or not event_ids:
+        return {}
+    rows = collection.find({"_id": {"$in": list(event_ids)}}, {"detail": 1})
+    return {row["_id"]: row["detail"] for row in rows}
@@ -0,0 +1,129 @@
+# project/services/reviews.py
+"""
+Review queries shared by /api/reviews and the composite event-detail endpoint.
+
+Reviews are read with one joined SELECT of just the columns the page shows
+(review fields, author username and avatar) instead of a User/profile lookup per
+review, and paged newest-first with a (created_at, id) keyset cursor.
+"""
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import and_, or_
+from project.models import db, Review, User, UserProfile
+from project.services.ratings import load_rating
+
+REVIEW_PAGE_SIZE = 20
+MAX_REVIEW_PAGE_SIZE = 100
+
+_REVIEW_COLUMNS = (
+    Review.id,
+    Review.user_id,
+    Review.event_identifier,
+    Review.event_id,
+    Review.score,
+    Review.title,
+    Review.body,
+    Review.created_at,
+    User.username,
+    UserProfile.avatar_url,
+)
+
+
+def _reviews_with_authors(event_identifier):
+    return (
+        db.session.query(*_REVIEW_COLUMNS)
+        .outerjoin(User, User.id == Review.user_id)
+        .outerjoin(UserProfile, UserProfile.user_id == Review.user_id)
+        .filter(Review.event_identifier == event_identifier)
+    )
+
+
+def _review_payload(row):
+    """Same shape as Review.as_dict() plus 'username' / 'user_avatar'."""
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "event_identifier": row.event_identifier,
+        "event_id": row.event_id,
+        "score": row.score,
+        "title": row.title,
+        "body": row.body,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "username": row.username if row.username else "Anonymous",
+        "user_avatar": row.avatar_url,
+    }
+
+
+# --- Paging ---
+
+def parse_review_page_size(value):
+    """Parses the 'limit' argument. Returns None when pagination is not requested."""
+    if value in (None, ""):
+        return None
+    return max(1, min(int(value), MAX_REVIEW_PAGE_SIZE))
+
+
+def encode_review_cursor(row):
+    raw = json.dumps([row.created_at.isoformat(), row.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_review_cursor(token):
+    """Returns (created_at, id). Raises ValueError for anything encode_review_cursor didn't produce."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, review_id = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = datetime.fromisoformat(created_at)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if type(review_id) is not int:  # not isinstance: JSON true/false would pass
+        raise ValueError("Invalid cursor")
+    return created_at, review_id
+
+
+def load_review_page(event_identifier, limit=REVIEW_PAGE_SIZE, cursor=None):
+    """Newest reviews first, after the cursor. Returns (reviews, next_cursor or None)."""
+    query = _reviews_with_authors(event_identifier)
+    if cursor is not None:
+        created_at, review_id = cursor
+        query = query.filter(or_(
+            Review.created_at < created_at,
+            and_(Review.created_at == created_at, Review.id < review_id),
+        ))
+    rows = query.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1).all()
+    page = rows[:limit]
+    next_cursor = encode_review_cursor(page[-1]) if len(rows) > limit else None
+    return [_review_payload(row) for row in page], next_cursor
+
+
+def load_all_reviews(event_identifier):
+    """Every review of the event, newest first (the unpaginated /api/reviews response)."""
+    rows = _reviews_with_authors(event_identifier).order_by(
+        Review.created_at.desc(), Review.id.desc()
+    )
+    return [_review_payload(row) for row in rows]
+
+
+def load_user_review(event_identifier, user_id):
+    """The given user's review of the event (or None)."""
+    row = _reviews_with_authors(event_identifier).filter(Review.user_id == user_id).first()
+    return _review_payload(row) if row else None
+
+
+def review_page_payload(event_identifier, limit, cursor, user_id):
+    """
+    One page of reviews for the API. The first page (no cursor) also carries the
+    event's rating aggregate (count/average/histogram) and the caller's own review, which may sit on a later page.
+    """
+    reviews, next_cursor = load_review_page(event_identifier, limit, cursor)
+    payload = {
+        "items": reviews,
+        "limit": limit,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }
+    if cursor is None:
+        payload.update(load_rating(event_identifier))
+        payload["mine"] = load_user_review(event_identifier, user_id) if user_id else None
+    return payload
@@ -0,0 +1,272 @@
+# project/services/scrape_parse.py
+"""
+HTML parsing for the scrapers in fetch_data.py.
+
+Pages are parsed with lxml when it is installed (html.parser otherwise) and
+only the page regions the selectors read are built into the tree (a
+SoupStrainer over the elements listed below); navigation, footers and
+scripts are skipped. Each selector is evaluated once per page.
+
+ParsePool runs the detail-page parsers in worker processes (SCRAPE_PARSE_WORKERS).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (only needed as the BeautifulSoup backend)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def _classes(attrs):
+    value = attrs.get("class") or []
+    return value.split() if isinstance(value, str) else value
+
+
+class RegionStrainer(SoupStrainer):
+    """Keeps every element for which match(name, attrs) is true, with its whole subtree."""
+
+    def __init__(self, match):
+        # beautifulsoup4 < 4.13 calls a callable name with (name, attrs)
+        super().__init__(lambda name, attrs=None: match(name, attrs or {}))
+        self.match = match
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # beautifulsoup4 >= 4.13
+        return self.match(name, attrs or {})
+
+
+def _artsrepublic_region(name, attrs):
+    itemprop = attrs.get("itemprop")
+    if name == "h1":
+        return itemprop == "name"
+    if name == "meta":
+        return itemprop in ("startDate", "endDate", "image")
+    if name == "div":
+        return itemprop == "location" or bool({"synopsis", "data"} & set(_classes(attrs)))
+    return False
+
+
+EVENTFINDA_REGIONS = {
+    "h1": "p-name",
+    "img": "photo",
+    "p": "venue",
+    "span": ("adr", "dtstart", "dtend"),
+    "div": "description",
+    "li": "list-item-icon",
+}
+
+
+def _eventfinda_region(name, attrs):
+    wanted = EVENTFINDA_REGIONS.get(name)
+    if wanted is None:
+        return False
+    wanted = (wanted,) if isinstance(wanted, str) else wanted
+    return any(c in wanted for c in _classes(attrs))
+
+
+ARTSREPUBLIC_DETAIL = RegionStrainer(_artsrepublic_region)
+EVENTFINDA_DETAIL = RegionStrainer(_eventfinda_region)
+ARTSREPUBLIC_LIST = SoupStrainer("li")
+EVENTFINDA_LIST = RegionStrainer(lambda name, attrs: name == "div" and "h-event" in _classes(attrs))
+
+
+def make_soup(html, strainer=None):
+    return BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+
+
+def _short_description(words, full_text):
+    return ' '.join(words[:50]) + '...' if len(words) > 50 else full_text
+
+
+# --- List pages ---
+
+def parse_artsrepublic_list(html):
+    """Detail page hrefs from the ArtsRepublic event list."""
+    soup = make_soup(html, ARTSREPUBLIC_LIST)
+    return [a.get('href') for a in soup.select('li a.event_thumbnail') if a.get('href')]
+
+
+def parse_eventfinda_list(html):
+    """Detail page hrefs from the Eventfinda event list."""
+    soup = make_soup(html, EVENTFINDA_LIST)
+    hrefs = []
+    for card in soup.select('div.card.h-event'):
+        link_tag = card.select_one('h2.card-title a')
+        if link_tag and link_tag.has_attr('href'):
+            hrefs.append(link_tag['href'])
+    return hrefs
+
+
+# --- Detail pages ---
+
+def parse_artsrepublic_detail_page(html, fullUrl):
+    """Extracts the event dict from an ArtsRepublic detail page."""
+    soup = make_soup(html, ARTSREPUBLIC_DETAIL)
+
+    title_tag = soup.select_one('h1[itemprop="name"]')
+    start_tag = soup.select_one('meta[itemprop="startDate"]')
+    end_tag = soup.select_one('meta[itemprop="endDate"]')
+    image_tag = soup.select_one('meta[itemprop="image"]')
+    title = title_tag.text.strip() if title_tag else "Title not found"
+    start_date = start_tag['content'] if start_tag else None
+    end_date = end_tag['content'] if end_tag else None
+    image_url = image_tag['content'] if image_tag else None
+
+    location_div = soup.select_one('div[itemprop="location"]')
+    location_name = location_div.select_one('span[itemprop="name"]') if location_div else None
+    venue, address = "Venue not found", ""
+    if location_name:
+        full_location_string = location_name.text.strip()
+        if ',' in full_location_string:
+            parts = full_location_string.split(',', 1)
+            venue, address = parts[0].strip(), parts[1].strip()
+        else:
+            venue, address = full_location_string, full_location_string
+
+    synopsis_div = soup.select_one('div.synopsis')
+    short_description = ""
+    if synopsis_div:
+        full_synopsis = ' '.join(p.text.replace("Synopsis:", "").strip() for p in synopsis_div.find_all('p'))
+        words = full_synopsis.split()
+        short_description = _short_description(words, ' '.join(words))
+
+    website_link_tag = soup.select_one('div.data a[target="_blank"]')
+    registration_link = website_link_tag['href'] if website_link_tag else None
+
+    return {
+        "title": title, "description": short_description, "start_date": start_date,
+        "end_date": end_date, "venue_name": venue, "address": address,
+        "image_url": image_url, "registration_link": registration_link, "source": fullUrl
+    }
+
+
+def parse_eventfinda_detail_page(html, full_url):
+    """Extracts the event dict from an Eventfinda detail page."""
+    soup = make_soup(html, EVENTFINDA_DETAIL)
+
+    title_tag = soup.select_one("h1.p-name")
+    image_tag = soup.select_one("img.photo")
+    venue_tag = soup.select_one("p.venue a.venue-name")
+    address_tag = soup.select_one("span.adr")
+    start_tag = soup.select_one("span.dtstart span.value-title")
+    end_tag = soup.select_one("span.dtend span.value-title")
+    link_tag = soup.select_one("li.list-item-icon a.external-link")
+
+    title = title_tag.text.strip() if title_tag else "Title not found"
+    image_url = image_tag['src'] if image_tag else None
+    venue = venue_tag.text.strip() if venue_tag else "Venue not found"
+    address = address_tag.text.strip() if address_tag else venue
+
+    start_date = start_tag['title'].split('T')[0] if start_tag else None
+    end_date = end_tag['title'].split('T')[0] if start_date and end_tag else start_date
+
+    description_div = soup.select_one("div.module.description")
+    short_description = ""
+    if description_div:
+        full_description = description_div.get_text(separator=' ', strip=True)
+        short_description = _short_description(full_description.split(), full_description)
+
+    registration_link = link_tag['href'] if link_tag else full_url
+
+    return {
+        "title": title, "description": short_description, "start_date": start_date,
+        "end_date": end_date, "venue_name": venue, "address": address,
+        "image_url": image_url, "registration_link": registration_link, "source": full_url
+    }
+
+
+# --- Parse stage ---
+
+# Each one can be overridden via an environment variable of the same name.
+PARSE_CONFIG_DEFAULTS = {
+    "SCRAPE_PARSE_WORKERS": 0,     # parser processes; 0 = one per CPU, 1 = parse in-process
+    "SCRAPE_PARSE_CHUNK": 8,       # pages handed to a worker per task
+}
+
+
+def parse_settings():
+    return {
+        key: type(default)(os.getenv(key, default))
+        for key, default in PARSE_CONFIG_DEFAULTS.items()
+    }
+
+
+class ParseError(str):
+    """Returned in place of an event when a page could not be parsed."""
+
+
+def _parse_body(task):
+    """Worker entry point: (parse_page, url, body bytes) -> event dict or error message."""
+    parse_page, url, body = task
+    if body is None:
+        return None  # Not fetched (unchanged since last loaded); passed through in order
+    try:
+        # Decoded here rather than in the fetching process; same result as
+        # response.text with the encoding forced to utf-8.
+        return parse_page(body.decode("utf-8", errors="replace"), url)
+    except Exception as e:
+        return ParseError(f"{type(e).__name__}: {e}")
+
+
+class ParsePool:
+    """
+    Parses raw page bodies into event dicts on a ProcessPoolExecutor, so
+    parsing uses every core while the fetch threads keep downloading. With a
+    single worker everything runs in the calling process.
+    """
+
+    def __init__(self, workers=None, chunksize=None):
+        settings = parse_settings()
+        workers = settings["SCRAPE_PARSE_WORKERS"] if workers is None else workers
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize or settings["SCRAPE_PARSE_CHUNK"]
+        self._pool = None
+        self.counters = {"parsed": 0, "errors": 0}
+
+    def parse(self, parse_page, pages):
+        """
+        pages: iterable of (url, body bytes or None). Returns [(url, result)] in
+        input order, where result is the event dict, a ParseError, or None for a
+        page without a body. parse_page must be a module-level function (it is
+        pickled).
+        """
+        tasks = [(parse_page, url, body) for url, body in pages]
+        if self.workers <= 1 or len(tasks) <= self.chunksize:
+            results = [_parse_body(task) for task in tasks]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            results = list(self._pool.map(_parse_body, tasks, chunksize=self.chunksize))
+        self.counters["errors"] += sum(1 for r in results if isinstance(r, ParseError))
+        self.counters["parsed"] += sum(1 for r in results if isinstance(r, dict))
+        return [(task[1], result) for task, result in zip(tasks, results)]
+
+    def parse_stream(self, parse_page, pages):
+        """
+        Streaming parse: reads (url, body bytes or None) from an iterator one
+        pool-full (workers x chunksize pages) at a time and yields the same tuples as
+        parse(), so only that many bodies are held at once.
+        """
+        group = []
+        for page in pages:
+            group.append(page)
+            if len(group) >= self.workers * self.chunksize:
+                yield from self.parse(parse_page, group)
+                group = []
+        if group:
+            yield from self.parse(parse_page, group)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
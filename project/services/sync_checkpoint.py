@@ -0,0 +1,80 @@
+# project/services/sync_checkpoint.py
+"""
+Resume point for fetch_data.py's event sync.
+
+After every load batch the sync records which detail pages that batch covered
+(and, per site, whether the site is finished) in a small JSON file. If the run
+dies, the next one picks the checkpoint up and skips those pages and sites
+instead of starting over. A run that finishes removes the file. Checkpoints
+older than SYNC_CHECKPOINT_MAX_AGE_H are ignored, so a long-dead run can't
+hide pages that have changed since.
+"""
+import json
+import os
+import time
+
+SYNC_CHECKPOINT = os.getenv("SYNC_CHECKPOINT", ".sync_checkpoint.json")
+SYNC_CHECKPOINT_MAX_AGE_H = float(os.getenv("SYNC_CHECKPOINT_MAX_AGE_H", 24))
+
+
+class SyncCheckpoint:
+    def __init__(self, path=SYNC_CHECKPOINT, resume=True):
+        self.path = path
+        self.state = {"started_at": time.time(), "sites": {}}
+        self.resumed = False
+        previous = self._read() if resume and path else None
+        if previous and time.time() - previous.get("updated_at", 0) < SYNC_CHECKPOINT_MAX_AGE_H * 3600:
+            self.state = previous
+            self.resumed = True
+        self._completed = {
+            site: set(entry.get("completed", [])) for site, entry in self.state["sites"].items()
+        }
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self):
+        if not self.path:
+            return
+        self.state["updated_at"] = time.time()
+        # Write-then-rename so a crash mid-write leaves the previous checkpoint intact
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.path)
+
+    def _site(self, site):
+        return self.state["sites"].setdefault(site, {"done": False, "batches": 0, "completed": []})
+
+    def site_done(self, site):
+        return self.state["sites"].get(site, {}).get("done", False)
+
+    def completed(self, site):
+        """Detail page URLs of site already covered by a completed batch."""
+        return self._completed.setdefault(site, set())
+
+    def batches(self, site):
+        return self.state["sites"].get(site, {}).get("batches", 0)
+
+    def complete_batch(self, site, urls):
+        """Records a load batch as committed."""
+        entry = self._site(site)
+        done = self.completed(site)
+        new = [url for url in urls if url not in done]
+        done.update(new)
+        entry["completed"].extend(new)
+        entry["batches"] += 1
+        self._save()
+
+    def finish_site(self, site):
+        self._site(site)["done"] = True
+        self._save()
+
+    def clear(self):
+        """The whole sync finished: nothing left to resume."""
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
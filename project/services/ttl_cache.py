@@ -0,0 +1,77 @@
+# project/services/ttl_cache.py
+"""
+Small thread-safe in-process cache: bounded LRU with per-entry expiry and
+hit/miss/eviction counters.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, max_size, ttl_seconds):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+        # Bumped by clear(); set() drops values computed before the last clear
+        self.epoch = 0
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def get(self, key):
+        """Returns the cached value, or MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters["misses"] += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.counters["expirations"] += 1
+                self.counters["misses"] += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return value
+
+    def set(self, key, value, ttl_seconds=None, epoch=None):
+        """
+        Stores value for min(ttl_seconds, the cache TTL).
+        Pass the epoch read before computing the value so a clear() that
+        happened in the meantime is not undone by a stale write.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            if epoch is not None and epoch != self.epoch:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.counters["evictions"] += 1
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.counters["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self.counters["invalidations"] += len(self._entries)
+            self._entries.clear()
+            self.epoch += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self.counters,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+            }
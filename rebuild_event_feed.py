@@ -0,0 +1,27 @@
+from project import app
+from project.db import get_mongo_db
+from project.services.read_model import rebuild_read_model
+from project.services.feed_cache import invalidate_feed_cache
+
+def rebuild_event_feed():
+    """
+    Regenerates the 'event_feed' read model from MongoDB 'events' and the
+    MariaDB 'event' table. Safe to run while the app is serving traffic:
+    events changed during the rebuild are re-applied before and after the swap.
+    """
+    print("--- Rebuilding Event Feed Read Model ---")
+
+    with app.app_context():
+        db_mongo = get_mongo_db()
+        if db_mongo is None:
+            print("Could not connect to MongoDB. Aborting.")
+            return
+
+        written = rebuild_read_model(db_mongo)
+        invalidate_feed_cache(db_mongo)
+
+        print(f"--- Rebuild Complete ---")
+        print(f"   > Rows written: {written}")
+
+if __name__ == "__main__":
+    rebuild_event_feed()
@@ -0,0 +1,33 @@
+from project import app, db
+from project.models import EventRating
+from project.services.ratings import rebuild_ratings as recompute_ratings
+
+def rebuild_ratings():
+    """
+    Recomputes the per-event rating aggregates ('event_rating') from the review
+    table. Run once after deploying the table, and any time the aggregates are
+    suspected to have drifted (e.g. reviews edited directly in the database).
+    """
+    print("--- Starting Rating Rebuild ---")
+
+    with app.app_context():
+        # 1. Create the table on databases that predate it
+        print("1. Ensuring event_rating table...")
+        EventRating.__table__.create(bind=db.engine, checkfirst=True)
+
+        # 2. Recompute from reviews
+        print("2. Recomputing aggregates...")
+        try:
+            written, stale = recompute_ratings()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"Rebuild failed: {e}")
+            return
+
+        print(f"--- Rating Rebuild Complete ---")
+        print(f"   > Events rated:  {written}")
+        print(f"   > Stale removed: {stale}")
+
+if __name__ == "__main__":
+    rebuild_ratings()
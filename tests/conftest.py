@@ -0,0 +1,58 @@
+# tests/conftest.py
+"""
+Shared fixtures: the app runs against an in-memory SQLite database and an
+in-memory MongoDB (mongomock), so the suite needs neither server.
+
+Run from the project root:  pip install -r requirements-dev.txt && python -m pytest
+"""
+import os
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("FEED_CACHE_TTL_S", "0")
+for key in ("MARIADB_USER", "MARIADB_PASSWORD", "MARIADB_HOST", "MARIADB_PORT", "MARIADB_DATABASE"):
+    os.environ.setdefault(key, "test")
+
+import mongomock
+import pymongo
+import pytest
+
+# project.db builds its pooled client with pymongo.MongoClient
+pymongo.MongoClient = mongomock.MongoClient
+
+
+def _without_sort(add):
+    # pymongo >= 4.11 passes sort= to bulk builders; mongomock 4.3 doesn't accept it
+    def wrapper(self, *args, sort=None, **kwargs):
+        return add(self, *args, **kwargs)
+    return wrapper
+
+
+for _name in ("add_update", "add_replace"):
+    setattr(mongomock.collection.BulkOperationBuilder, _name,
+            _without_sort(getattr(mongomock.collection.BulkOperationBuilder, _name)))
+
+from project import app as flask_app  # noqa: E402
+from project.db import close_mongo_clients, get_mongo_db  # noqa: E402
+from project.models import db  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    flask_app.config["TESTING"] = True
+    with flask_app.app_context():
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+        close_mongo_clients()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def mongo(app):
+    return get_mongo_db()
@@ -0,0 +1,143 @@
+# tests/test_bookmarks.py
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from project.models import db, User, Venue, Event, EventCache, Bookmark
+from project.services.bookmarks import decode_bookmark_cursor, encode_bookmark_cursor
+from project.services.event_lookup import FOUND, NOT_FOUND
+
+
+def forged_cursor(value):
+    raw = json.dumps(value).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize("bookmark_id", [True, False, 5.0, "5", None])
+def test_decode_bookmark_cursor_rejects_non_int_id(bookmark_id):
+    with pytest.raises(ValueError):
+        decode_bookmark_cursor(forged_cursor(["2026-01-01T12:00:00", bookmark_id]))
+
+
+def test_decode_bookmark_cursor_round_trip():
+    assert decode_bookmark_cursor(encode_bookmark_cursor("2026-01-01T12:00:00", 5)) == ("2026-01-01T12:00:00", 5)
+
+
+def seed_bookmarks(mongo):
+    """
+    One user with five bookmarks, newest bookmark first in this order:
+    community (in 3 days), official (in 1 day), official without a date,
+    community (in 2 days), official deleted from MongoDB.
+    Returns (user id, identifiers in that order).
+    """
+    user = User(username="reader", email="reader@example.com", password_hash="x")
+    venue = Venue(name="Hall", address="1 Road", postal_code="123456")
+    db.session.add_all([user, venue])
+    db.session.flush()
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+
+    def community(days):
+        item = Event(
+            user_id=user.id, venue_id=venue.id, title=f"In {days} days", description="d",
+            start_datetime=start + timedelta(days=days - 1), end_datetime=start + timedelta(days=days),
+        )
+        db.session.add(item)
+        db.session.flush()
+        return f"community_{item.id}", str(item.id)
+
+    def official(start_date):
+        doc = {"_id": ObjectId(), "title": "Official", "start_date": start_date}
+        if start_date is not None:
+            mongo.events.insert_one(doc)
+        return f"official_{doc['_id']}", str(doc["_id"])
+
+    entries = [
+        community(3),
+        official(start.isoformat()),
+        official(""),
+        community(2),
+        official(None),  # bookmarked, then removed from the source
+    ]
+    for age, (identifier, original_id) in enumerate(entries):
+        source = identifier.split("_")[0]
+        db.session.add(EventCache(event_identifier=identifier, source=source, original_id=original_id, title="t"))
+        db.session.flush()
+        db.session.add(Bookmark(
+            user_id=user.id, event_identifier=identifier, created_at=datetime(2026, 1, 1) - timedelta(hours=age),
+        ))
+    db.session.commit()
+    return user.id, [identifier for identifier, _ in entries]
+
+
+def as_user(client, user_id):
+    with client.session_transaction() as session:
+        session["user_id"] = user_id
+
+
+def walk_pages(client, sort, limit=2):
+    items, cursor = [], None
+    while True:
+        query = f"/api/bookmarks?expand=1&sort={sort}&limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(query).get_json()
+        assert page["status"] == "success"
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            return items
+
+
+def test_expanded_bookmarks_by_bookmark_date(client, mongo):
+    user_id, identifiers = seed_bookmarks(mongo)
+    as_user(client, user_id)
+
+    items = walk_pages(client, "bookmarked")
+
+    assert [item["id"] for item in items] == identifiers
+    assert [item["status"] for item in items] == [FOUND] * 4 + [NOT_FOUND]
+    assert items[0]["event"]["title"] == "In 3 days"
+    assert items[1]["event"]["source"] == "official"
+
+
+def test_expanded_bookmarks_by_event_date(client, mongo):
+    user_id, identifiers = seed_bookmarks(mongo)
+    as_user(client, user_id)
+
+    items = walk_pages(client, "event_date")
+
+    # Soonest first; the undated official event and the deleted one sort last (by bookmark id)
+    assert [item["id"] for item in items] == [
+        identifiers[1], identifiers[3], identifiers[0], identifiers[2], identifiers[4],
+    ]
+
+
+def test_bookmark_check_follows_this_sessions_changes(client, mongo):
+    user_id, identifiers = seed_bookmarks(mongo)
+    as_user(client, user_id)
+    other = f"community_{10 ** 6}"
+
+    def check():
+        response = client.post("/api/bookmarks/check", json={"ids": [identifiers[0], other]})
+        return response.get_json()["bookmarked"]
+
+    assert check() == {identifiers[0]: True, other: False}
+    assert client.post("/api/bookmarks", json={"event_id": other}).status_code == 201
+    assert check() == {identifiers[0]: True, other: True}
+    assert client.delete(f"/api/bookmarks/{identifiers[0]}").status_code == 200
+    assert check() == {identifiers[0]: False, other: True}
+
+
+def test_bookmark_check_reloads_after_another_sessions_change(app, mongo):
+    user_id, identifiers = seed_bookmarks(mongo)
+    reader, writer = app.test_client(), app.test_client()
+    as_user(reader, user_id)
+    as_user(writer, user_id)
+
+    def check():
+        return reader.get(f"/api/bookmarks/check?event_id={identifiers[0]}").get_json()["is_bookmarked"]
+
+    assert check() is True
+    assert writer.delete(f"/api/bookmarks/{identifiers[0]}").status_code == 200
+    assert check() is False
@@ -0,0 +1,53 @@
+# tests/test_event_cache.py
+from sqlalchemy import event
+
+from project.models import db, EventCache
+from project.services import event_cache
+from project.services.cache_sync import CACHE_STATE_COLLECTION, GENERATION_ID
+from project.services.event_cache import ensure_event_cache
+
+
+def record_statements():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    return statements, lambda: event.remove(db.engine, "before_cursor_execute", record)
+
+
+def test_ensure_event_cache_writes_without_checking_existing_rows(app):
+    event_cache._known.clear()
+    db.session.add(EventCache(
+        event_identifier="community_1", source="community", original_id="1", title="Kept",
+    ))
+    db.session.commit()
+
+    statements, stop = record_statements()
+    try:
+        invalid = ensure_event_cache(["community_1", "community_2", "bogus"])
+        first = list(statements)
+        ensure_event_cache(["community_1", "community_2"])
+    finally:
+        stop()
+
+    assert invalid == ["bogus"]
+    assert not any("FROM event_cache" in s for s in first)
+    assert len(statements) == len(first)  # known now: no queries at all
+    titles = dict(db.session.query(EventCache.event_identifier, EventCache.title))
+    assert titles == {"community_1": "Kept", "community_2": "Community Event"}
+
+
+def test_ensure_event_cache_recreates_rows_deleted_by_another_worker(app, mongo, monkeypatch):
+    event_cache._known.clear()
+    monkeypatch.setitem(app.config, "CACHE_SYNC_S", 0)
+    ensure_event_cache(["community_3"])
+
+    # Another worker deletes the row and publishes the change
+    EventCache.query.filter_by(event_identifier="community_3").delete()
+    db.session.commit()
+    mongo[CACHE_STATE_COLLECTION].update_one({"_id": GENERATION_ID}, {"$inc": {"generation": 1}}, upsert=True)
+
+    ensure_event_cache(["community_3"])
+    assert db.session.get(EventCache, "community_3") is not None
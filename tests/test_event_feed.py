@@ -0,0 +1,59 @@
+# tests/test_event_feed.py
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from project.models import db, User, UserProfile, Venue, Event, EventTag, EventCache, Tag
+
+
+def seed_community_events(count, offset=0):
+    """count community events, each with its own creator (with profile), venue and two tags."""
+    tags = Tag.query.all() or [Tag(tag_name="Music"), Tag(tag_name="Film")]
+    db.session.add_all(tags)
+    start = datetime.now() + timedelta(days=1)
+    for i in range(offset, offset + count):
+        user = User(username=f"user{i}", email=f"user{i}@example.com", password_hash="x")
+        venue = Venue(name=f"Hall {i}", address=f"{i} Road", postal_code="123456")
+        db.session.add_all([user, venue])
+        db.session.flush()
+        db.session.add(UserProfile(user_id=user.id, avatar_url=f"/avatars/{i}.png"))
+        item = Event(
+            user_id=user.id, venue_id=venue.id, title=f"Community event {i}", description="d",
+            start_datetime=start + timedelta(hours=i), end_datetime=start + timedelta(hours=i + 2),
+        )
+        db.session.add(item)
+        db.session.flush()
+        identifier = f"community_{item.id}"
+        db.session.add(EventCache(
+            event_identifier=identifier, source="community", original_id=str(item.id), title=item.title,
+        ))
+        db.session.flush()
+        for tag in tags:
+            db.session.add(EventTag(tag_id=tag.id, event_identifier=identifier, event_id=item.id))
+    db.session.commit()
+
+
+def count_feed_statements(client):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/all-events?source=community&limit=50")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    return response.get_json(), len(statements)
+
+
+def test_community_feed_query_count_does_not_grow_with_rows(client):
+    seed_community_events(5)
+    small, small_statements = count_feed_statements(client)
+    seed_community_events(5, offset=5)
+    large, large_statements = count_feed_statements(client)
+
+    assert len(small["events"]) == 5
+    assert len(large["events"]) == 10
+    assert large_statements == small_statements
@@ -0,0 +1,62 @@
+# tests/test_event_lookup.py
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from project.models import db, User, Venue, Event
+from project.services import event_lookup
+from project.services.event_lookup import invalidate_event_details
+
+
+@pytest.fixture
+def cached_client(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, "CACHE_SYNC_S", 0)
+    monkeypatch.setattr(event_lookup, "_detail_cache", None)
+    return client
+
+
+def test_event_details_are_cached_until_invalidated(cached_client, mongo):
+    doc_id = mongo.events.insert_one({"title": "First", "start_date": "2030-01-01"}).inserted_id
+    identifier = f"official_{doc_id}"
+    assert cached_client.get(f"/api/event/{identifier}").get_json()["event"]["title"] == "First"
+
+    mongo.events.update_one({"_id": doc_id}, {"$set": {"title": "Renamed"}})
+    assert cached_client.get(f"/api/event/{identifier}").get_json()["event"]["title"] == "First"
+
+    invalidate_event_details([identifier])
+    assert cached_client.get(f"/api/event/{identifier}").get_json()["event"]["title"] == "Renamed"
+
+
+def test_misses_are_cached_until_invalidated(cached_client, mongo):
+    doc_id = ObjectId()
+    identifier = f"official_{doc_id}"
+    assert cached_client.get(f"/api/event/{identifier}").status_code == 404
+
+    mongo.events.insert_one({"_id": doc_id, "title": "Late", "start_date": "2030-01-01"})
+    assert cached_client.get(f"/api/event/{identifier}").status_code == 404
+
+    invalidate_event_details([identifier])
+    assert cached_client.get(f"/api/event/{identifier}").status_code == 200
+
+
+
+def test_community_edit_refreshes_its_detail(cached_client):
+    user = User(username="host", email="host@example.com", password_hash="x")
+    venue = Venue(name="Hall", address="1 Road", postal_code="123456")
+    db.session.add_all([user, venue])
+    db.session.flush()
+    start = datetime(2030, 1, 1, 18, 0)
+    item = Event(
+        user_id=user.id, venue_id=venue.id, title="First", description="d",
+        start_datetime=start, end_datetime=start + timedelta(hours=2),
+    )
+    db.session.add(item)
+    db.session.commit()
+    url = f"/api/event/community_{item.id}"
+    assert cached_client.get(url).get_json()["event"]["title"] == "First"
+
+    with cached_client.session_transaction() as session:
+        session["user_id"] = user.id
+    assert cached_client.put(f"/api/events/{item.id}", data={"title": "Renamed"}).status_code == 200
+    assert cached_client.get(url).get_json()["event"]["title"] == "Renamed"
@@ -0,0 +1,50 @@
+# tests/test_event_query.py
+import pytest
+
+from project.services.categorize import CATEGORY_KEYWORDS, event_category
+from project.services.event_query import build_mongo_filter, decode_cursor, encode_cursor
+
+TEXTS = [
+    ("Stand-up night", "A funny evening"),
+    ("Night market", "Food and drinks"),
+    ("Jazz concert", None),
+    ("Film festival", "movies all week"),
+    ("Musical", "A play for the family"),
+    ("Quiet evening", ""),
+    (None, "Yoga in the park"),
+]
+
+
+@pytest.mark.parametrize("category", list(CATEGORY_KEYWORDS) + ["Other", "Unknown"])
+def test_category_filter_matches_documents_without_a_stored_category(mongo, category):
+    mongo.events.insert_many([
+        {"title": title, "description": description, "start_date": "2030-01-01"}
+        for title, description in TEXTS
+    ] + [
+        # Backfilled: the stored category wins over the text
+        {"title": "Stored", "description": "A jazz concert", "start_date": "2030-01-01", "category": "Film"},
+    ])
+    params = {"category": category, "time": "all", "q": ""}
+
+    found = mongo.events.find(build_mongo_filter(params, "2026-01-01"))
+
+    expected = sorted(str(t) for t, d in TEXTS if event_category(t, d) == category)
+    expected += ["Stored"] if category == "Film" else []
+    assert sorted(str(doc["title"]) for doc in found) == sorted(expected)
+
+
+@pytest.mark.parametrize("position", [
+    ["Title", True, 5],
+    ["Title", 1.0, 5],
+    ["Title", 1, True],
+    ["Title", 1, 5.0],
+    ["Title", False, "0123456789abcdef01234567"],
+])
+def test_decode_cursor_rejects_non_int_rank_and_id(position):
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(position))
+
+
+def test_decode_cursor_round_trip():
+    for position in (("Title", 1, 5), ("Title", 0, "0123456789abcdef01234567")):
+        assert decode_cursor(encode_cursor(position)) == position
@@ -0,0 +1,64 @@
+# tests/test_executor.py
+import threading
+from types import SimpleNamespace
+
+from sqlalchemy import event, text
+
+from project.models import db
+from project.services.executor import (
+    submit_in_app_context, gather, statement_budget, _apply_statement_budget,
+    MONGO_POOL, MARIADB_POOL, STATEMENT_BUDGET_OPTION,
+)
+
+
+def test_slow_backend_does_not_starve_the_other_pool(app):
+    release = threading.Event()
+    stuck = [
+        submit_in_app_context(release.wait, 5, pool=MONGO_POOL)
+        for _ in range(app.config["FANOUT_WORKERS"] + 2)
+    ]
+    try:
+        healthy = submit_in_app_context(lambda: "ok", pool=MARIADB_POOL)
+        outcomes = gather({"official": stuck[0], "community": healthy}, {"official": 50, "community": 1000})
+        assert outcomes["official"]["status"] == "timeout"
+        assert outcomes["community"]["status"] == "ok"
+        assert outcomes["community"]["result"] == "ok"
+
+        # Queued behind the stuck jobs: cancelled at its deadline instead of running later
+        queued = stuck[-1]
+        assert gather({"queued": queued}, {"queued": 10})["queued"]["status"] == "timeout"
+        assert queued.cancelled()
+    finally:
+        release.set()
+
+
+def test_statement_budget_is_scoped_to_the_block(app):
+    budgets = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        budgets.append(conn.get_execution_options().get(STATEMENT_BUDGET_OPTION))
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        with statement_budget(250):
+            db.session.execute(text("SELECT 1"))
+        db.session.execute(text("SELECT 1"))
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert budgets == [0.25, None]
+
+
+def test_statement_budget_is_a_per_statement_prefix_on_mariadb():
+    def conn(dialect, budget):
+        return SimpleNamespace(
+            dialect=SimpleNamespace(name=dialect),
+            get_execution_options=lambda: {STATEMENT_BUDGET_OPTION: budget} if budget else {},
+        )
+
+    def apply(c, statement):
+        return _apply_statement_budget(c, None, statement, (), None, False)[0]
+
+    assert apply(conn("mysql", 0.25), "SELECT 1") == "SET STATEMENT max_statement_time=0.25 FOR SELECT 1"
+    assert apply(conn("mysql", 0.25), "UPDATE t SET a = 1") == "UPDATE t SET a = 1"
+    assert apply(conn("mysql", None), "SELECT 1") == "SELECT 1"
+    assert apply(conn("sqlite", 0.25), "SELECT 1") == "SELECT 1"
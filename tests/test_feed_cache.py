@@ -0,0 +1,67 @@
+# tests/test_feed_cache.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from project.models import db, User, Venue, Event
+from project.services import feed_cache
+from project.services.cache_sync import CACHE_STATE_COLLECTION, GENERATION_ID
+
+FEED = "/api/all-events?source=community&time=all&limit=50"
+
+
+@pytest.fixture
+def cached_client(client, app, monkeypatch):
+    """A client whose feed responses are cached (the suite runs with FEED_CACHE_TTL_S=0)."""
+    monkeypatch.setitem(app.config, "FEED_CACHE_TTL_S", 60)
+    monkeypatch.setitem(app.config, "CACHE_SYNC_S", 0)
+    monkeypatch.setattr(feed_cache, "_feed_cache", None)
+    return client
+
+
+def add_event(title):
+    user = User(username="host", email="host@example.com", password_hash="x")
+    venue = Venue(name="Hall", address="1 Road", postal_code="123456")
+    db.session.add_all([user, venue])
+    db.session.flush()
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    item = Event(
+        user_id=user.id, venue_id=venue.id, title=title, description="d",
+        start_datetime=start, end_datetime=start + timedelta(hours=2),
+    )
+    db.session.add(item)
+    db.session.commit()
+    return user.id, item.id
+
+
+def titles(client):
+    return [e["title"] for e in client.get(FEED).get_json()["events"]]
+
+
+def rename_behind_the_apps_back(event_id, title):
+    db.session.get(Event, event_id).title = title
+    db.session.commit()
+
+
+def test_feed_responses_are_cached_until_a_write(cached_client):
+    user_id, event_id = add_event("First")
+    assert titles(cached_client) == ["First"]
+
+    rename_behind_the_apps_back(event_id, "Unseen")
+    assert titles(cached_client) == ["First"]
+
+    with cached_client.session_transaction() as session:
+        session["user_id"] = user_id
+    assert cached_client.put(f"/api/events/{event_id}", data={"title": "Renamed"}).status_code == 200
+    assert titles(cached_client) == ["Renamed"]
+
+
+def test_feed_cache_is_cleared_by_another_process(cached_client, mongo):
+    _, event_id = add_event("First")
+    assert titles(cached_client) == ["First"]
+
+    # Another worker changes the event and publishes the change
+    rename_behind_the_apps_back(event_id, "Changed elsewhere")
+    mongo[CACHE_STATE_COLLECTION].update_one({"_id": GENERATION_ID}, {"$inc": {"generation": 1}}, upsert=True)
+
+    assert titles(cached_client) == ["Changed elsewhere"]
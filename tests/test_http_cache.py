@@ -0,0 +1,60 @@
+# tests/test_http_cache.py
+import pytest
+
+import fetch_data
+from benchmarks.fixtures import FixtureServer
+from project.services.http_cache import CacheMiss
+from project.services.http_fetch import PageFetcher
+from project.services.scrape_parse import ParsePool
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with FixtureServer(count=10, latency_ms=1) as fixture_server:
+        monkeypatch.setattr(fetch_data, "ARTSREPUBLIC_BASE_URL", fixture_server.url)
+        monkeypatch.setattr(fetch_data, "EVENTFINDA_BASE_URL", fixture_server.url)
+        yield fixture_server
+
+
+def test_revalidated_pages_come_from_the_cache(server, tmp_path):
+    url = f"{server.url}/events/ar-1"
+    with PageFetcher(cache_dir=str(tmp_path)) as fetcher:
+        first = fetcher.fetch(url)
+    with PageFetcher(cache_dir=str(tmp_path)) as fetcher:
+        second = fetcher.fetch(url)
+        assert fetcher.counters["not_modified"] == 1
+
+    assert server.not_modified == 1
+    assert second.status_code == 200
+    assert second.text == first.text
+    assert second.unchanged is False  # never loaded into the database
+
+
+def test_pages_loaded_before_are_marked_unchanged(server, tmp_path):
+    url = f"{server.url}/events/ar-1"
+    with PageFetcher(cache_dir=str(tmp_path)) as fetcher:
+        fetcher.fetch(url)
+        fetcher.mark_loaded([url])
+    with PageFetcher(cache_dir=str(tmp_path)) as fetcher:
+        assert fetcher.fetch(url).unchanged is True
+        assert fetcher.is_loaded(url)
+    with PageFetcher(cache_dir=str(tmp_path), skip_unchanged=False) as fetcher:
+        assert fetcher.fetch(url).unchanged is False
+
+
+def test_replay_serves_a_scrape_without_the_network(server, tmp_path):
+    def scrape(fetcher):
+        with fetcher, ParsePool(workers=1) as parser:
+            return fetch_data.scrape_artsrepublic_sg(fetcher, parser) + fetch_data.scrape_eventfinda_sg(fetcher, parser)
+
+    live = scrape(PageFetcher(cache_dir=str(tmp_path)))
+    requests_before = server.requests
+    replayed = scrape(PageFetcher(cache_dir=str(tmp_path), replay=True))
+
+    assert len(live) == 20
+    assert replayed == live
+    assert server.requests == requests_before
+
+    with PageFetcher(cache_dir=str(tmp_path), replay=True) as fetcher:
+        with pytest.raises(CacheMiss):
+            fetcher.fetch(f"{server.url}/events/not-cached")
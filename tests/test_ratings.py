@@ -0,0 +1,70 @@
+# tests/test_ratings.py
+from project.models import db, User, EventRating
+from project.services.event_cache import _known
+from project.services.ratings import load_ratings, rebuild_ratings
+
+EVENTS = ["community_1", "community_2"]
+
+
+def add_users(count):
+    users = [User(username=f"user{i}", email=f"user{i}@example.com", password_hash="x") for i in range(count)]
+    db.session.add_all(users)
+    db.session.commit()
+    return [user.id for user in users]
+
+
+def as_user(client, user_id):
+    with client.session_transaction() as session:
+        session["user_id"] = user_id
+
+
+def post_review(client, user_id, event_id, rating):
+    as_user(client, user_id)
+    response = client.post("/api/reviews", json={"event_id": event_id, "rating": rating})
+    assert response.status_code == 201
+    return response.get_json()["review"]["id"]
+
+
+def rebuilt_ratings():
+    """What rebuild_ratings.py would store, without keeping it."""
+    nested = db.session.begin_nested()
+    rebuild_ratings()
+    db.session.flush()
+    rebuilt = load_ratings(EVENTS)
+    nested.rollback()
+    return rebuilt
+
+
+def test_incremental_ratings_match_a_rebuild(client):
+    _known.clear()
+    users = add_users(4)
+
+    first = post_review(client, users[0], EVENTS[0], 4)
+    second = post_review(client, users[1], EVENTS[0], 2)
+    post_review(client, users[2], EVENTS[0], 5)
+    post_review(client, users[3], EVENTS[1], 1)
+    assert load_ratings(EVENTS) == rebuilt_ratings()
+
+    as_user(client, users[0])
+    assert client.put(f"/api/reviews/{first}", json={"score": 5}).status_code == 200
+    assert load_ratings(EVENTS) == rebuilt_ratings()
+
+    as_user(client, users[1])
+    assert client.delete(f"/api/reviews/{second}").status_code == 200
+    ratings = load_ratings(EVENTS)
+    assert ratings == rebuilt_ratings()
+    assert ratings[EVENTS[0]]["count"] == 2
+    assert ratings[EVENTS[0]]["average"] == 5.0
+    assert ratings[EVENTS[0]]["histogram"] == {"1": 0, "2": 0, "3": 0, "4": 0, "5": 2}
+    assert ratings[EVENTS[1]]["count"] == 1
+
+
+def test_deleting_the_last_review_leaves_an_empty_aggregate(client):
+    _known.clear()
+    (user,) = add_users(1)
+    review = post_review(client, user, EVENTS[0], 3)
+
+    assert client.delete(f"/api/reviews/{review}").status_code == 200
+    row = db.session.get(EventRating, EVENTS[0])
+    assert (row.review_count, row.score_sum, row.score_3) == (0, 0, 0)
+    assert load_ratings(EVENTS)[EVENTS[0]]["average"] is None
@@ -0,0 +1,103 @@
+# tests/test_read_model.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from project.models import db, User, Venue, Event, EventCache
+from project.services import read_model
+from project.services.read_model import (
+    rebuild_read_model, sync_official_events, remove_feed_events, FEED_COLLECTION,
+)
+
+
+def seed_events(mongo, count=4):
+    """count official and count community events, a day apart. Returns (official docs, community events)."""
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    docs = [
+        {
+            "title": f"Official {i}", "description": "A jazz concert" if i % 2 else "A film night",
+            "start_date": (start + timedelta(days=i)).isoformat(), "venue_name": "Gallery", "source": f"https://x/{i}",
+        }
+        for i in range(count)
+    ]
+    mongo.events.insert_many(docs)
+
+    user = User(username="host", email="host@example.com", password_hash="x")
+    venue = Venue(name="Hall", address="1 Road", postal_code="123456")
+    db.session.add_all([user, venue])
+    db.session.flush()
+    events = []
+    for i in range(count):
+        item = Event(
+            user_id=user.id, venue_id=venue.id, title=f"Community {i}", description="d",
+            start_datetime=start + timedelta(days=i, hours=1), end_datetime=start + timedelta(days=i, hours=3),
+        )
+        db.session.add(item)
+        db.session.flush()
+        db.session.add(EventCache(
+            event_identifier=f"community_{item.id}", source="community", original_id=str(item.id), title=item.title,
+        ))
+        events.append(item)
+    db.session.commit()
+    return docs, events
+
+
+def feed(client, app, read_model_on, query):
+    app.config["FEED_READ_MODEL"] = read_model_on
+    response = client.get(f"/api/all-events?{query}")
+    assert response.status_code == 200
+    return response.get_json()
+
+
+@pytest.mark.parametrize("query", [
+    "time=all&limit=50",
+    "time=all&sort=title_desc&limit=50",
+    "time=upcoming&category=Music&limit=50",
+    "time=all&source=community&q=community&limit=50",
+])
+def test_rebuilt_read_model_serves_the_same_feed(client, app, mongo, monkeypatch, query):
+    monkeypatch.setitem(app.config, "FEED_READ_MODEL", False)
+    seed_events(mongo)
+    assert rebuild_read_model(mongo) == 8
+
+    direct = feed(client, app, False, query)
+    materialized = feed(client, app, True, query)
+
+    assert materialized["events"] == direct["events"]
+    assert materialized["total"] == direct["total"]
+    assert direct["events"]
+
+
+def test_rebuild_keeps_writes_made_while_it_copies(app, mongo, monkeypatch):
+    docs, events = seed_events(mongo)
+    rebuild_read_model(mongo)
+    changed, deleted = docs[0], events[0]
+    deleted_id = f"community_{deleted.id}"
+
+    shape_official = read_model.official_feed_document
+    shape_community = read_model.community_feed_document
+
+    def official_then_change(doc):
+        # The copy has read the old version; the app then updates the event
+        row = shape_official(doc)
+        if doc["_id"] == changed["_id"]:
+            mongo.events.update_one({"_id": doc["_id"]}, {"$set": {"title": "Renamed"}})
+            sync_official_events([mongo.events.find_one({"_id": doc["_id"]})], mongo)
+        return row
+
+    def community_then_delete(event):
+        row = shape_community(event)
+        if event.id == deleted.id:
+            Event.query.filter_by(id=deleted.id).delete()
+            db.session.commit()
+            remove_feed_events([deleted_id])
+        return row
+
+    monkeypatch.setattr(read_model, "official_feed_document", official_then_change)
+    monkeypatch.setattr(read_model, "community_feed_document", community_then_delete)
+    rebuild_read_model(mongo)
+
+    live = mongo[FEED_COLLECTION]
+    assert live.find_one({"_id": f"official_{changed['_id']}"})["title"] == "Renamed"
+    assert live.find_one({"_id": deleted_id}) is None
+    assert live.count_documents({}) == 7
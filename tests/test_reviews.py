@@ -0,0 +1,71 @@
+# tests/test_reviews.py
+import base64
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from project.models import db, User, UserProfile, EventCache, Review
+from project.services.reviews import decode_review_cursor, encode_review_cursor
+
+CREATED_AT = datetime(2026, 1, 1, 12, 0)
+
+
+def forged_cursor(value):
+    raw = json.dumps(value).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize("review_id", [True, False, 5.0, "5", None])
+def test_decode_review_cursor_rejects_non_int_id(review_id):
+    with pytest.raises(ValueError):
+        decode_review_cursor(forged_cursor([CREATED_AT.isoformat(), review_id]))
+
+
+def test_decode_review_cursor_round_trip():
+    token = encode_review_cursor(SimpleNamespace(created_at=CREATED_AT, id=5))
+    assert decode_review_cursor(token) == (CREATED_AT, 5)
+
+
+def seed_reviews(count):
+    """count reviews of community_1 by different users; pairs share a created_at (tie on the cursor)."""
+    db.session.add(EventCache(event_identifier="community_1", source="community", original_id="1", title="t"))
+    for i in range(count):
+        user = User(username=f"user{i}", email=f"user{i}@example.com", password_hash="x")
+        db.session.add(user)
+        db.session.flush()
+        if i % 2:
+            db.session.add(UserProfile(user_id=user.id, avatar_url=f"/avatars/{i}.png"))
+        db.session.add(Review(
+            user_id=user.id, event_identifier="community_1", score=i % 5 + 1,
+            created_at=datetime(2026, 1, 1, 12, i // 2),
+        ))
+    db.session.commit()
+
+
+def test_review_pages_cover_the_full_list_in_order(client):
+    seed_reviews(7)
+    full = client.get("/api/reviews?event_id=community_1").get_json()
+
+    paged, cursor, first = [], None, None
+    while True:
+        query = "/api/reviews?event_id=community_1&limit=2" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(query).get_json()
+        first = first or page
+        paged += page["items"]
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+
+    assert [r["id"] for r in paged] == [r["id"] for r in full]
+    assert len(paged) == 7
+    assert paged == full
+    by_user = {r["username"]: r["user_avatar"] for r in full}
+    assert by_user["user1"] == "/avatars/1.png" and by_user["user0"] is None
+    assert first["mine"] is None and "histogram" in first
+
+
+def test_review_page_rejects_a_forged_cursor(client):
+    response = client.get("/api/reviews?event_id=community_1&limit=2&cursor=" + forged_cursor(["2026-01-01", True]))
+    assert response.status_code == 400
@@ -0,0 +1,81 @@
+# tests/test_scrape_fetch.py
+import time
+
+import pytest
+
+import fetch_data
+from benchmarks.fixtures import FixtureServer
+from project.services.http_fetch import PageFetcher, DeadlineExceeded
+from project.services.scrape_parse import ParsePool
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with FixtureServer(count=30, latency_ms=5) as fixture_server:
+        monkeypatch.setattr(fetch_data, "ARTSREPUBLIC_BASE_URL", fixture_server.url)
+        monkeypatch.setattr(fetch_data, "EVENTFINDA_BASE_URL", fixture_server.url)
+        yield fixture_server
+
+
+def scrape(fetcher):
+    parser = ParsePool(workers=1)
+    try:
+        return fetch_data.scrape_artsrepublic_sg(fetcher, parser) + fetch_data.scrape_eventfinda_sg(fetcher, parser)
+    finally:
+        fetcher.close()
+
+
+def test_serial_and_concurrent_scrapes_match(server):
+    serial = scrape(PageFetcher(workers=1, per_host=1, cache_dir=""))
+    concurrent = scrape(PageFetcher(workers=8, per_host=4, cache_dir=""))
+
+    assert len(serial) == 60
+    assert concurrent == serial
+
+
+def test_failed_pages_are_retried(server):
+    server.fail_every = 4
+    fetcher = PageFetcher(workers=8, per_host=4, retries=3, backoff_s=0.01, cache_dir="")
+    events = scrape(fetcher)
+
+    assert len(events) == 60
+    assert fetcher.counters["retries"] > 0
+
+
+def test_deadline_stops_the_fetch(server):
+    server.latency_s = 0.2
+    fetcher = PageFetcher(workers=2, per_host=2, deadline_s=0.5, cache_dir="")
+    urls = [f"{server.url}/events/ar-{i}" for i in range(20)]
+
+    start = time.monotonic()
+    results = fetcher.fetch_all(urls)
+    elapsed = time.monotonic() - start
+    fetcher.close()
+
+    assert set(results) == set(urls)
+    assert any(isinstance(r, DeadlineExceeded) for r in results.values())
+    assert sum(1 for r in results.values() if not isinstance(r, Exception)) < len(urls)
+    assert elapsed < 2
+
+
+def test_detail_helpers_close_the_fetcher_they_create(server, monkeypatch):
+    closed = []
+    monkeypatch.setattr(PageFetcher, "close", lambda self: closed.append(self))
+    monkeypatch.setenv("SCRAPE_CACHE_DIR", "")
+
+    event = fetch_data.scrape_artsrepublic_detail_page("events/ar-0")
+    assert event["title"] != "Title not found"
+    assert len(closed) == 1
+
+    shared = PageFetcher(cache_dir="")
+    fetch_data.scrape_artsrepublic_detail_page("events/ar-1", shared)
+    assert closed == [closed[0]]  # the caller's fetcher stays open
+
+
+def test_counters_add_up_across_fetch_threads(server):
+    urls = [f"{server.url}/events/ar-{i}" for i in range(30)]
+    with PageFetcher(workers=16, per_host=16, cache_dir="") as fetcher:
+        results = fetcher.fetch_all(urls)
+
+    assert not any(isinstance(r, Exception) for r in results.values())
+    assert fetcher.counters["requests"] == len(urls)
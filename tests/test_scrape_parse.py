@@ -0,0 +1,62 @@
+# tests/test_scrape_parse.py
+"""The strainer-based parsers must extract exactly what the original full-page parsers did."""
+import re
+
+import pytest
+
+from benchmarks.fixtures import artsrepublic_list, detail_pages, eventfinda_list
+from benchmarks.scrape_parse import (
+    is_artsrepublic, legacy_parse_artsrepublic, legacy_parse_eventfinda,
+)
+from project.services import scrape_parse
+
+BACKENDS = ["html.parser"] + (["lxml"] if scrape_parse.HTML_PARSER == "lxml" else [])
+
+# Each fixture page is also parsed with one of these elements cut out, to cover the fallbacks
+REMOVED_ELEMENTS = [
+    r'<h1[^>]*>.*?</h1>',
+    r'<meta itemprop="endDate"[^>]*>',
+    r'<div itemprop="location">.*?</div>',
+    r'<div class="synopsis">.*?</div>',
+    r'<div class="data">.*?</div>',
+    r'<img[^>]*>',
+    r'<p class="venue">.*?</p>',
+    r'<span class="adr">.*?</span>',
+    r'<span class="dtstart">.*?</span></span>',
+    r'<span class="dtend">.*?</span></span>',
+    r'<div class="module description">.*?</div>',
+    r'<li class="list-item-icon">.*?</li>',
+]
+
+
+def fixture_variants():
+    for path, html in detail_pages(3):
+        yield path, html
+        for pattern in REMOVED_ELEMENTS:
+            yield path, re.sub(pattern, "", html, count=1, flags=re.S)
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(scrape_parse, "HTML_PARSER", request.param)
+    return request.param
+
+
+def test_detail_parsers_match_legacy(backend):
+    for path, html in fixture_variants():
+        if is_artsrepublic(path):
+            expected = legacy_parse_artsrepublic(html, path)
+            parsed = scrape_parse.parse_artsrepublic_detail_page(html, path)
+        else:
+            expected = legacy_parse_eventfinda(html, path)
+            parsed = scrape_parse.parse_eventfinda_detail_page(html, path)
+        assert parsed == expected, path
+
+
+def test_list_parsers_find_every_event(backend):
+    assert scrape_parse.parse_artsrepublic_list(artsrepublic_list(3)) == [
+        "/events/ar-0", "/events/ar-1", "/events/ar-2",
+    ]
+    assert scrape_parse.parse_eventfinda_list(eventfinda_list(2)) == [
+        "/2026/event-0/singapore", "/2026/event-1/singapore",
+    ]
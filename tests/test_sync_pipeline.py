@@ -0,0 +1,72 @@
+# tests/test_sync_pipeline.py
+import json
+
+import pytest
+
+import fetch_data
+from benchmarks.fixtures import FixtureServer
+from project.db import get_mongo_client
+from project.models import EventCache
+from project.services.http_fetch import PageFetcher
+from project.services.scrape_parse import ParsePool
+from project.services.sync_checkpoint import SyncCheckpoint
+
+SITE = "artsrepublic.sg"
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with FixtureServer(count=10, latency_ms=1) as fixture_server:
+        monkeypatch.setattr(fetch_data, "ARTSREPUBLIC_BASE_URL", fixture_server.url)
+        monkeypatch.setattr(fetch_data, "EVENTFINDA_BASE_URL", fixture_server.url)
+        monkeypatch.setattr(fetch_data, "SYNC_BATCH_SIZE", 4)
+        yield fixture_server
+
+
+def run_sync(checkpoint, counters):
+    with PageFetcher(cache_dir="") as fetcher, ParsePool(workers=1) as parser:
+        fetch_data.sync_site(get_mongo_client(), SITE, fetcher, parser, checkpoint, counters)
+
+
+def test_interrupted_sync_resumes_after_its_last_batch(app, mongo, server, tmp_path, monkeypatch):
+    path = str(tmp_path / "checkpoint.json")
+    load = fetch_data.transform_and_load_events
+    loaded_batches = []
+
+    def load_then_die(client, events, label):
+        if len(loaded_batches) == 2:
+            raise RuntimeError("killed")
+        loaded_batches.append(len(events))
+        return load(client, events, label)
+
+    monkeypatch.setattr(fetch_data, "transform_and_load_events", load_then_die)
+    with pytest.raises(RuntimeError):
+        run_sync(SyncCheckpoint(path), fetch_data.new_stage_counters())
+
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)["sites"][SITE]
+    assert (saved["batches"], len(saved["completed"]), saved["done"]) == (2, 8, False)
+    assert mongo.events.count_documents({}) == 8
+
+    # The next run picks the checkpoint up and only loads what is left
+    monkeypatch.setattr(fetch_data, "transform_and_load_events", load)
+    checkpoint = SyncCheckpoint(path)
+    counters = fetch_data.new_stage_counters()
+    assert checkpoint.resumed
+    run_sync(checkpoint, counters)
+
+    assert counters["resumed"] == 8
+    assert counters["loaded"] == 2
+    assert checkpoint.site_done(SITE)
+    assert mongo.events.count_documents({}) == 10
+    assert EventCache.query.filter_by(source="official").count() == 10
+
+
+def test_restart_ignores_the_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    SyncCheckpoint(path).complete_batch(SITE, ["a", "b"])
+
+    assert SyncCheckpoint(path).completed(SITE) == {"a", "b"}
+    restarted = SyncCheckpoint(path, resume=False)
+    assert not restarted.resumed
+    assert restarted.completed(SITE) == set()